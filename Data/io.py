@@ -4,7 +4,7 @@ Handles reading and writing weather data
 """
 import json
 import csv
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 from datetime import datetime
 
 
@@ -45,3 +45,38 @@ def export_to_csv(data: List[Dict[str, Any]], filepath: str) -> bool:
     except Exception as e:
         print(f"Error exporting to CSV: {e}")
         return False
+
+
+def export_to_columnar(data: List[Dict[str, Any]], filepath: str,
+                       compression: Optional[str] = None) -> bool:
+    """Export weather data to Parquet, or Arrow IPC for .feather/.arrow paths (needs pandas + pyarrow)"""
+    if not data:
+        return False
+    
+    try:
+        import pandas as pd
+        frame = pd.DataFrame(data)
+        if filepath.lower().endswith((".feather", ".arrow", ".ipc")):
+            frame.to_feather(filepath, compression=compression or "lz4")
+        else:
+            frame.to_parquet(filepath, index=False, compression=compression or "zstd")
+        return True
+    except Exception as e:
+        print(f"Error exporting to columnar format: {e}")
+        return False
+
+
+def import_from_columnar(filepath: str, columns: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+    """Load weather data from a Parquet/Arrow file, reading only the given columns"""
+    try:
+        import pandas as pd
+        if filepath.lower().endswith((".feather", ".arrow", ".ipc")):
+            frame = pd.read_feather(filepath, columns=columns)
+        else:
+            frame = pd.read_parquet(filepath, columns=columns)
+        return frame.to_dict(orient="records")
+    except FileNotFoundError:
+        return []
+    except Exception as e:
+        print(f"Error importing columnar data: {e}")
+        return []
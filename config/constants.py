@@ -19,3 +19,48 @@ JOURNAL_FILENAME: str = "journal.csv"
 # API settings
 API_BASE_URL: str = "https://api.openweathermap.org/data/2.5"
 API_TIMEOUT: int = 10
+
+# HTTP connection pool settings (shared by all OpenWeatherMap clients)
+HTTP_POOL_CONNECTIONS: int = 4
+HTTP_POOL_MAXSIZE: int = 10
+HTTP_MAX_RETRIES: int = 3
+HTTP_BACKOFF_FACTOR: float = 0.5
+HTTP_RETRY_STATUSES: tuple = (429, 500, 502, 503, 504)
+
+# Response cache settings
+CACHE_MAX_ENTRIES: int = 128
+CACHE_TTL_MINUTES: dict = {"weather": 10, "forecast": 30}
+
+# Persistent response cache (survives restarts; stale entries allow instant first paint)
+DISK_CACHE_ENABLED: bool = True
+DISK_CACHE_FILENAME: str = "weather_cache.sqlite3"
+DISK_CACHE_MAX_AGE_HOURS: int = 72
+
+# Background fetch settings
+FETCH_MAX_WORKERS: int = 4
+FETCH_POLL_MS: int = 50
+COMPARISON_MAX_WORKERS: int = 4
+
+# Weather search history storage ("sqlite" or "csv")
+HISTORY_BACKEND: str = "sqlite"
+HISTORY_CSV_FILENAME: str = "weather_history.csv"
+HISTORY_DB_FILENAME: str = "weather_history.sqlite3"
+HISTORY_IMPORT_BATCH_SIZE: int = 1000
+HISTORY_PAGE_SIZE: int = 50
+
+# Settings persistence: changes are batched and written at most once per delay
+SETTINGS_FLUSH_DELAY_SECONDS: float = 1.0
+
+# Shared OpenWeatherMap request budget (the free tier allows 60 calls/minute).
+# Background refreshes leave RATE_LIMIT_FOREGROUND_RESERVE tokens for user searches.
+# Foreground requests queue in order; RATE_LIMIT_WAIT_SECONDS caps one request's wait in the queue.
+RATE_LIMIT_PER_MINUTE: int = 50
+RATE_LIMIT_BURST: int = 10
+RATE_LIMIT_FOREGROUND_RESERVE: int = 3
+RATE_LIMIT_WAIT_SECONDS: float = 10.0
+
+# Background auto-refresh of the watched cities (last city + pinned cities)
+AUTO_REFRESH_ENABLED: bool = True
+AUTO_REFRESH_INTERVAL_MINUTES: float = 10.0
+AUTO_REFRESH_JITTER_SECONDS: float = 30.0
+AUTO_REFRESH_INITIAL_DELAY_SECONDS: float = 15.0
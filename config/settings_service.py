@@ -0,0 +1,156 @@
+"""
+Process-wide settings service shared by every front-end.
+
+main.py, gui/dashboard.py and src/config/settings_manager.py used to read and
+rewrite their own settings files. They are now thin facades over one
+SettingsService: one in-memory snapshot, typed accessors, change
+subscriptions, and a single batched JsonSettingsStore writing settings.json
+in the project root.
+"""
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+from config.constants import SETTINGS_FLUSH_DELAY_SECONDS
+from config.settings_store import JsonSettingsStore
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SETTINGS_PATH = os.path.join(PROJECT_ROOT, "settings.json")
+
+# callback(key, new_value)
+SettingsCallback = Callable[[str, Any], None]
+
+
+class SettingsService:
+    """In-memory settings snapshot with typed access, subscriptions and batched persistence."""
+
+    def __init__(self, path: str = SETTINGS_PATH, debounce_seconds: float = SETTINGS_FLUSH_DELAY_SECONDS):
+        """
+        Args:
+            path: JSON file the settings are persisted to
+            debounce_seconds: Delay used to batch writes
+        """
+        self._store = JsonSettingsStore(path, debounce_seconds=debounce_seconds)
+        self._lock = threading.Lock()
+        self._subscribers: Dict[Optional[str], List[SettingsCallback]] = {}
+
+    @property
+    def path(self) -> str:
+        return self._store.path
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return a copy of every setting"""
+        return self._store.data()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._store.get(key, default)
+
+    def get_str(self, key: str, default: str = "") -> str:
+        value = self._store.get(key)
+        return value if isinstance(value, str) else default
+
+    def get_bool(self, key: str, default: bool = False) -> bool:
+        value = self._store.get(key)
+        return value if isinstance(value, bool) else default
+
+    def get_float(self, key: str, default: float = 0.0) -> float:
+        value = self._store.get(key)
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            return default
+        return float(value)
+
+    def get_list(self, key: str, default: Optional[List] = None) -> List:
+        value = self._store.get(key)
+        return list(value) if isinstance(value, list) else list(default or [])
+
+    def set(self, key: str, value: Any) -> None:
+        """Change one setting, notify subscribers if it changed, and schedule a write"""
+        self.update({key: value})
+
+    def update(self, values: Dict[str, Any]) -> None:
+        """Change several settings as one batch"""
+        for key in self._store.update(values):
+            self._notify(key, values[key])
+
+    def subscribe(self, callback: SettingsCallback, key: Optional[str] = None) -> Callable[[], None]:
+        """
+        Call `callback(key, value)` whenever a setting changes.
+
+        Callbacks run on the thread that made the change.
+
+        Args:
+            callback: Function to call
+            key: Only report changes to this key; None reports every change
+
+        Returns:
+            Callable: Removes the subscription when called
+        """
+        with self._lock:
+            self._subscribers.setdefault(key, []).append(callback)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                callbacks = self._subscribers.get(key, [])
+                if callback in callbacks:
+                    callbacks.remove(callback)
+
+        return unsubscribe
+
+    def _notify(self, key: str, value: Any) -> None:
+        with self._lock:
+            callbacks = self._subscribers.get(key, []) + self._subscribers.get(None, [])
+        for callback in callbacks:
+            try:
+                callback(key, value)
+            except Exception as e:
+                print(f"Error in settings subscriber for '{key}': {e}")
+
+    def import_legacy(self, path: str, key_map: Optional[Dict[str, str]] = None) -> int:
+        """
+        Copy settings from an old per-front-end settings file, without overwriting.
+
+        Args:
+            path: Legacy JSON settings file
+            key_map: Renames applied to legacy keys (legacy key -> service key)
+
+        Returns:
+            int: Number of settings imported
+        """
+        if os.path.abspath(path) == os.path.abspath(self.path) or not os.path.exists(path):
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Warning: Could not read legacy settings file {path}. Error: {e}")
+            return 0
+        if not isinstance(legacy, dict):
+            return 0
+
+        current = self.snapshot()
+        key_map = key_map or {}
+        missing = {}
+        for key, value in legacy.items():
+            target = key_map.get(key, key)
+            if target not in current:
+                missing[target] = value
+        self.update(missing)
+        return len(missing)
+
+    def flush(self) -> None:
+        """Write pending changes now"""
+        self._store.flush()
+
+
+_service: Optional[SettingsService] = None
+_service_lock = threading.Lock()
+
+
+def get_settings_service() -> SettingsService:
+    """Return the process-wide SettingsService, creating it on first use"""
+    global _service
+    with _service_lock:
+        if _service is None:
+            _service = SettingsService()
+        return _service
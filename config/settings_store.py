@@ -0,0 +1,146 @@
+"""
+Debounced, atomic JSON persistence for user settings.
+"""
+import atexit
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional
+
+
+class JsonSettingsStore:
+    """
+    In-memory settings dict backed by a JSON file.
+
+    Changes only mark the store dirty. The file is written once per debounce
+    window (or on flush/exit), so several changes in quick succession cost a
+    single write, and that write happens off the calling thread. Each write
+    goes to a temporary file that replaces settings.json in one rename, so a
+    crash mid-write leaves the previous file intact.
+    """
+
+    def __init__(self, path: str, debounce_seconds: float = 1.0,
+                 defaults: Optional[Dict[str, Any]] = None):
+        """
+        Args:
+            path: Path to the JSON settings file
+            debounce_seconds: Delay between the first unsaved change and the write
+            defaults: Values used when the file is missing or unreadable
+        """
+        self._path = path
+        self._debounce_seconds = debounce_seconds
+        self._lock = threading.RLock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self._data: Dict[str, Any] = self._read(defaults or {})
+        atexit.register(self.flush)
+
+    @property
+    def path(self) -> str:
+        return self._path
+
+    def _read(self, defaults: Dict[str, Any]) -> Dict[str, Any]:
+        """Load the settings file, falling back to defaults"""
+        if not os.path.exists(self._path):
+            return dict(defaults)
+        try:
+            with open(self._path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if not isinstance(data, dict):
+                raise ValueError("settings file does not contain a JSON object")
+            return data
+        except (json.JSONDecodeError, IOError, ValueError) as e:
+            print(f"Warning: Could not load settings file. Using defaults. Error: {e}")
+            return dict(defaults)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            return self._data.get(key, default)
+
+    def set(self, key: str, value: Any) -> bool:
+        """
+        Change one setting; the write is scheduled, not done immediately.
+
+        Returns:
+            bool: True if the value changed
+        """
+        return bool(self.update({key: value}))
+
+    def update(self, values: Dict[str, Any]) -> List[str]:
+        """
+        Change several settings at once; unchanged values do not mark the store dirty.
+
+        Returns:
+            List[str]: Keys whose values changed
+        """
+        with self._lock:
+            changed = []
+            for key, value in values.items():
+                if key not in self._data or self._data[key] != value:
+                    self._data[key] = value
+                    changed.append(key)
+            if changed:
+                self._mark_dirty()
+            return changed
+
+    def replace(self, values: Dict[str, Any]) -> None:
+        """Replace every setting (e.g. reset to defaults)"""
+        with self._lock:
+            self._data = dict(values)
+            self._mark_dirty()
+
+    def data(self) -> Dict[str, Any]:
+        """Return a copy of all settings"""
+        with self._lock:
+            return dict(self._data)
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._timer is None:
+            # Later changes in this window ride along with the pending write
+            self._timer = threading.Timer(self._debounce_seconds, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def flush(self) -> bool:
+        """
+        Write pending changes now.
+
+        Returns:
+            bool: False if the write failed (the store stays dirty and retries on the next flush)
+        """
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not self._dirty:
+                return True
+            try:
+                self._write_atomic(self._data)
+                self._dirty = False
+                return True
+            except (IOError, OSError, TypeError, ValueError) as e:
+                print(f"Warning: Could not save settings file. Error: {e}")
+                return False
+
+    def _write_atomic(self, data: Dict[str, Any]) -> None:
+        """Write to a temporary file in the same directory, then rename it over the target"""
+        directory = os.path.dirname(os.path.abspath(self._path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(prefix=".settings-", suffix=".tmp", dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self._path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def close(self) -> None:
+        """Flush pending changes and stop the exit hook"""
+        self.flush()
+        atexit.unregister(self.flush)
@@ -0,0 +1,283 @@
+"""
+Persistent matplotlib charts embedded in the Tk dashboard.
+
+Each chart builds its Figure and FigureCanvasTkAgg once and afterwards only
+updates its artists (bar heights, labels, axis limits) and redraws with
+draw_idle, instead of recreating the figure on every search or unit change.
+
+matplotlib is imported when the first chart is drawn, not when this module is
+imported, so it stays off the startup path.
+"""
+from typing import TYPE_CHECKING, Dict, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+
+def _padded_limits(values: Sequence[float], ratio: float) -> tuple:
+    """Y-axis limits with some headroom around the data"""
+    min_value = min(values)
+    max_value = max(values)
+    padding = max((max_value - min_value) * ratio, 3)
+    return min_value - padding, max_value + padding
+
+
+class TemperatureChart:
+    """Single-series 5-day temperature bar chart."""
+
+    def __init__(self, master):
+        """
+        Args:
+            master: Tk container the chart canvas is packed into
+        """
+        self.master = master
+        self.figure: Optional["Figure"] = None
+        self.canvas: Optional["FigureCanvasTkAgg"] = None
+        self.ax = None
+        self.bars = None
+        self.value_labels: List = []
+        self.visible = False
+
+    def _ensure_canvas(self) -> None:
+        """Create the figure, axes and canvas on first use"""
+        if self.figure is not None:
+            return
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(8, 5), dpi=80)
+        self.ax = self.figure.add_subplot(111)
+
+        # Static styling is applied once
+        self.ax.set_title("5-Day Temperature Trend", fontsize=16, fontweight='bold', pad=20)
+        self.ax.tick_params(axis='x', rotation=0, labelsize=12)
+        self.ax.tick_params(axis='y', labelsize=12)
+        self.ax.grid(True, alpha=0.3, axis='y')
+        self.figure.tight_layout(pad=2.0)
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.master)
+
+    def update(self, dates: List[str], temps: List[float], labels: List[str], unit_symbol: str) -> None:
+        """
+        Show new data, reusing the existing bars when the day count is unchanged.
+
+        Args:
+            dates: Date strings for the x axis
+            temps: Temperatures in the display unit
+            labels: Text shown above each bar
+            unit_symbol: Unit shown in the y-axis label
+        """
+        self._ensure_canvas()
+        positions = list(range(len(dates)))
+
+        if self.bars is not None and len(self.bars) == len(temps):
+            for bar, temp in zip(self.bars, temps):
+                bar.set_height(temp)
+        else:
+            if self.bars is not None:
+                self.bars.remove()
+            self.bars = self.ax.bar(positions, temps, color='lightblue', edgecolor='darkblue',
+                                    alpha=0.8, width=0.6)
+            for text in self.value_labels:
+                text.remove()
+            self.value_labels = [
+                self.ax.text(0, 0, "", ha='center', va='bottom', fontsize=11, fontweight='bold')
+                for _ in temps
+            ]
+
+        self.ax.set_xticks(positions)
+        self.ax.set_xticklabels(dates)
+        self.set_values(temps, labels, unit_symbol)
+        self.show()
+
+    def set_values(self, temps: List[float], labels: List[str], unit_symbol: str) -> None:
+        """Move bars and labels to new values (e.g. after a unit change) and redraw"""
+        if self.bars is None:
+            return
+
+        for bar, text, temp, label in zip(self.bars, self.value_labels, temps, labels):
+            bar.set_height(temp)
+            text.set_position((bar.get_x() + bar.get_width() / 2., temp + 0.5))
+            text.set_text(label)
+
+        self.ax.set_ylabel(f"Temperature ({unit_symbol})", fontsize=14)
+        if temps:
+            self.ax.set_ylim(*_padded_limits(temps, 0.2))
+        self.canvas.draw_idle()
+
+    def show(self) -> None:
+        if self.canvas is not None and not self.visible:
+            self.canvas.get_tk_widget().pack(fill='both', expand=True)
+            self.visible = True
+
+    def hide(self) -> None:
+        if self.canvas is not None and self.visible:
+            self.canvas.get_tk_widget().pack_forget()
+            self.visible = False
+
+
+class ComparisonChart:
+    """Grouped bar chart comparing daily temperatures across cities."""
+
+    # Keep the original two-city colours
+    TWO_CITY_STYLES = [dict(color='lightblue', edgecolor='darkblue'),
+                       dict(color='lightcoral', edgecolor='darkred')]
+
+    # Larger groups take colours by city position, so a city keeps its colour
+    # when the chart is rebuilt instead of following the axes colour cycle
+    SERIES_PALETTE = ['#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
+                      '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf']
+
+    # Value labels stay readable only for a handful of cities
+    MAX_LABELLED_SERIES = 4
+
+    def __init__(self, master):
+        """
+        Args:
+            master: Tk container the chart canvas is gridded into
+        """
+        self.master = master
+        self.figure: Optional["Figure"] = None
+        self.canvas: Optional["FigureCanvasTkAgg"] = None
+        self.ax = None
+        self.bar_groups: List = []
+        self.value_labels: List[List] = []
+        self.legend = None
+        self.shape = None
+        self.visible = False
+
+    def _ensure_canvas(self) -> None:
+        """Create the figure, axes and canvas on first use"""
+        if self.figure is not None:
+            return
+
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(10, 6), dpi=80)
+        self.ax = self.figure.add_subplot(111)
+        self.ax.set_xlabel("Date", fontsize=14)
+        self.ax.grid(True, alpha=0.3, axis='y')
+
+        self.canvas = FigureCanvasTkAgg(self.figure, master=self.master)
+
+    def _clear_artists(self) -> None:
+        """Remove bars, labels and legend from the axes, keeping the axes itself"""
+        for bars in self.bar_groups:
+            bars.remove()
+        for texts in self.value_labels:
+            for text in texts:
+                text.remove()
+        if self.legend is not None:
+            self.legend.remove()
+        self.bar_groups = []
+        self.value_labels = []
+        self.legend = None
+
+    def _build_artists(self, dates: List[str], names: List[str]) -> None:
+        """Create one bar container per city on the existing axes"""
+        self._clear_artists()
+
+        series_count = len(names)
+        positions = list(range(len(dates)))
+        width = 0.7 / series_count if series_count > 2 else 0.35
+        if series_count <= 2:
+            styles = self.TWO_CITY_STYLES
+        else:
+            styles = [dict(color=self.SERIES_PALETTE[index % len(self.SERIES_PALETTE)])
+                      for index in range(series_count)]
+
+        for index, name in enumerate(names):
+            offset = (index - (series_count - 1) / 2) * width
+            bars = self.ax.bar([x + offset for x in positions], [0] * len(dates), width,
+                               label=name, alpha=0.8, **styles[index])
+            self.bar_groups.append(bars)
+            if series_count <= self.MAX_LABELLED_SERIES:
+                self.value_labels.append([
+                    self.ax.text(0, 0, "", ha='center', va='bottom', fontsize=10, fontweight='bold')
+                    for _ in dates
+                ])
+
+        self.ax.set_xticks(positions)
+        self.legend = self.ax.legend(fontsize=12 if series_count <= 4 else 9,
+                                     ncol=max(1, series_count // 8 + 1))
+        self.shape = (len(dates), series_count)
+
+    @staticmethod
+    def title_for(names: List[str]) -> str:
+        """Chart title for the compared cities"""
+        if len(names) == 2:
+            return f"5-Day Temperature Comparison: {names[0]} vs {names[1]}"
+        if len(names) == 1:
+            return "5-Day Temperature Comparison: 1 City"
+        return f"5-Day Temperature Comparison: {len(names)} Cities"
+
+    def update(self, dates: List[str], temps_by_city: Dict[str, List[float]],
+               labels_by_city: Dict[str, List[str]], unit_symbol: str) -> None:
+        """
+        Show a new comparison, reusing the existing bars when the shape is unchanged.
+
+        Args:
+            dates: Date strings for the x axis
+            temps_by_city: Temperatures in the display unit per city, aligned with dates
+            labels_by_city: Text shown above each bar per city
+            unit_symbol: Unit shown in the y-axis label
+        """
+        self._ensure_canvas()
+        names = list(temps_by_city.keys())
+        series_count = len(names)
+
+        if self.shape != (len(dates), series_count):
+            self._build_artists(dates, names)
+            layout_changed = True
+        else:
+            # Same layout: only the legend entries may need new city names
+            for bars, text, name in zip(self.bar_groups, self.legend.get_texts(), names):
+                bars.set_label(name)
+                text.set_text(name)
+            layout_changed = False
+
+        self.ax.set_xticklabels(dates, rotation=45, ha='right')
+        self.ax.set_title(self.title_for(names), fontsize=16, fontweight='bold', pad=20)
+
+        if layout_changed:
+            # Tick labels and legend moved, so refit the layout once for this shape
+            self.figure.tight_layout()
+
+        self.set_values(temps_by_city, labels_by_city, unit_symbol)
+        self.show()
+
+    def set_values(self, temps_by_city: Dict[str, List[float]],
+                   labels_by_city: Dict[str, List[str]], unit_symbol: str) -> None:
+        """Move bars and labels to new values (e.g. after a unit change) and redraw"""
+        if not self.bar_groups:
+            return
+
+        all_temps = []
+        for bars, (index, (name, temps)) in zip(self.bar_groups, enumerate(temps_by_city.items())):
+            for bar, temp in zip(bars, temps):
+                bar.set_height(temp)
+            all_temps.extend(temps)
+
+            if index < len(self.value_labels):
+                for bar, text, temp, label in zip(bars, self.value_labels[index], temps,
+                                                  labels_by_city[name]):
+                    text.set_position((bar.get_x() + bar.get_width() / 2., temp + 0.5))
+                    text.set_text(label)
+
+        self.ax.set_ylabel(f"Temperature ({unit_symbol})", fontsize=14)
+        if all_temps:
+            self.ax.set_ylim(*_padded_limits(all_temps, 0.15))
+        self.canvas.draw_idle()
+
+    def show(self) -> None:
+        if self.canvas is not None and not self.visible:
+            self.canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
+            self.visible = True
+
+    def hide(self) -> None:
+        if self.canvas is not None and self.visible:
+            self.canvas.get_tk_widget().grid_remove()
+            self.visible = False
@@ -0,0 +1,328 @@
+"""
+Pluggable storage backends for the weather search history.
+
+CsvHistoryStore keeps the original append-only weather_history.csv; the
+SqliteHistoryStore keeps the same rows in an indexed SQLite table so
+"last N for a city" and date-bounded stats are answered without full scans.
+"""
+import csv
+import math
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+
+from config.constants import (
+    HISTORY_BACKEND,
+    HISTORY_CSV_FILENAME,
+    HISTORY_DB_FILENAME,
+    HISTORY_IMPORT_BATCH_SIZE,
+)
+from features.tracker import (
+    FIELDNAMES,
+    format_history_row,
+    calculate_stats_from_csv,
+    read_last_n_entries,
+    save_weather_to_csv,
+)
+
+TIMESTAMP_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _history_row(weather_data: Dict, timestamp: Optional[str] = None) -> Dict:
+    """Build a history row (same fields as the CSV) from API weather data."""
+    return {
+        'timestamp': timestamp or datetime.now().strftime(TIMESTAMP_FORMAT),
+        'city': weather_data['city'],
+        'country': weather_data['country'],
+        'temperature': weather_data['temperature'],
+        'feels_like': weather_data['feels_like'],
+        'description': weather_data['description'],
+        'humidity': weather_data['humidity'],
+        'pressure': weather_data['pressure']
+    }
+
+
+class HistoryStore(ABC):
+    """Interface shared by the history backends."""
+
+    def append(self, weather_data: Dict) -> Dict:
+        """Record one weather search and return the stored row."""
+        return self.append_many([weather_data])[0]
+
+    @abstractmethod
+    def append_many(self, weather_records: Iterable[Dict]) -> List[Dict]:
+        """Record several weather searches at once and return the stored rows."""
+
+    def page(self, offset: int, limit: int) -> List[Dict]:
+        """Return `limit` rows starting `offset` rows back from the newest."""
+        return self.last_n(offset + limit)[offset:]
+
+    def count(self) -> int:
+        """Return the number of stored searches."""
+        stats = self.stats()
+        return stats['total_searches'] if stats else 0
+
+    @abstractmethod
+    def last_n(self, n: int = 10, city: Optional[str] = None) -> List[Dict]:
+        """Return the last n rows (most recent first), optionally for one city."""
+
+    @abstractmethod
+    def stats(self, days: Optional[int] = None) -> Optional[Dict]:
+        """Return search statistics, optionally limited to the last `days` days."""
+
+    def recent_history(self, limit: int = 50, offset: int = 0) -> List[Dict]:
+        """Return rows formatted for the history tab, newest first."""
+        rows = (self.format_row(row) for row in self.page(offset, limit))
+        return [row for row in rows if row]
+
+    @staticmethod
+    def format_row(row: Dict) -> Optional[Dict]:
+        """Format one stored row for the history tab (None if incomplete)."""
+        return format_history_row({key: "" if value is None else str(value)
+                                    for key, value in row.items()})
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class CsvHistoryStore(HistoryStore):
+    """The original append-only CSV log."""
+
+    def __init__(self, filename: str = HISTORY_CSV_FILENAME):
+        self.filename = filename
+
+    def append_many(self, weather_records: Iterable[Dict]) -> List[Dict]:
+        return [save_weather_to_csv(weather_data, self.filename) for weather_data in weather_records]
+
+    def _scan(self):
+        if not os.path.exists(self.filename):
+            return
+        with open(self.filename, 'r', newline='', encoding='utf-8') as csvfile:
+            yield from csv.DictReader(csvfile)
+
+    def last_n(self, n: int = 10, city: Optional[str] = None) -> List[Dict]:
+        if city is None:
+            return read_last_n_entries(n, self.filename)
+        # CSV has no index, so filtering by city needs a full scan
+        matches = [row for row in self._scan() if row.get('city', '').lower() == city.lower()]
+        return matches[-n:][::-1]
+
+    def stats(self, days: Optional[int] = None) -> Optional[Dict]:
+        if days is None:
+            return calculate_stats_from_csv(self.filename)
+
+        cutoff = (datetime.now() - timedelta(days=days)).strftime(TIMESTAMP_FORMAT)
+        rows = []
+        for row in self._scan():
+            try:
+                if row['timestamp'] >= cutoff:
+                    rows.append((float(row['temperature']), float(row['humidity']),
+                                 float(row['pressure']), f"{row['city']}, {row['country']}"))
+            except (KeyError, TypeError, ValueError):
+                continue
+        if not rows:
+            return None
+
+        temperatures = [r[0] for r in rows]
+        mean = sum(temperatures) / len(temperatures)
+        return {
+            'total_searches': len(rows),
+            'avg_temp': mean,
+            'max_temp': max(temperatures),
+            'min_temp': min(temperatures),
+            'temp_stddev': math.sqrt(sum((t - mean) ** 2 for t in temperatures) / len(temperatures)),
+            'avg_humidity': sum(r[1] for r in rows) / len(rows),
+            'avg_pressure': sum(r[2] for r in rows) / len(rows),
+            'top_cities': Counter(r[3] for r in rows).most_common()
+        }
+
+
+class SqliteHistoryStore(HistoryStore):
+    """History kept in SQLite (WAL mode) with indexes on timestamp and city."""
+
+    def __init__(self, path: str = HISTORY_DB_FILENAME):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS history ("
+            " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+            " timestamp TEXT NOT NULL,"
+            " city TEXT NOT NULL,"
+            " country TEXT,"
+            " temperature REAL,"
+            " feels_like REAL,"
+            " description TEXT,"
+            " humidity REAL,"
+            " pressure REAL);"
+            "CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history (timestamp);"
+            "CREATE INDEX IF NOT EXISTS idx_history_city ON history (city COLLATE NOCASE, timestamp);"
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);"
+        )
+        self._conn.commit()
+
+    def _insert_rows(self, rows: List[Dict]) -> None:
+        """Insert rows in one transaction; caller holds the lock."""
+        self._conn.executemany(
+            "INSERT INTO history (timestamp, city, country, temperature, feels_like,"
+            " description, humidity, pressure) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [tuple(row.get(field) for field in FIELDNAMES) for row in rows]
+        )
+
+    def append_many(self, weather_records: Iterable[Dict]) -> List[Dict]:
+        rows = [_history_row(weather_data) for weather_data in weather_records]
+        if rows:
+            with self._lock:
+                self._insert_rows(rows)
+                self._conn.commit()
+        return rows
+
+    @staticmethod
+    def _as_csv_row(row: sqlite3.Row) -> Dict:
+        """Return a row shaped like csv.DictReader output (string values)."""
+        return {field: "" if row[field] is None else str(row[field]) for field in FIELDNAMES}
+
+    def page(self, offset: int, limit: int) -> List[Dict]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM history ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+                (limit, offset)
+            ).fetchall()
+        return [self._as_csv_row(row) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def last_n(self, n: int = 10, city: Optional[str] = None) -> List[Dict]:
+        query = "SELECT * FROM history"
+        params: list = []
+        if city is not None:
+            query += " WHERE city = ? COLLATE NOCASE"
+            params.append(city)
+        query += " ORDER BY timestamp DESC, id DESC LIMIT ?"
+        params.append(n)
+
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [self._as_csv_row(row) for row in rows]
+
+    def stats(self, days: Optional[int] = None) -> Optional[Dict]:
+        where, params = "", []
+        if days is not None:
+            where = " WHERE timestamp >= ?"
+            params.append((datetime.now() - timedelta(days=days)).strftime(TIMESTAMP_FORMAT))
+
+        with self._lock:
+            totals = self._conn.execute(
+                "SELECT COUNT(*) AS n, AVG(temperature) AS avg_temp, MAX(temperature) AS max_temp,"
+                " MIN(temperature) AS min_temp, AVG(temperature * temperature) AS avg_sq,"
+                " AVG(humidity) AS avg_humidity, AVG(pressure) AS avg_pressure"
+                " FROM history" + where, params
+            ).fetchone()
+            if not totals["n"]:
+                return None
+            top_cities = self._conn.execute(
+                "SELECT city || ', ' || COALESCE(country, '') AS place, COUNT(*) AS searches"
+                " FROM history" + where + " GROUP BY city, country ORDER BY searches DESC", params
+            ).fetchall()
+
+        variance = max(0.0, totals["avg_sq"] - totals["avg_temp"] ** 2)
+        return {
+            'total_searches': totals["n"],
+            'avg_temp': totals["avg_temp"],
+            'max_temp': totals["max_temp"],
+            'min_temp': totals["min_temp"],
+            'temp_stddev': math.sqrt(variance),
+            'avg_humidity': totals["avg_humidity"],
+            'avg_pressure': totals["avg_pressure"],
+            'top_cities': [(row["place"], row["searches"]) for row in top_cities]
+        }
+
+    def import_csv(self, csv_path: str, batch_size: int = HISTORY_IMPORT_BATCH_SIZE) -> int:
+        """
+        One-shot migration of an existing history CSV. Each file is imported
+        only once; later calls return 0.
+
+        Args:
+            csv_path: Path to weather_history.csv
+            batch_size: Rows inserted per executemany batch
+
+        Returns:
+            Number of rows imported
+        """
+        marker = f"imported:{os.path.abspath(csv_path)}"
+        if not os.path.exists(csv_path):
+            return 0
+
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM meta WHERE key = ?", (marker,)).fetchone():
+                return 0
+
+            imported = 0
+            batch: List[Dict] = []
+            try:
+                with open(csv_path, 'r', newline='', encoding='utf-8') as csvfile:
+                    for row in csv.DictReader(csvfile):
+                        if not row.get('timestamp') or not row.get('city'):
+                            continue
+                        batch.append(row)
+                        if len(batch) >= batch_size:
+                            self._insert_rows(batch)
+                            imported += len(batch)
+                            batch = []
+                if batch:
+                    self._insert_rows(batch)
+                    imported += len(batch)
+
+                self._conn.execute("INSERT INTO meta (key, value) VALUES (?, ?)",
+                                   (marker, datetime.now().strftime(TIMESTAMP_FORMAT)))
+                self._conn.commit()
+            except Exception:
+                # Drop the rows inserted so far; the import is retried on the next start
+                self._conn.rollback()
+                raise
+        return imported
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def open_history_store(backend: str = HISTORY_BACKEND,
+                       csv_path: str = HISTORY_CSV_FILENAME,
+                       db_path: str = HISTORY_DB_FILENAME) -> HistoryStore:
+    """
+    Open the configured history backend. The SQLite backend imports an
+    existing CSV log the first time it is opened; if the database or the
+    import fails, the CSV backend is used instead.
+
+    Args:
+        backend: "sqlite" or "csv"
+        csv_path: History CSV file
+        db_path: SQLite database file
+
+    Returns:
+        HistoryStore instance
+    """
+    if backend == "sqlite":
+        store = None
+        try:
+            store = SqliteHistoryStore(db_path)
+            imported = store.import_csv(csv_path)
+            if imported:
+                print(f"Imported {imported} history rows from {csv_path}")
+            return store
+        except (sqlite3.Error, OSError, ValueError, csv.Error) as e:
+            # ValueError covers UnicodeDecodeError from a non-UTF-8 legacy CSV
+            print(f"SQLite history unavailable, falling back to CSV: {e}")
+            if store is not None:
+                store.close()
+    return CsvHistoryStore(csv_path)
@@ -0,0 +1,117 @@
+"""
+Running aggregates for the weather history log.
+
+The aggregates are kept in a small JSON sidecar next to the CSV so the stats
+window does not have to re-read the whole history on every click.
+"""
+import json
+import math
+import os
+from collections import Counter
+from typing import Dict, Optional
+
+
+class RunningStats:
+    """
+    Count, sum, min, max and Welford variance of temperature plus humidity,
+    pressure and per-city search counts, updated one row at a time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.temp_sum = 0.0
+        self.temp_min: Optional[float] = None
+        self.temp_max: Optional[float] = None
+        self.temp_mean = 0.0
+        self.temp_m2 = 0.0
+        self.humidity_sum = 0.0
+        self.pressure_sum = 0.0
+        self.city_counts: Dict[str, int] = {}
+        # Size of the CSV (in bytes) these aggregates account for
+        self.source_size = 0
+
+    def update(self, row: Dict) -> bool:
+        """
+        Fold one history row into the aggregates.
+
+        Args:
+            row: Dict with 'temperature', 'humidity', 'pressure', 'city', 'country'
+
+        Returns:
+            False if the row could not be parsed (it is then ignored)
+        """
+        try:
+            temperature = float(row['temperature'])
+            humidity = float(row['humidity'])
+            pressure = float(row['pressure'])
+        except (KeyError, TypeError, ValueError):
+            return False
+
+        self.count += 1
+        self.temp_sum += temperature
+        self.temp_min = temperature if self.temp_min is None else min(self.temp_min, temperature)
+        self.temp_max = temperature if self.temp_max is None else max(self.temp_max, temperature)
+
+        # Welford's online variance
+        delta = temperature - self.temp_mean
+        self.temp_mean += delta / self.count
+        self.temp_m2 += delta * (temperature - self.temp_mean)
+
+        self.humidity_sum += humidity
+        self.pressure_sum += pressure
+
+        city = f"{row.get('city', '')}, {row.get('country', '')}"
+        self.city_counts[city] = self.city_counts.get(city, 0) + 1
+        return True
+
+    def summary(self) -> Optional[Dict]:
+        """Return the stats dict shown in the stats window, or None if empty."""
+        if not self.count:
+            return None
+
+        return {
+            'total_searches': self.count,
+            'avg_temp': self.temp_sum / self.count,
+            'max_temp': self.temp_max,
+            'min_temp': self.temp_min,
+            'temp_stddev': math.sqrt(self.temp_m2 / self.count),
+            'avg_humidity': self.humidity_sum / self.count,
+            'avg_pressure': self.pressure_sum / self.count,
+            'top_cities': Counter(self.city_counts).most_common()
+        }
+
+    def to_dict(self) -> Dict:
+        return dict(self.__dict__)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "RunningStats":
+        stats = cls()
+        for key in stats.__dict__:
+            if key in data:
+                setattr(stats, key, data[key])
+        return stats
+
+    @staticmethod
+    def sidecar_path(csv_path: str) -> str:
+        """Return the sidecar file used for a history CSV."""
+        return f"{csv_path}.stats.json"
+
+    @classmethod
+    def load(cls, csv_path: str) -> Optional["RunningStats"]:
+        """Load the sidecar for a CSV, or None if it is missing or unreadable."""
+        try:
+            with open(cls.sidecar_path(csv_path), 'r', encoding='utf-8') as f:
+                return cls.from_dict(json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+
+    def save(self, csv_path: str) -> None:
+        """Write the sidecar atomically (temp file + rename)."""
+        path = self.sidecar_path(csv_path)
+        tmp_path = f"{path}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"Error saving history stats: {e}")
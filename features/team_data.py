@@ -0,0 +1,212 @@
+"""
+Shared, indexed store for the team weather dataset (data/team_weather_data.csv).
+
+The CSV is parsed once into normalized columns with a per-city row index and a
+latest-row-per-city table. It is only re-parsed when the file's mtime changes,
+so the city list and comparisons are dictionary lookups.
+"""
+import csv
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from features.timestamps import TimestampParser
+
+TEAM_DATA_PATH = Path(__file__).parent.parent / "data" / "team_weather_data.csv"
+
+# Normalized column names held by the store. Rows whose timestamp could not be
+# parsed keep timestamp=None and are flagged with timestamp_valid=False.
+COLUMNS = ["city", "temperature", "humidity", "pressure", "weather_description",
+           "timestamp", "timestamp_valid"]
+
+
+def _first_value(r: Dict[str, str], columns: List[str], skip_zero: bool = True) -> str:
+    """Return the first non-empty (and, by default, non-zero) value among columns"""
+    for col in columns:
+        val = (r.get(col) or "").strip()
+        if val and not (skip_zero and val in ("0", "0.0")):
+            return val
+    return ""
+
+
+def _normalize_row(r: Dict[str, str]) -> Optional[Dict]:
+    """
+    Turn one raw team CSV row into a weather dict, coping with the different
+    column names used across team members' files.
+
+    Returns:
+        Normalized weather dict, or None if the row lacks usable data
+    """
+    # Skip rows with empty city names
+    city_name = (r.get("city") or "").strip()
+    if not city_name:
+        return None
+
+    # Try to get temperature, humidity and pressure from multiple possible columns
+    temp_str = _first_value(r, ["temperature", "temp", "temp_f"])
+    hum_str = _first_value(r, ["humidity", "humidity_pct"])
+    pres_str = _first_value(r, ["pressure"])
+
+    # If we don't have temperature and humidity (minimum required), skip
+    if not temp_str or not hum_str:
+        return None
+
+    try:
+        # Convert temperature
+        temp = float(temp_str)
+        # Convert Fahrenheit to Celsius if needed (assuming > 50 means Fahrenheit)
+        if temp > 50:
+            temp = (temp - 32) * 5/9
+
+        hum = int(float(hum_str))
+
+        # Use default pressure if not available
+        if pres_str:
+            pres = int(float(pres_str))
+        else:
+            pres = 1013  # Default atmospheric pressure
+
+    except (ValueError, TypeError):
+        return None   # skip any row where conversion fails
+
+    # Handle timestamp (with alternative timestamp columns); the raw text is
+    # parsed per column by the caller, which detects the format only once
+    timestamp_str = _first_value(r, ["timestamp", "datetime", "dt"], skip_zero=False)
+
+    # Get weather description from various possible columns
+    weather_desc = _first_value(r, ["weather_description", "description", "weather_main"],
+                                skip_zero=False) or "Unknown"
+
+    return {
+        "city": city_name,
+        "temperature": temp,
+        "humidity": hum,
+        "pressure": pres,
+        "weather_description": weather_desc,
+        "timestamp": timestamp_str
+    }
+
+
+class TeamDataStore:
+    """Columnar, city-indexed view of the team CSV that reloads on change."""
+
+    def __init__(self, path: Optional[Path] = None):
+        """
+        Args:
+            path: CSV file to load (defaults to data/team_weather_data.csv)
+        """
+        self.path = Path(path) if path else TEAM_DATA_PATH
+        self._lock = threading.Lock()
+        self._mtime: Optional[float] = None
+        self._columns: Dict[str, List] = {col: [] for col in COLUMNS}
+        self._city_index: Dict[str, List[int]] = {}
+        self._latest: Dict[str, int] = {}
+        self._display_names: Dict[str, str] = {}
+
+    def _ensure_loaded(self) -> None:
+        """Re-parse the CSV if it changed (or vanished) since the last load."""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError:
+            mtime = None
+
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            self._load(mtime)
+
+    def _load(self, mtime: Optional[float]) -> None:
+        """Parse the whole file in a single pass; caller holds the lock."""
+        columns: Dict[str, List] = {col: [] for col in COLUMNS}
+        city_index: Dict[str, List[int]] = {}
+        latest: Dict[str, int] = {}
+        display_names: Dict[str, str] = {}
+
+        if mtime is not None:
+            try:
+                with self.path.open(newline="", encoding="utf-8") as f:
+                    for r in csv.DictReader(f):
+                        row = _normalize_row(r)
+                        if row is None:
+                            continue
+
+                        position = len(columns["city"])
+                        for col in COLUMNS[:-1]:
+                            columns[col].append(row[col])
+
+                        key = row["city"].lower()
+                        city_index.setdefault(key, []).append(position)
+                        display_names.setdefault(key, row["city"])
+            except Exception as e:
+                # Keep the previous data and mtime so the next call tries again
+                # instead of serving a partial read until the file changes
+                print(f"Error loading team data: {e}")
+                return
+
+            # Parse the whole timestamp column at once (format detected once)
+            columns["timestamp"] = TimestampParser().parse_many(columns["timestamp"])
+            columns["timestamp_valid"] = [stamp is not None for stamp in columns["timestamp"]]
+
+            # Latest row per city: rows with valid timestamps outrank flagged ones,
+            # and later rows win ties, matching a stable sort by timestamp
+            for key, positions in city_index.items():
+                best = positions[0]
+                for position in positions[1:]:
+                    if self._recency(columns, position) >= self._recency(columns, best):
+                        best = position
+                latest[key] = best
+
+        self._columns = columns
+        self._city_index = city_index
+        self._latest = latest
+        self._display_names = display_names
+        self._mtime = mtime
+
+    @staticmethod
+    def _recency(columns: Dict[str, List], position: int):
+        stamp = columns["timestamp"][position]
+        return (stamp is not None, stamp or datetime.min)
+
+    def _row(self, position: int) -> Dict:
+        """Build one row dict; caller holds the lock so index and columns match."""
+        return {col: self._columns[col][position] for col in COLUMNS}
+
+    def cities(self) -> List[str]:
+        """Return the sorted names of cities that have usable temperature data."""
+        self._ensure_loaded()
+        with self._lock:
+            return sorted(self._display_names.values())
+
+    def latest(self, city: str) -> Dict:
+        """Return the most recent row for a city, or {} if there is none."""
+        self._ensure_loaded()
+        with self._lock:
+            position = self._latest.get(city.lower().strip())
+            return self._row(position) if position is not None else {}
+
+    def rows_for(self, city: str) -> List[Dict]:
+        """Return every row for a city in file order (check timestamp_valid before sorting by time)."""
+        self._ensure_loaded()
+        with self._lock:
+            return [self._row(position) for position in self._city_index.get(city.lower().strip(), [])]
+
+    def column(self, name: str) -> List:
+        """Return one normalized column for all rows."""
+        self._ensure_loaded()
+        with self._lock:
+            return list(self._columns[name])
+
+
+_store: Optional[TeamDataStore] = None
+_store_lock = threading.Lock()
+
+
+def get_team_store() -> TeamDataStore:
+    """Return the process-wide team data store."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = TeamDataStore()
+    return _store
@@ -0,0 +1,129 @@
+"""
+Fast timestamp parsing for CSV columns with mixed or unknown formats.
+"""
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+
+# Formats seen in team CSVs, tried in order when the ISO fast path fails
+TIMESTAMP_FORMATS = [
+    "%Y-%m-%dT%H:%M:%S.%f",  # ISO format with microseconds
+    "%Y-%m-%dT%H:%M:%S",     # ISO format
+    "%Y-%m-%d %H:%M:%S",     # Space separated
+    "%Y-%m-%d %H:%M",        # Without seconds
+    "%Y-%m-%d"               # Date only
+]
+
+# Columns at least this long are handed to pandas when it is installed
+BULK_PARSE_THRESHOLD = 5000
+
+
+def _naive(value: datetime) -> datetime:
+    """
+    Drop timezone info so values stay comparable.
+
+    Aware values are converted to UTC first; naive values are kept as they
+    are. The pandas bulk path (utc=True) normalizes the same way, so a file
+    sorts identically whichever path parses it.
+    """
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+class TimestampParser:
+    """
+    Parses the timestamps of one column.
+
+    datetime.fromisoformat is tried first since it handles every ISO variant
+    in C. Otherwise the format that last worked is tried before scanning
+    the remaining formats, so a column costs one strptime per value once
+    its format is known.
+    """
+
+    def __init__(self, formats: Optional[List[str]] = None):
+        """
+        Args:
+            formats: strptime formats to try when the ISO fast path fails
+        """
+        self.formats = list(formats or TIMESTAMP_FORMATS)
+        self.detected_format: Optional[str] = None
+
+    def parse(self, value: str) -> Optional[datetime]:
+        """
+        Parse one timestamp string.
+
+        Args:
+            value: Raw timestamp text
+
+        Returns:
+            Parsed (naive) datetime, or None if the value is empty or unparseable
+        """
+        value = (value or "").strip()
+        if not value:
+            return None
+
+        try:
+            return _naive(datetime.fromisoformat(value))
+        except ValueError:
+            pass
+
+        if self.detected_format:
+            try:
+                return datetime.strptime(value, self.detected_format)
+            except ValueError:
+                pass
+
+        for fmt in self.formats:
+            if fmt == self.detected_format:
+                continue
+            try:
+                parsed = datetime.strptime(value, fmt)
+            except ValueError:
+                continue
+            self.detected_format = fmt
+            return parsed
+
+        return None
+
+    def parse_many(self, values: Iterable[str]) -> List[Optional[datetime]]:
+        """
+        Parse a whole column. Large columns go through pandas' vectorized
+        parser when it is available; None marks values that could not be parsed.
+
+        Args:
+            values: Raw timestamp strings
+
+        Returns:
+            Parsed datetimes (or None) in the same order as values
+        """
+        values = list(values)
+        if len(values) >= BULK_PARSE_THRESHOLD:
+            parsed = self._parse_with_pandas(values)
+            if parsed is not None:
+                return parsed
+        return [self.parse(value) for value in values]
+
+    def _parse_with_pandas(self, values: List[str]) -> Optional[List[Optional[datetime]]]:
+        """Vectorized path; returns None if pandas is missing or cannot handle the column."""
+        try:
+            import pandas as pd
+        except ImportError:
+            return None
+
+        try:
+            # utc=True matches _naive: aware values become UTC, naive values are kept as-is
+            series = pd.to_datetime(pd.Series(values, dtype="object").str.strip(),
+                                    format="ISO8601", errors="coerce", utc=True)
+            series = series.dt.tz_convert(None)
+        except (ValueError, TypeError, AttributeError):
+            # e.g. an object-dtype result that has no .dt accessor; use the per-value path
+            return None
+
+        parsed: List[Optional[datetime]] = []
+        for raw, stamp in zip(values, series):
+            if pd.isna(stamp):
+                # Not ISO: fall back to the per-value parser for this entry
+                parsed.append(self.parse(raw))
+            else:
+                parsed.append(stamp.to_pydatetime())
+        return parsed
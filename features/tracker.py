@@ -4,78 +4,131 @@ Weather tracking functionality including data persistence and helper functions.
 import csv
 import os
 from datetime import datetime
-from collections import Counter
-from typing import List, Dict
+from typing import List, Dict, Optional
 from pathlib import Path
 
+from features.running_stats import RunningStats
+
+FIELDNAMES = ['timestamp', 'city', 'country', 'temperature', 'feels_like',
+              'description', 'humidity', 'pressure']
+
 
 def save_weather_to_csv(weather_data, filename="weather_history.csv"):
-    """Save weather data to CSV file"""
+    """Save weather data to CSV file and fold it into the running stats"""
     file_exists = os.path.isfile(filename)
+    size_before = os.path.getsize(filename) if file_exists else 0
+    
+    row = {
+        'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        'city': weather_data['city'],
+        'country': weather_data['country'],
+        'temperature': weather_data['temperature'],
+        'feels_like': weather_data['feels_like'],
+        'description': weather_data['description'],
+        'humidity': weather_data['humidity'],
+        'pressure': weather_data['pressure']
+    }
     
     with open(filename, 'a', newline='', encoding='utf-8') as csvfile:
-        fieldnames = ['timestamp', 'city', 'country', 'temperature', 'feels_like', 
-                     'description', 'humidity', 'pressure']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+        writer = csv.DictWriter(csvfile, fieldnames=FIELDNAMES)
         
         if not file_exists:
             writer.writeheader()
         
-        writer.writerow({
-            'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'city': weather_data['city'],
-            'country': weather_data['country'],
-            'temperature': weather_data['temperature'],
-            'feels_like': weather_data['feels_like'],
-            'description': weather_data['description'],
-            'humidity': weather_data['humidity'],
-            'pressure': weather_data['pressure']
-        })
+        writer.writerow(row)
+    
+    # Only extend the aggregates if they cover exactly the file before this
+    # append; otherwise leave them stale and let calculate_stats_from_csv rebuild
+    stats = RunningStats() if not file_exists else RunningStats.load(filename)
+    if stats is not None and stats.source_size == size_before:
+        stats.update(row)
+        stats.source_size = os.path.getsize(filename)
+        stats.save(filename)
+    
+    return row
+
+
+def _tail_lines(filename, n, block_size=8192):
+    """
+    Return the header line and the last n data lines of a text file.
+
+    Blocks are read backwards from the end of the file until enough lines
+    have been seen, so the cost depends on n rather than the file size.
+    Assumes no field contains an embedded newline (true for the history log).
+    """
+    with open(filename, 'rb') as f:
+        header = f.readline().decode('utf-8').rstrip('\r\n')
+        data_start = f.tell()
+
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        buffer = b''
+
+        # One extra newline is needed to be sure the first kept line is complete
+        while position > data_start and buffer.count(b'\n') <= n:
+            read_size = min(block_size, position - data_start)
+            position -= read_size
+            f.seek(position)
+            buffer = f.read(read_size) + buffer
+
+    lines = [line.decode('utf-8').rstrip('\r') for line in buffer.split(b'\n')]
+    if position > data_start:
+        # The first piece may be a partial line cut by the block boundary
+        lines = lines[1:]
+    lines = [line for line in lines if line.strip()]
+    return header, (lines[-n:] if n > 0 else [])
+
+
+def tail_csv_rows(n, filename="weather_history.csv"):
+    """
+    Parse only the last n rows of a CSV file.
+
+    Returns:
+        List of row dicts, oldest first
+    """
+    if n <= 0 or not os.path.exists(filename):
+        return []
+
+    header, lines = _tail_lines(filename, n)
+    if not header:
+        return []
+    return list(csv.DictReader([header] + lines))
 
 
 def read_last_n_entries(n=10, filename="weather_history.csv"):
     """Read the last n entries from the CSV file"""
-    if not os.path.exists(filename):
-        return []
-    
-    entries = []
-    with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        entries = list(reader)
+    entries = tail_csv_rows(n, filename)
     
     # Return last n entries (most recent first)
-    return entries[-n:][::-1] if entries else []
+    return entries[::-1]
 
 
-def calculate_stats_from_csv(filename="weather_history.csv"):
-    """Calculate statistics from weather data in CSV file"""
-    if not os.path.exists(filename):
-        return None
-    
+def rebuild_running_stats(filename="weather_history.csv"):
+    """Recompute the running stats sidecar from the full CSV"""
+    stats = RunningStats()
     with open(filename, 'r', newline='', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        data = list(reader)
+        for row in csv.DictReader(csvfile):
+            stats.update(row)
+    stats.source_size = os.path.getsize(filename)
+    stats.save(filename)
+    return stats
+
+
+def calculate_stats_from_csv(filename="weather_history.csv"):
+    """
+    Calculate statistics from weather data in CSV file.
     
-    if not data:
+    Uses the running aggregates kept by save_weather_to_csv, so this is O(1);
+    the CSV is only re-read when the aggregates are missing or stale.
+    """
+    if not os.path.exists(filename):
         return None
     
-    temperatures = [float(row['temperature']) for row in data]
-    humidities = [float(row['humidity']) for row in data]
-    pressures = [float(row['pressure']) for row in data]
-    cities = [f"{row['city']}, {row['country']}" for row in data]
-    
-    # Calculate statistics
-    stats = {
-        'total_searches': len(data),
-        'avg_temp': sum(temperatures) / len(temperatures),
-        'max_temp': max(temperatures),
-        'min_temp': min(temperatures),
-        'avg_humidity': sum(humidities) / len(humidities),
-        'avg_pressure': sum(pressures) / len(pressures),
-        'top_cities': Counter(cities).most_common()
-    }
+    stats = RunningStats.load(filename)
+    if stats is None or stats.source_size != os.path.getsize(filename):
+        stats = rebuild_running_stats(filename)
     
-    return stats
+    return stats.summary()
 
 
 def get_personalized_greeting(name):
@@ -121,10 +174,53 @@ def get_weather_phrase(temperature, description):
         return "🌈 Enjoy your day!"
 
 
-def load_history() -> List[Dict]:
+def format_history_row(row: Dict) -> Optional[Dict]:
+    """Format one history CSV row for display; None if it lacks timestamp or city"""
+    # Extract data with fallback for missing fields
+    timestamp = (row.get("timestamp") or "").strip()
+    city = (row.get("city") or "").strip()
+    country = (row.get("country") or "").strip()
+    temperature = (row.get("temperature") or "").strip()
+    description = (row.get("description") or "").strip()
+    
+    # Only add entries with at least timestamp and city
+    if not (timestamp and city):
+        return None
+    
+    # Format city display
+    if city and country:
+        city_display = f"{city}, {country}"
+    else:
+        city_display = city or "Unknown"
+    
+    # Format temperature display
+    if temperature:
+        try:
+            temp_value = float(temperature)
+            temp_display = f"{temp_value:.1f}°C"
+        except ValueError:
+            temp_display = temperature
+    else:
+        temp_display = "N/A"
+    
+    # Format condition display
+    condition_display = description.title() if description else "N/A"
+    
+    return {
+        "timestamp": timestamp,
+        "city": city_display,
+        "temp": temp_display,
+        "condition": condition_display
+    }
+
+
+def load_history(limit: Optional[int] = None) -> List[Dict]:
     """
     Load weather history from CSV file.
     
+    Args:
+        limit: Only read the last `limit` rows (read from the end of the file)
+    
     Returns:
         List of dictionaries containing history data with keys:
         'timestamp', 'city', 'temp', 'condition'
@@ -138,44 +234,21 @@ def load_history() -> List[Dict]:
         if not os.path.exists(csv_path):
             return history_data
         
+        if limit is not None:
+            rows = tail_csv_rows(limit, csv_path)
+            for row in rows:
+                entry = format_history_row(row)
+                if entry:
+                    history_data.append(entry)
+            return history_data
+        
         with open(csv_path, 'r', newline='', encoding='utf-8') as f:
             reader = csv.DictReader(f)
             
             for row in reader:
-                # Extract data with fallback for missing fields
-                timestamp = row.get("timestamp", "").strip()
-                city = row.get("city", "").strip()
-                country = row.get("country", "").strip()
-                temperature = row.get("temperature", "").strip()
-                description = row.get("description", "").strip()
-                
-                # Format city display
-                if city and country:
-                    city_display = f"{city}, {country}"
-                else:
-                    city_display = city or "Unknown"
-                
-                # Format temperature display
-                if temperature:
-                    try:
-                        temp_value = float(temperature)
-                        temp_display = f"{temp_value:.1f}°C"
-                    except ValueError:
-                        temp_display = temperature
-                else:
-                    temp_display = "N/A"
-                
-                # Format condition display
-                condition_display = description.title() if description else "N/A"
-                
-                # Only add entries with at least timestamp and city
-                if timestamp and city:
-                    history_data.append({
-                        "timestamp": timestamp,
-                        "city": city_display,
-                        "temp": temp_display,
-                        "condition": condition_display
-                    })
+                entry = format_history_row(row)
+                if entry:
+                    history_data.append(entry)
     
     except Exception as e:
         print(f"Error loading history from CSV: {e}")
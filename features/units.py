@@ -0,0 +1,78 @@
+"""
+Temperature unit conversion and formatting for the dashboard.
+
+Temperatures are kept in Celsius everywhere and only converted for display,
+so switching units never needs the original data again. Conversion runs on
+NumPy arrays so every displayed series is converted in a single pass; numpy
+itself is only imported once a series is converted.
+"""
+from typing import Dict, List, Sequence
+
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
+CELSIUS = "Celsius (°C)"
+FAHRENHEIT = "Fahrenheit (°F)"
+KELVIN = "Kelvin (K)"
+UNIT_OPTIONS = [CELSIUS, FAHRENHEIT, KELVIN]
+
+# unit -> (scale, offset, symbol, decimals); unknown units fall back to Celsius
+_UNITS = {
+    CELSIUS: (1.0, 0.0, "°C", 1),
+    FAHRENHEIT: (9 / 5, 32.0, "°F", 1),
+    KELVIN: (1.0, 273.15, "K", 2),
+}
+
+
+def unit_symbol(unit: str) -> str:
+    """Short symbol for a unit option, e.g. "°F" """
+    return _UNITS.get(unit, _UNITS[CELSIUS])[2]
+
+
+def convert(temps_c, unit: str) -> "np.ndarray":
+    """
+    Convert Celsius temperatures to the given unit.
+
+    Args:
+        temps_c: A single value or a sequence of Celsius temperatures
+        unit: One of UNIT_OPTIONS
+
+    Returns:
+        np.ndarray: Converted values (0-d for a scalar input)
+    """
+    scale, offset, _, _ = _UNITS.get(unit, _UNITS[CELSIUS])
+    return np.asarray(temps_c, dtype=float) * scale + offset
+
+
+def format_values(values: "np.ndarray", unit: str) -> List[str]:
+    """Format already converted values with the unit's precision and symbol"""
+    _, _, symbol, decimals = _UNITS.get(unit, _UNITS[CELSIUS])
+    return [text + symbol for text in np.char.mod(f"%.{decimals}f", np.atleast_1d(values))]
+
+
+def convert_value(temp_c: float, unit: str) -> float:
+    """Convert a single Celsius value; plain arithmetic, so numpy is not loaded"""
+    scale, offset, _, _ = _UNITS.get(unit, _UNITS[CELSIUS])
+    return temp_c * scale + offset
+
+
+def format_temperature(temp_c: float, unit: str) -> str:
+    """Convert one Celsius value and format it, e.g. "71.6°F" """
+    _, _, symbol, decimals = _UNITS.get(unit, _UNITS[CELSIUS])
+    return f"{convert_value(temp_c, unit):.{decimals}f}{symbol}"
+
+
+def convert_series(series: Dict[str, Sequence[float]], unit: str) -> Dict[str, List[float]]:
+    """
+    Convert several Celsius series at once.
+
+    All series are concatenated into one array, converted together and split
+    back into lists in their original order and lengths.
+    """
+    if not series:
+        return {}
+    lengths = [len(values) for values in series.values()]
+    flat = convert(np.concatenate([np.asarray(values, dtype=float) for values in series.values()]), unit)
+    parts = np.split(flat, np.cumsum(lengths)[:-1])
+    return {name: part.tolist() for name, part in zip(series.keys(), parts)}
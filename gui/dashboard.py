@@ -4,12 +4,13 @@ Weather Dashboard GUI application using Tkinter.
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
 from typing import Optional, List, Dict, Any
-import requests
-import json
 import logging
 import os
 from datetime import datetime
 
+from config.settings_service import get_settings_service
+from services.http_session import get_session
+
 # Import data functions
 from data.io import write_weather_record, read_weather_records, calculate_weather_statistics
 
@@ -29,7 +30,7 @@ class WeatherService:
                 'appid': self.api_key,
                 'units': 'metric'
             }
-            response = requests.get(self.base_url, params=params)
+            response = get_session().get(self.base_url, params=params, timeout=10)
             if response.status_code == 200:
                 data = response.json()
                 return {
@@ -44,47 +45,28 @@ class WeatherService:
         return None
 
 class SettingsManager:
-    """Simple settings manager using JSON file."""
+    """Settings for this dashboard, stored in the shared settings service."""
     
     def __init__(self):
-        self.settings_file = "settings.json"
-        self.settings = self._load_settings()
-    
-    def _load_settings(self) -> Dict[str, Any]:
-        """Load settings from file."""
-        try:
-            if os.path.exists(self.settings_file):
-                with open(self.settings_file, 'r') as f:
-                    return json.load(f)
-        except Exception:
-            pass
-        return {}
-    
-    def _save_settings(self) -> None:
-        """Save settings to file."""
-        try:
-            with open(self.settings_file, 'w') as f:
-                json.dump(self.settings, f)
-        except Exception:
-            pass
+        self.settings = get_settings_service()
+        # Pick up values saved by older versions next to the working directory
+        self.settings.import_legacy("settings.json")
     
     def get_last_city(self) -> Optional[str]:
         """Get the last searched city."""
-        return self.settings.get('last_city')
+        return self.settings.get_str('last_city') or None
     
     def set_last_city(self, city: str) -> None:
         """Set the last searched city."""
-        self.settings['last_city'] = city
-        self._save_settings()
+        self.settings.set('last_city', city)
     
     def get_user_name(self) -> Optional[str]:
         """Get the user name."""
-        return self.settings.get('user_name')
+        return self.settings.get_str('user_name') or None
     
     def set_user_name(self, name: str) -> None:
         """Set the user name."""
-        self.settings['user_name'] = name
-        self._save_settings()
+        self.settings.set('user_name', name)
 
 class GUIIcons:
     """Simple weather icons."""
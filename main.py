@@ -15,9 +15,10 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
-import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from typing import List, Dict, Tuple
+from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
 # Define theme color schemes
@@ -40,28 +41,52 @@ except ImportError:
     print("Please install it using: pip install requests")
     sys.exit(1)
 
-# Check if matplotlib is installed before proceeding
-try:
-    from matplotlib.figure import Figure
-    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-    import numpy as np
-except ImportError:
-    print("Error: 'matplotlib' library is not installed.")
-    print("Please install it using: pip install matplotlib")
-    sys.exit(1)
-
 # Add the project root directory to Python path
 project_root = os.path.dirname(os.path.abspath(__file__))
 if (project_root not in sys.path):
     sys.path.insert(0, project_root)
 
+from utils.lazy import missing_modules
+
+# Check if matplotlib is installed before proceeding. Only its presence is checked
+# here; the plotting stack itself is imported when the first chart is drawn.
+_missing_plotting = missing_modules("matplotlib", "numpy")
+if _missing_plotting:
+    print(f"Error: '{_missing_plotting}' library is not installed.")
+    print(f"Please install it using: pip install {_missing_plotting}")
+    sys.exit(1)
+
+from config.constants import (
+    CACHE_MAX_ENTRIES,
+    CACHE_TTL_MINUTES,
+    DISK_CACHE_ENABLED,
+    DISK_CACHE_FILENAME,
+    DISK_CACHE_MAX_AGE_HOURS,
+    FETCH_MAX_WORKERS,
+    FETCH_POLL_MS,
+    COMPARISON_MAX_WORKERS,
+    HISTORY_PAGE_SIZE,
+    RATE_LIMIT_FOREGROUND_RESERVE,
+    RATE_LIMIT_WAIT_SECONDS,
+    AUTO_REFRESH_ENABLED,
+    AUTO_REFRESH_INTERVAL_MINUTES,
+    AUTO_REFRESH_JITTER_SECONDS,
+    AUTO_REFRESH_INITIAL_DELAY_SECONDS,
+)
+from config.settings_service import SettingsService, get_settings_service
+from services.cache import WeatherCache
+from services.disk_cache import DiskCache
+from services.http_session import get_session, close_session
+from services.rate_limit import RateLimitExceeded, TokenBucket, get_rate_limiter
+from services.refresh_scheduler import RefreshScheduler
+from utils.tk_async import TkTaskRunner
+from features.charts import TemperatureChart, ComparisonChart
+from features import units
+from features.team_data import get_team_store
+from features.history_store import open_history_store
 from features.tracker import (
-    save_weather_to_csv,
-    read_last_n_entries,
-    calculate_stats_from_csv,
     get_weather_phrase,
-    get_personalized_greeting,
-    load_history
+    get_personalized_greeting
 )
 
 
@@ -112,18 +137,41 @@ class GUIIcons:
 
 
 class WeatherService:
-    def __init__(self):
+    def __init__(self, cache: Optional[WeatherCache] = None, rate_limiter: Optional[TokenBucket] = None):
         # Get API key from environment variable loaded from .env file
         self.api_key = os.getenv("API_KEY")
         if not self.api_key:
             raise ValueError("API_KEY not found in environment variables. Please check your .env file.")
 
-    def get_weather(self, city: str) -> dict:
+        # Responses are cached per (endpoint, city); forecast payloads are shared
+        # by the day cards and the temperature chart
+        if cache is None:
+            persistent = None
+            if DISK_CACHE_ENABLED:
+                try:
+                    persistent = DiskCache(os.path.join(project_root, DISK_CACHE_FILENAME),
+                                           max_age_hours=DISK_CACHE_MAX_AGE_HOURS)
+                except Exception as e:
+                    print(f"Disk cache unavailable, using memory only: {e}")
+            cache = WeatherCache(
+                ttl_minutes=CACHE_TTL_MINUTES["weather"],
+                max_entries=CACHE_MAX_ENTRIES,
+                endpoint_ttls=CACHE_TTL_MINUTES,
+                persistent=persistent,
+            )
+        self.cache = cache
+        # One request budget for user searches and the background auto-refresh
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self._fetch_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        self._fetch_locks_guard = threading.Lock()
+
+    def get_weather(self, city: str, background: bool = False) -> dict:
         """
         Get weather data for a given city from OpenWeatherMap API.
 
         Args:
             city: Name of the city to get weather for
+            background: Request comes from the auto-refresh and must not wait for the rate limiter
 
         Returns:
             Dictionary containing weather data
@@ -131,11 +179,33 @@ class WeatherService:
         Raises:
             Exception: If API call fails or data parsing fails
         """
+        return self.get_weather_entry(city, background)[0]
+
+    def get_weather_entry(self, city: str, background: bool = False) -> Tuple[dict, datetime]:
+        """
+        Get weather data for a city together with the time it was downloaded,
+        which is older than now when the data came from the cache.
+
+        Args:
+            city: Name of the city to get weather for
+            background: Request comes from the auto-refresh and must not wait for the rate limiter
+
+        Returns:
+            Tuple of (weather data dict, fetched_at)
+
+        Raises:
+            Exception: If API call fails or data parsing fails
+        """
+        cached = self.cache.get_entry(city, "weather")
+        if cached is not None:
+            return cached
+
+        self._acquire_request_slot(background)
         try:
             url = "https://api.openweathermap.org/data/2.5/weather"
             params = {"q": city, "appid": self.api_key, "units": "metric"}
 
-            resp = requests.get(url, params=params, timeout=5)
+            resp = get_session().get(url, params=params, timeout=5)
             resp.raise_for_status()
             data = resp.json()
 
@@ -151,7 +221,8 @@ class WeatherService:
                 "description": data["weather"][0]["description"]
             }
 
-            return weather_data
+            fetched_at = self.cache.set(city, weather_data, "weather")
+            return weather_data, fetched_at
 
         except requests.exceptions.HTTPError as e:
             if resp.status_code == 404:
@@ -167,67 +238,210 @@ class WeatherService:
         except Exception as e:
             raise Exception(f"Failed to get weather data: {e}")
 
-    def get_5_day_forecast(self, city: str) -> List[Dict]:
+    def _get_forecast_items(self, city: str, refresh: bool = False, background: bool = False) -> List[Dict]:
         """
-        Get 5-day weather forecast for a given city from OpenWeatherMap API.
+        Get the raw 3-hourly forecast entries for a city, downloading them at most
+        once per forecast cache TTL.
 
         Args:
-            city: Name of the city to get forecast for
+            city: Name of the city to get forecast entries for
+            refresh: Force a new download even if a cached payload is still fresh
+            background: Request comes from the auto-refresh and must not wait for the rate limiter
 
         Returns:
-            List of dictionaries containing forecast data for 5 days
+            List of forecast entries as returned in the API's "list" field
 
         Raises:
-            Exception: If API call fails or data parsing fails
+            Exception: If API call fails
         """
-        try:
+        if not refresh:
+            cached = self.cache.get(city, "forecast")
+            if cached is not None:
+                return cached
+
+        # The day cards and the chart ask for the same forecast concurrently;
+        # the per-city lock makes the second caller wait for the first download
+        with self._fetch_lock(city, "forecast"):
+            if not refresh:
+                cached = self.cache.get(city, "forecast")
+                if cached is not None:
+                    return cached
+
+            self._acquire_request_slot(background)
             url = "https://api.openweathermap.org/data/2.5/forecast"
             params = {"q": city, "appid": self.api_key, "units": "metric"}
 
-            resp = requests.get(url, params=params, timeout=5)
-            resp.raise_for_status()
-            data = resp.json()
+            try:
+                resp = get_session().get(url, params=params, timeout=5)
+                resp.raise_for_status()
+                data = resp.json()
+            except requests.exceptions.HTTPError as e:
+                if resp.status_code == 404:
+                    raise Exception(f"City '{city}' not found for forecast")
+                elif resp.status_code == 401:
+                    raise Exception("Invalid API key for forecast")
+                else:
+                    raise Exception(f"HTTP error in forecast: {e}")
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Network error in forecast: {e}")
+
+            try:
+                items = data["list"]
+            except (KeyError, TypeError) as e:
+                raise Exception(f"Unexpected forecast API response format: missing {e}")
+
+            self.cache.set(city, items, "forecast")
+            return items
+
+    def close(self) -> None:
+        """Release the response cache's database connection"""
+        self.cache.close()
+
+    def _acquire_request_slot(self, background: bool) -> None:
+        """
+        Take a token from the shared request budget before calling the API.
 
-            forecast_list = []
-            processed_dates = set()
+        Foreground requests queue for a token in arrival order, so a batch
+        comparison drains at the sustained rate; only a request that would
+        wait longer than RATE_LIMIT_WAIT_SECONDS behind the queue is refused.
+        Background requests never wait and leave a reserve so they cannot
+        delay a user's search.
 
-            # Process forecast data (API returns 40 entries for 5 days, every 3 hours)
-            for item in data["list"]:
-                # Convert timestamp to date
-                forecast_date = datetime.fromtimestamp(item["dt"])
-                date_key = forecast_date.strftime("%Y-%m-%d")
+        Raises:
+            RateLimitExceeded: If no token is available
+        """
+        if background:
+            if not self.rate_limiter.try_acquire(reserve=RATE_LIMIT_FOREGROUND_RESERVE):
+                raise RateLimitExceeded("Request budget is reserved for searches")
+        elif not self.rate_limiter.acquire(timeout=RATE_LIMIT_WAIT_SECONDS):
+            raise RateLimitExceeded("Too many requests, please try again in a moment")
 
-                # Skip if we already have data for this date
-                if date_key in processed_dates:
-                    continue
+    def refresh_city(self, city: str) -> List[str]:
+        """
+        Re-download whichever of a city's cached responses have expired.
 
-                # Take the first forecast of each day (usually around midnight or early morning)
-                # This gives us one forecast per day for 5 days
-                forecast_entry = {
-                    "date": forecast_date.strftime("%a %b %d"),  # e.g., "Tue Aug 5"
-                    "temp": round(item["main"]["temp"]),
-                    "condition_code": item["weather"][0]["id"],
-                    "description": item["weather"][0]["description"]
-                }
+        Entries still within their cache TTL are left alone, so repeated
+        refreshes of the same city within a TTL cost nothing.
 
-                forecast_list.append(forecast_entry)
-                processed_dates.add(date_key)
+        Args:
+            city: Name of the city
 
-                # Stop when we have 5 days
-                if len(forecast_list) >= 5:
-                    break
+        Returns:
+            List of endpoints that were downloaded ("weather", "forecast")
 
-            return forecast_list
+        Raises:
+            RateLimitExceeded: If the background request budget is used up
+        """
+        refreshed = []
+        if self.cache.get(city, "weather") is None:
+            self.get_weather(city, background=True)
+            refreshed.append("weather")
+        if self.cache.get(city, "forecast") is None:
+            self._get_forecast_items(city, background=True)
+            refreshed.append("forecast")
+        return refreshed
+
+    def _fetch_lock(self, city: str, endpoint: str) -> threading.Lock:
+        """Return the lock serialising downloads of one endpoint for one city"""
+        key = (endpoint, city.lower().strip())
+        with self._fetch_locks_guard:
+            return self._fetch_locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def _first_entry_per_day(items: List[Dict], days: int = 5) -> List[Tuple[datetime, Dict]]:
+        """Pick the first forecast entry of each calendar day (API returns 40 entries, every 3 hours)"""
+        daily = []
+        processed_dates = set()
+
+        for item in items:
+            forecast_date = datetime.fromtimestamp(item["dt"])
+            date_key = forecast_date.strftime("%Y-%m-%d")
+
+            # Skip if we already have data for this date
+            if date_key in processed_dates:
+                continue
+
+            daily.append((forecast_date, item))
+            processed_dates.add(date_key)
+
+            # Stop when we have enough days
+            if len(daily) >= days:
+                break
+
+        return daily
+
+    @classmethod
+    def _build_day_cards(cls, items: List[Dict]) -> List[Dict]:
+        """Build the forecast day-card dicts from raw forecast entries"""
+        # Take the first forecast of each day (usually around midnight or early morning)
+        return [
+            {
+                "date": forecast_date.strftime("%a %b %d"),  # e.g., "Tue Aug 5"
+                "temp": round(item["main"]["temp"]),
+                "condition_code": item["weather"][0]["id"],
+                "description": item["weather"][0]["description"]
+            }
+            for forecast_date, item in cls._first_entry_per_day(items)
+        ]
+
+    @classmethod
+    def _build_chart_points(cls, items: List[Dict]) -> List[Tuple[str, float]]:
+        """Build (date_string, temperature) chart tuples from raw forecast entries"""
+        # Format date for display (short format)
+        return [
+            (forecast_date.strftime("%m/%d"), round(item["main"]["temp"], 1))
+            for forecast_date, item in cls._first_entry_per_day(items)
+        ]
+
+    def get_last_known(self, city: str) -> Optional[Dict]:
+        """
+        Get the last cached weather for a city, ignoring cache TTLs.
+
+        Lets the dashboard paint immediately on startup from the disk cache
+        while fresh data is fetched.
+
+        Args:
+            city: Name of the city
+
+        Returns:
+            Dictionary with 'weather', 'forecast' and 'temperatures' keys (forecast
+            values may be None), or None if no current weather is cached
+        """
+        weather = self.cache.get_stale(city, "weather")
+        if weather is None:
+            return None
+
+        snapshot = {"weather": weather[0], "fetched_at": weather[1],
+                    "forecast": None, "temperatures": None}
+        forecast = self.cache.get_stale(city, "forecast")
+        if forecast is not None:
+            try:
+                snapshot["forecast"] = self._build_day_cards(forecast[0])
+                snapshot["temperatures"] = self._build_chart_points(forecast[0])
+            except (KeyError, TypeError, IndexError) as e:
+                print(f"Ignoring unreadable cached forecast: {e}")
+        return snapshot
+
+    def get_5_day_forecast(self, city: str, refresh: bool = False) -> List[Dict]:
+        """
+        Get 5-day weather forecast for a given city from OpenWeatherMap API.
+
+        Args:
+            city: Name of the city to get forecast for
+            refresh: Re-download the forecast even if the cached copy is fresh
+
+        Returns:
+            List of dictionaries containing forecast data for 5 days
+
+        Raises:
+            Exception: If API call fails or data parsing fails
+        """
+        # Download errors already carry a descriptive message
+        items = self._get_forecast_items(city, refresh=refresh)
+
+        try:
+            return self._build_day_cards(items)
 
-        except requests.exceptions.HTTPError as e:
-            if resp.status_code == 404:
-                raise Exception(f"City '{city}' not found for forecast")
-            elif resp.status_code == 401:
-                raise Exception("Invalid API key for forecast")
-            else:
-                raise Exception(f"HTTP error in forecast: {e}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network error in forecast: {e}")
         except KeyError as e:
             raise Exception(f"Unexpected forecast API response format: missing {e}")
         except Exception as e:
@@ -237,6 +451,9 @@ class WeatherService:
         """
         Get 5-day temperature data for chart display.
 
+        Shares the downloaded forecast payload with get_5_day_forecast, so calling
+        both for the same city only hits the API once.
+
         Args:
             city: Name of the city to get temperature data for
 
@@ -246,56 +463,65 @@ class WeatherService:
         Raises:
             Exception: If API call fails or data parsing fails
         """
-        try:
-            url = "https://api.openweathermap.org/data/2.5/forecast"
-            params = {"q": city, "appid": self.api_key, "units": "metric"}
-
-            resp = requests.get(url, params=params, timeout=5)
-            resp.raise_for_status()
-            data = resp.json()
-
-            temperature_data = []
-            processed_dates = set()
-
-            # Process forecast data to get one temperature per day (midday preference)
-            for item in data["list"]:
-                forecast_datetime = datetime.fromtimestamp(item["dt"])
-                date_key = forecast_datetime.strftime("%Y-%m-%d")
+        items = self._get_forecast_items(city)
 
-                # Skip if we already have data for this date
-                if date_key in processed_dates:
-                    continue
-
-                # Format date for display (short format)
-                date_str = forecast_datetime.strftime("%m/%d")
-                temperature = round(item["main"]["temp"], 1)
-
-                temperature_data.append((date_str, temperature))
-                processed_dates.add(date_key)
-
-                # Stop when we have 5 days
-                if len(temperature_data) >= 5:
-                    break
-
-            return temperature_data
+        try:
+            return self._build_chart_points(items)
 
-        except requests.exceptions.HTTPError as e:
-            if resp.status_code == 404:
-                raise Exception(f"City '{city}' not found for temperature data")
-            elif resp.status_code == 401:
-                raise Exception("Invalid API key for temperature data")
-            else:
-                raise Exception(f"HTTP error in temperature data: {e}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Network error in temperature data: {e}")
         except KeyError as e:
             raise Exception(f"Unexpected temperature API response format: missing {e}")
         except Exception as e:
             raise Exception(f"Failed to get temperature data: {e}")
 
+    def get_temperature_comparison_multi(self, cities: List[str],
+                                         max_workers: int = COMPARISON_MAX_WORKERS
+                                         ) -> Tuple[List[str], Dict[str, List[float]], Dict[str, str]]:
+        """
+        Get 5-day temperature data for any number of cities, fetched in parallel.
+
+        Args:
+            cities: City names to compare
+            max_workers: Maximum number of concurrent forecast downloads
+
+        Returns:
+            Tuple containing (dates, temps_by_city, errors_by_city). Cities that
+            failed are left out of temps_by_city and reported in errors_by_city.
+        """
+        results: Dict[str, List[Tuple[str, float]]] = {}
+        errors: Dict[str, str] = {}
+        if not cities:
+            return [], {}, errors
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(cities)))) as pool:
+            futures = {city: pool.submit(self.get_5_day_temperatures, city) for city in cities}
+            for city, future in futures.items():
+                try:
+                    results[city] = future.result()
+                except Exception as e:
+                    errors[city] = str(e)
+
+        # Use the common dates (should be the same for every city)
+        # If different lengths, use the shortest one
+        successful = [city for city in cities if city in results and results[city]]
+        for city in cities:
+            if city in results and not results[city]:
+                errors[city] = "No temperature data returned"
+        if not successful:
+            return [], {}, errors
+
+        min_length = min(len(results[city]) for city in successful)
+        dates = [date for date, _ in results[successful[0]][:min_length]]
+        temps_by_city = {
+            city: [temp for _, temp in results[city][:min_length]]
+            for city in successful
+        }
+
+        return dates, temps_by_city, errors
+
     def get_temperature_comparison(self, city1: str, city2: str) -> Tuple[List[str], List[float], List[float]]:
         """
-        Get temperature comparison data for two cities.
+        Get temperature comparison data for two cities. Both cities are fetched
+        in parallel.
 
         Args:
             city1: Name of the first city
@@ -305,54 +531,35 @@ class WeatherService:
             Tuple containing (dates, temps1, temps2)
 
         Raises:
-            Exception: If API call fails for either city
+            Exception: If API call fails for either city (the message names each failing city)
         """
-        try:
-            # Get temperature data for both cities
-            temps1_data = self.get_5_day_temperatures(city1)
-            temps2_data = self.get_5_day_temperatures(city2)
+        dates, temps_by_city, errors = self.get_temperature_comparison_multi([city1, city2])
 
-            # Extract dates and temperatures
-            dates1, temps1 = zip(*temps1_data) if temps1_data else ([], [])
-            dates2, temps2 = zip(*temps2_data) if temps2_data else ([], [])
+        if errors:
+            details = "; ".join(f"{city}: {message}" for city, message in errors.items())
+            raise Exception(f"Failed to get comparison data: {details}")
 
-            # Use the common dates (should be the same for both cities)
-            # If different lengths, use the shorter one
-            min_length = min(len(dates1), len(dates2))
-            dates = list(dates1[:min_length])
-            temps1_list = list(temps1[:min_length])
-            temps2_list = list(temps2[:min_length])
-
-            return dates, temps1_list, temps2_list
-
-        except Exception as e:
-            raise Exception(f"Failed to get comparison data: {str(e)}")
+        return dates, temps_by_city[city1], temps_by_city[city2]
 
 
 class SettingsManager:
-    def __init__(self):
-        self._config_path = os.path.join(os.path.dirname(__file__), "settings.json")
-        if os.path.exists(self._config_path):
-            with open(self._config_path) as f:
-                self._config = json.load(f)
-        else:
-            self._config = {}
+    """Dashboard view of the process-wide SettingsService"""
+
+    def __init__(self, service: Optional[SettingsService] = None):
+        # Reads come from the shared in-memory snapshot; writes are batched by the service
+        self._service = service or get_settings_service()
 
     def get_last_city(self) -> str:
-        return self._config.get("last_city", "")
+        return self._service.get_str("last_city")
 
     def save_last_city(self, city: str) -> None:
-        self._config["last_city"] = city
-        with open(self._config_path, "w") as f:
-            json.dump(self._config, f, indent=2)
+        self._service.set("last_city", city)
 
     def get_last_name(self) -> str:
-        return self._config.get("user_name", "")
+        return self._service.get_str("user_name")
 
     def save_last_name(self, name: str) -> None:
-        self._config["user_name"] = name
-        with open(self._config_path, "w") as f:
-            json.dump(self._config, f, indent=2)
+        self._service.set("user_name", name)
 
     def get_available_themes(self) -> List[str]:
         """Return list of available theme names"""
@@ -360,20 +567,53 @@ class SettingsManager:
 
     def load_theme(self) -> str:
         """Load saved theme or return default"""
-        return self._config.get("theme", "Blue")
+        return self._service.get_str("theme", "Blue")
 
     def save_theme(self, theme_name: str) -> None:
         """Save selected theme to settings"""
         if theme_name in THEME_SCHEMES:
-            self._config["theme"] = theme_name
-            with open(self._config_path, "w") as f:
-                json.dump(self._config, f, indent=2)
+            self._service.set("theme", theme_name)
 
     def get_theme(self) -> str:
         return self.load_theme()
 
+    def get_pinned_cities(self) -> List[str]:
+        """Return the cities pinned for background refresh"""
+        return [city for city in self._service.get_list("pinned_cities") if isinstance(city, str) and city]
+
+    def is_pinned(self, city: str) -> bool:
+        return city.strip().lower() in (pinned.lower() for pinned in self.get_pinned_cities())
+
+    def pin_city(self, city: str) -> None:
+        city = city.strip()
+        if city and not self.is_pinned(city):
+            self._service.set("pinned_cities", self.get_pinned_cities() + [city])
+
+    def unpin_city(self, city: str) -> None:
+        key = city.strip().lower()
+        self._service.set("pinned_cities", [pinned for pinned in self.get_pinned_cities() if pinned.lower() != key])
+
+    def get_auto_refresh_enabled(self) -> bool:
+        return self._service.get_bool("auto_refresh_enabled", AUTO_REFRESH_ENABLED)
+
+    def get_auto_refresh_minutes(self) -> float:
+        """Minutes between background refreshes of the watched cities"""
+        minutes = self._service.get_float("auto_refresh_minutes", AUTO_REFRESH_INTERVAL_MINUTES)
+        return minutes if minutes > 0 else AUTO_REFRESH_INTERVAL_MINUTES
+
+    def subscribe(self, callback, key: Optional[str] = None):
+        """Call callback(key, value) when a setting changes; returns an unsubscribe function"""
+        return self._service.subscribe(callback, key)
+
+    def flush(self) -> None:
+        """Write any pending settings changes now"""
+        self._service.flush()
+
 
 class WeatherDashboard:
+    COMPARISON_PLACEHOLDER = ("Select two cities from the dropdowns above and click 'Compare' to see\n"
+                              "their 5-day temperature comparison chart.")
+
     def __init__(self, root):
         self.root = root
         self.root.title("VibeCast 🌦️")
@@ -382,6 +622,10 @@ class WeatherDashboard:
         # Initialize services
         self.weather_service = WeatherService()
         self.settings_manager = SettingsManager()
+        self.history_store = open_history_store()
+        self._history_loaded = 0
+        self._history_total = 0
+        self._history_loading = False
 
         # Load saved city
         self.current_city = self.settings_manager.get_last_city()
@@ -391,18 +635,55 @@ class WeatherDashboard:
         self.theme_var = tk.StringVar(value=self.current_theme)
 
         # Temperature unit dropdown
-        self.unit_options = ["Celsius (°C)", "Fahrenheit (°F)", "Kelvin (K)"]
+        self.unit_options = list(units.UNIT_OPTIONS)
         self.unit_var = tk.StringVar(value=self.unit_options[0])
 
-        # Load available cities from CSV
-        self.available_cities = self.load_cities_from_csv()
+        # Cities for the comparison tab are loaded from CSV when that tab is first opened
+        self.available_cities = []
 
         # Initialize forecast variables
         self.forecast_vars = []
+        self.forecast_error = None
+
+        # Tabs other than Current Weather are built on first selection
+        self._tab_builders = {}
+        self._built_tabs = set()
 
         # Initialize chart variables
-        self.chart_canvas = None
-        self.comparison_canvas = None
+        self.current_weather_data = None
+        self.current_forecast_data = None
+        self.current_chart_data = None
+        self.current_comparison_data = None
+        self.temperature_chart = None
+        self.chart_message_label = None
+        self.comparison_chart = None
+        self.comparison_message_label = None
+
+        # Network calls run on worker threads so the UI stays responsive
+        self.task_runner = TkTaskRunner(self.root, max_workers=FETCH_MAX_WORKERS,
+                                        poll_ms=FETCH_POLL_MS)
+        self._search_generation = 0
+        self._failed_generation = -1
+        # Generation of a search that only revalidates last-known data (fails quietly)
+        self._revalidation_generation = -1
+        self._shown_fetched_at = None
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
+        # The last city and pinned cities are kept fresh in the background so
+        # switching between them is served from the cache
+        self.refresh_scheduler = RefreshScheduler(
+            self.root, self.task_runner, self.weather_service.refresh_city,
+            interval_seconds=self.settings_manager.get_auto_refresh_minutes() * 60,
+            jitter_seconds=AUTO_REFRESH_JITTER_SECONDS,
+            on_refreshed=self._on_city_refreshed)
+        self._settings_subscriptions = [
+            self.settings_manager.subscribe(lambda key, value: self._update_watch_list(), "last_city"),
+            self.settings_manager.subscribe(lambda key, value: self._update_watch_list(), "pinned_cities"),
+            self.settings_manager.subscribe(
+                lambda key, value: self.refresh_scheduler.set_interval(
+                    self.settings_manager.get_auto_refresh_minutes() * 60),
+                "auto_refresh_minutes"),
+        ]
 
         # Setup GUI
         self.setup_gui()
@@ -415,45 +696,47 @@ class WeatherDashboard:
         if last_name:
             self.name_entry.insert(0, last_name)
 
-        # Load weather for saved city if exists
+        # Load weather for saved city if exists: paint the last-known data from the
+        # disk cache straight away, then revalidate once the window is up
         if self.current_city:
             self.city_entry.insert(0, self.current_city)
-            self.get_weather()
+            shown = self.show_last_known_weather(self.current_city)
+            self.root.after(100, lambda: self.get_weather(revalidate=shown))
+
+        self._update_watch_list()
+        if self.settings_manager.get_auto_refresh_enabled():
+            self.refresh_scheduler.start(AUTO_REFRESH_INITIAL_DELAY_SECONDS)
+
+    def show_last_known_weather(self, city: str) -> bool:
+        """Render cached weather for a city without touching the network"""
+        snapshot = self.weather_service.get_last_known(city)
+        if not snapshot:
+            return False
+
+        self.display_weather(snapshot["weather"])
+        if snapshot["forecast"]:
+            self.update_forecast_display(snapshot["forecast"])
+        if snapshot["temperatures"]:
+            self.draw_temperature_chart(snapshot["temperatures"])
+        self._set_data_status(snapshot["fetched_at"])
+        return True
+
+    def _set_data_status(self, fetched_at: Optional[datetime], refresh_failed: bool = False):
+        """Show when the displayed weather was fetched, flagging it if a refresh failed"""
+        self._shown_fetched_at = fetched_at
+        if fetched_at is None:
+            self.data_status_label.config(text="")
+            return
+        when = fetched_at.strftime("%b %d %H:%M")
+        if refresh_failed:
+            self.data_status_label.config(text=f"⚠️ Showing last known data from {when} (refresh failed)")
+        else:
+            self.data_status_label.config(text=f"Updated {when}")
 
     def load_cities_from_csv(self):
-        """Load available cities from the team CSV file"""
+        """Load available cities from the shared team data store"""
         try:
-            from pathlib import Path
-            import csv
-            csv_path = Path(__file__).parent / "data" / "team_weather_data.csv"
-            available_cities = set()
-
-            with csv_path.open(newline="", encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    city = row.get("city", "").strip()
-                    # Only include cities that have temperature data
-                    if city and any(row.get(col, "").strip() for col in ["temperature", "temp_f"]):
-                        # Check if the temperature and humidity values are not empty or zero
-                        temp_str = ""
-                        hum_str = ""
-
-                        for temp_col in ["temperature", "temp", "temp_f"]:
-                            val = row.get(temp_col, "").strip()
-                            if val and val != "0" and val != "0.0":
-                                temp_str = val
-                                break
-
-                        for hum_col in ["humidity", "humidity_pct"]:
-                            val = row.get(hum_col, "").strip()
-                            if val and val != "0" and val != "0.0":
-                                hum_str = val
-                                break
-
-                        if temp_str and hum_str:
-                            available_cities.add(city)
-
-            return sorted(list(available_cities))
+            return get_team_store().cities()
         except Exception as e:
             print(f"Error loading cities from CSV: {e}")
             return []
@@ -524,6 +807,22 @@ class WeatherDashboard:
                                           command=self.get_weather)
         self.get_weather_btn.pack(side='right')
 
+        # Pinned cities: refreshed in the background, picking one shows it from the cache
+        watch_frame = ttk.Frame(input_frame)
+        watch_frame.pack(fill='x', pady=(5, 0))
+        ttk.Label(watch_frame, text="Pinned: 📌").pack(side='left', padx=(0, 10))
+        self.watched_city_var = tk.StringVar()
+        self.watched_city_dropdown = ttk.Combobox(watch_frame,
+                                                  textvariable=self.watched_city_var,
+                                                  state="readonly",
+                                                  width=25,
+                                                  font=("Arial", 11))
+        self.watched_city_dropdown.pack(side='left', padx=(0, 10))
+        self.watched_city_dropdown.bind('<<ComboboxSelected>>', self.on_watched_city_selected)
+
+        self.pin_btn = ttk.Button(watch_frame, text="Pin City 📌", command=self.toggle_pin_city)
+        self.pin_btn.pack(side='left')
+
         # Greeting label
         self.greeting_label = ttk.Label(header_frame, text="", font=("Arial", 14, "italic"))
         self.greeting_label.pack(pady=(5, 0))
@@ -546,12 +845,16 @@ class WeatherDashboard:
         self.notebook.add(self.comparison_frame, text="City Comparison")
         self.notebook.add(self.history_frame, text="History")
 
-        # Setup each tab
+        # Only the Current Weather tab is built at startup; the others (and the
+        # data they load) are built the first time they are selected
         self.setup_current_weather_tab()
-        self.setup_forecast_tab()
-        self.setup_chart_tab()
-        self.setup_comparison_tab()
-        self.setup_history_tab()
+        self._tab_builders = {
+            str(self.forecast_frame): ("forecast", self.setup_forecast_tab),
+            str(self.chart_frame): ("chart", self.setup_chart_tab),
+            str(self.comparison_frame): ("comparison", self.setup_comparison_tab),
+            str(self.history_frame): ("history", self.setup_history_tab),
+        }
+        self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
 
         # Control buttons at bottom
         control_frame = ttk.Frame(main_container)
@@ -570,6 +873,26 @@ class WeatherDashboard:
                                            command=self.toggle_theme)
         self.theme_toggle_btn.pack(side='right', padx=(10, 0))
 
+    def _on_tab_changed(self, event=None):
+        """Build the selected tab the first time it is shown"""
+        selected = self.notebook.select()
+        if selected in self._tab_builders:
+            name, builder = self._tab_builders.pop(selected)
+            builder()
+            self._built_tabs.add(name)
+            self._render_pending(name)
+
+    def _render_pending(self, name: str):
+        """Show data that arrived before the tab was built"""
+        if name == "forecast":
+            if self.current_forecast_data:
+                self.update_forecast_display(self.current_forecast_data)
+            elif self.forecast_error:
+                self.display_forecast_error(self.forecast_error)
+        elif name == "chart":
+            if self.current_chart_data is not None:
+                self.draw_temperature_chart(self.current_chart_data)
+
     def setup_current_weather_tab(self):
         """Setup the current weather tab"""
         # Weather display frame
@@ -599,6 +922,10 @@ class WeatherDashboard:
         self.phrase_label = ttk.Label(self.weather_frame, text="", font=get_emoji_font(13))
         self.phrase_label.pack(pady=(0, 10))
 
+        # When the shown data was fetched, and whether refreshing it failed
+        self.data_status_label = ttk.Label(self.weather_frame, text="", font=("Arial", 10, "italic"))
+        self.data_status_label.pack(pady=(0, 5))
+
     def setup_forecast_tab(self):
         """Setup the 5-day forecast tab"""
         # Forecast display frame
@@ -624,6 +951,8 @@ class WeatherDashboard:
 
     def setup_comparison_tab(self):
         """Setup the city comparison tab"""
+        self.available_cities = self.load_cities_from_csv()
+
         # Configure grid weights for proper resizing
         self.comparison_frame.columnconfigure(0, weight=1)
         self.comparison_frame.columnconfigure(1, weight=1)
@@ -664,6 +993,23 @@ class WeatherDashboard:
         self.city1_dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_city_selection())
         self.city2_dropdown.bind('<<ComboboxSelected>>', lambda e: self.on_city_selection())
 
+        # Batch comparison: pick any number of cities (Ctrl/Shift-click)
+        ttk.Label(input_controls_frame, text="Many cities:", font=("Arial", 12)).grid(row=1, column=0, padx=(0, 10), pady=5, sticky="n")
+        batch_list_frame = ttk.Frame(input_controls_frame)
+        batch_list_frame.grid(row=1, column=1, columnspan=3, sticky="ew", padx=(0, 20), pady=5)
+        self.batch_city_listbox = tk.Listbox(batch_list_frame, selectmode="extended", height=4,
+                                             exportselection=False, font=("Arial", 11))
+        for city in self.available_cities:
+            self.batch_city_listbox.insert("end", city)
+        batch_scrollbar = ttk.Scrollbar(batch_list_frame, orient="vertical", command=self.batch_city_listbox.yview)
+        self.batch_city_listbox.configure(yscrollcommand=batch_scrollbar.set)
+        self.batch_city_listbox.pack(side="left", fill="x", expand=True)
+        batch_scrollbar.pack(side="right", fill="y")
+
+        self.batch_compare_btn = ttk.Button(input_controls_frame, text="Compare Selected 📊",
+                                            command=self.compare_selected_cities)
+        self.batch_compare_btn.grid(row=1, column=4, pady=5, sticky="n")
+
         # Chart display area
         self.comparison_chart_frame = ttk.LabelFrame(self.comparison_frame, text="Temperature Comparison Chart 📈", padding="15")
         self.comparison_chart_frame.grid(row=1, column=0, columnspan=5, sticky="nsew", padx=10, pady=(0, 10))
@@ -671,11 +1017,7 @@ class WeatherDashboard:
         self.comparison_chart_frame.rowconfigure(0, weight=1)
 
         # Initial placeholder
-        placeholder_label = ttk.Label(self.comparison_chart_frame, 
-                                     text="Select two cities from the dropdowns above and click 'Compare' to see\ntheir 5-day temperature comparison chart.",
-                                     font=("Arial", 14),
-                                     justify='center')
-        placeholder_label.grid(row=0, column=0, sticky="nsew")
+        self._show_comparison_message(self.COMPARISON_PLACEHOLDER, font=("Arial", 14), justify='center')
 
     def setup_history_tab(self):
         """Setup the history tracker tab"""
@@ -691,6 +1033,9 @@ class WeatherDashboard:
                                               command=self.refresh_history)
         self.refresh_history_btn.pack(side='left')
 
+        self.history_count_label = ttk.Label(control_frame, text="", font=("Arial", 10))
+        self.history_count_label.pack(side='right')
+
         # History tree container with scrollbar
         tree_container = ttk.Frame(history_display_frame)
         tree_container.pack(fill='both', expand=True)
@@ -710,9 +1055,10 @@ class WeatherDashboard:
         self.history_tree.column("Temp", width=120, anchor="center")
         self.history_tree.column("Condition", width=200, anchor="center")
 
-        # Add scrollbar
+        # Add scrollbar; scrolling near the bottom pulls in the next page of history
         history_scrollbar = ttk.Scrollbar(tree_container, orient="vertical", command=self.history_tree.yview)
-        self.history_tree.configure(yscrollcommand=history_scrollbar.set)
+        self.history_tree.configure(yscrollcommand=lambda first, last: self._on_history_scroll(
+            history_scrollbar, first, last))
 
         # Pack tree and scrollbar
         self.history_tree.pack(side="left", fill="both", expand=True)
@@ -722,36 +1068,84 @@ class WeatherDashboard:
         self.refresh_history()
 
     def refresh_history(self):
-        """Refresh the history display with latest data"""
+        """Reload the first page of history (newest first)"""
         try:
-            # Clear existing items
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
+            # Clear existing items in one Tk call
+            self.history_tree.delete(*self.history_tree.get_children())
+            self._history_loaded = 0
+            self._history_total = self.history_store.count()
 
-            # Load history data
-            history_data = load_history()
-            
-            if not history_data:
+            if not self._history_total:
                 # Show message when no data available
                 self.history_tree.insert("", "end", values=("No history available", "", "", ""))
+                self._update_history_count()
                 return
 
-            # Insert data into tree (reverse order to show newest first)
-            for entry in reversed(history_data[-50:]):  # Show last 50 entries, newest first
-                self.history_tree.insert("", "end", values=(
-                    entry["timestamp"],
-                    entry["city"],
-                    entry["temp"],
-                    entry["condition"]
-                ))
+            self.load_more_history()
 
         except Exception as e:
             print(f"Error refreshing history: {e}")
             # Show error message in tree
-            for item in self.history_tree.get_children():
-                self.history_tree.delete(item)
+            self.history_tree.delete(*self.history_tree.get_children())
             self.history_tree.insert("", "end", values=("Error loading history", str(e), "", ""))
 
+    def load_more_history(self):
+        """Append the next page of older history rows to the bottom of the tree"""
+        try:
+            if self._history_loaded >= self._history_total:
+                return
+
+            rows = self.history_store.page(self._history_loaded, HISTORY_PAGE_SIZE)
+            if not rows:
+                # Fewer rows on disk than counted; stop asking for more
+                self._history_total = self._history_loaded
+            # Advance by the rows actually read so a short last page is not skipped past
+            self._history_loaded += len(rows)
+            for row in rows:
+                entry = self.history_store.format_row(row)
+                if entry:
+                    self._insert_history_entry(entry, "end")
+            self._update_history_count()
+        finally:
+            self._history_loading = False
+
+    def add_history_entry(self, row: Dict):
+        """Show a newly saved search at the top without reloading the tree"""
+        if "history" not in self._built_tabs:
+            # The first page, including this row, loads when the tab is opened
+            return
+        entry = self.history_store.format_row(row)
+        if not entry:
+            return
+        if not self._history_total:
+            # Drop the "No history available" placeholder
+            self.history_tree.delete(*self.history_tree.get_children())
+        self._history_total += 1
+        self._history_loaded += 1
+        self._insert_history_entry(entry, 0)
+        self._update_history_count()
+
+    def _insert_history_entry(self, entry: Dict, index):
+        self.history_tree.insert("", index, values=(
+            entry["timestamp"],
+            entry["city"],
+            entry["temp"],
+            entry["condition"]
+        ))
+
+    def _update_history_count(self):
+        shown = min(self._history_loaded, self._history_total)
+        self.history_count_label.config(text=f"Showing {shown} of {self._history_total} searches")
+
+    def _on_history_scroll(self, scrollbar, first, last):
+        """Keep the scrollbar in sync and fetch older rows once the bottom is in view"""
+        scrollbar.set(first, last)
+        if (float(last) >= 0.95 and self._history_loaded < self._history_total
+                and not self._history_loading):
+            # Scrolling fires this repeatedly; queue one page at a time
+            self._history_loading = True
+            self.root.after_idle(self.load_more_history)
+
     def on_city_selection(self):
         """Handle city selection in dropdown - enable compare button when both cities are selected"""
         city1 = self.city1_var.get().strip()
@@ -764,49 +1158,42 @@ class WeatherDashboard:
             self.compare_btn.config(state="disabled")
 
     def on_unit_change(self, event=None):
-        """Callback for temperature unit change - refresh all displays with new unit"""
-        # Refresh weather display if we have current weather data
-        if hasattr(self, 'current_weather_data') and self.current_weather_data:
-            self.display_weather(self.current_weather_data)
-        
-        # Refresh forecast display if we have forecast data
-        if hasattr(self, 'current_forecast_data') and self.current_forecast_data:
-            self.update_forecast_display(self.current_forecast_data)
-        
-        # Refresh temperature chart if we have chart data
-        if hasattr(self, 'current_chart_data') and self.current_chart_data:
-            self.draw_temperature_chart(self.current_chart_data)
-        
-        # Refresh comparison chart if we have comparison data
-        if hasattr(self, 'current_comparison_data') and self.current_comparison_data:
-            dates, temps1, temps2, label1, label2 = self.current_comparison_data
-            self.draw_comparison_chart(dates, temps1, temps2, label1, label2)
+        """Callback for temperature unit change - relabel all displays with the new unit"""
+        unit = self.unit_var.get()
+
+        # Relabel the temperature lines of the current weather display
+        if self.current_weather_data:
+            self.show_weather_temperatures(self.current_weather_data)
+
+        # Relabel forecast temperatures
+        if self.current_forecast_data:
+            for day_vars, day_data in zip(self.forecast_vars, self.current_forecast_data[:5]):
+                day_vars['temp'].set(self.convert_temperature(day_data['temp']))
+
+        # Convert every charted series (stored in Celsius) in one pass
+        series = {}
+        if self.current_chart_data:
+            series[None] = [temp for _, temp in self.current_chart_data]
+        if self.current_comparison_data and self.current_comparison_data[1]:
+            series.update(self.current_comparison_data[1])
+        converted = units.convert_series(series, unit)
+        symbol = units.unit_symbol(unit)
+
+        # Move existing bars and labels instead of rebuilding the charts
+        values = converted.pop(None, None)
+        if values and self.temperature_chart is not None:
+            self.temperature_chart.set_values(values, units.format_values(values, unit), symbol)
+        if converted and self.comparison_chart is not None:
+            value_labels = {name: units.format_values(values, unit) for name, values in converted.items()}
+            self.comparison_chart.set_values(converted, value_labels, symbol)
 
     def convert_temperature(self, temp_c):
         """Convert Celsius temperature to selected unit and return formatted string"""
-        unit = self.unit_var.get()
-        if unit == "Celsius (°C)":
-            return f"{temp_c:.1f}°C"
-        elif unit == "Fahrenheit (°F)":
-            temp_f = temp_c * 9/5 + 32
-            return f"{temp_f:.1f}°F"
-        elif unit == "Kelvin (K)":
-            temp_k = temp_c + 273.15
-            return f"{temp_k:.2f}K"
-        else:
-            return f"{temp_c:.1f}°C"
+        return units.format_temperature(temp_c, self.unit_var.get())
 
     def convert_temperature_value(self, temp_c):
         """Convert Celsius temperature to selected unit and return numerical value"""
-        unit = self.unit_var.get()
-        if unit == "Celsius (°C)":
-            return temp_c
-        elif unit == "Fahrenheit (°F)":
-            return temp_c * 9/5 + 32
-        elif unit == "Kelvin (K)":
-            return temp_c + 273.15
-        else:
-            return temp_c
+        return units.convert_value(temp_c, self.unit_var.get())
 
     def compare_cities(self):
         """Compare temperature data between two cities"""
@@ -822,20 +1209,62 @@ class WeatherDashboard:
             messagebox.showwarning("Warning", "Please select two different cities")
             return
 
-        try:
-            # Get comparison data
-            dates, temps1, temps2 = self.weather_service.get_temperature_comparison(city1, city2)
-            
-            if not dates or not temps1 or not temps2:
-                messagebox.showerror("Error", "Unable to get temperature data for comparison")
-                return
+        # Both cities are fetched in parallel on a worker thread
+        self.compare_btn.config(state="disabled")
+        self.task_runner.submit(
+            self.weather_service.get_temperature_comparison, city1, city2,
+            on_success=lambda data: self._on_comparison_loaded(data, city1, city2),
+            on_error=self._on_comparison_failed)
 
-            # Draw comparison chart
-            self.draw_comparison_chart(dates, temps1, temps2, city1, city2)
+    def _on_comparison_loaded(self, data, city1: str, city2: str):
+        """Draw the comparison chart once both cities' data has arrived"""
+        self.on_city_selection()
+        dates, temps1, temps2 = data
 
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to compare cities: {str(e)}")
+        if not dates or not temps1 or not temps2:
+            messagebox.showerror("Error", "Unable to get temperature data for comparison")
+            return
+
+        # Draw comparison chart
+        self.draw_comparison_chart(dates, temps1, temps2, city1, city2)
+
+    def compare_selected_cities(self):
+        """Compare temperature data for every city selected in the batch list"""
+        cities = [self.batch_city_listbox.get(i) for i in self.batch_city_listbox.curselection()]
+        if len(cities) < 2:
+            messagebox.showwarning("Warning", "Please select at least two cities to compare")
+            return
+
+        # Cities are fetched concurrently (bounded by COMPARISON_MAX_WORKERS)
+        self.batch_compare_btn.config(state="disabled")
+        self.task_runner.submit(
+            self.weather_service.get_temperature_comparison_multi, cities,
+            on_success=self._on_batch_comparison_loaded,
+            on_error=self._on_batch_comparison_failed)
+
+    def _on_batch_comparison_loaded(self, data):
+        self.batch_compare_btn.config(state="normal")
+        dates, temps_by_city, errors = data
+
+        if errors:
+            details = "\n".join(f"{city}: {message}" for city, message in errors.items())
+            messagebox.showwarning("Warning", f"Some cities could not be compared:\n{details}")
+
+        if not dates or not temps_by_city:
             self.clear_comparison_chart()
+            return
+
+        self.draw_multi_comparison_chart(dates, temps_by_city)
+
+    def _on_batch_comparison_failed(self, error: Exception):
+        self.batch_compare_btn.config(state="normal")
+        messagebox.showerror("Error", f"Failed to compare cities: {str(error)}")
+        self.clear_comparison_chart()
+
+    def _on_comparison_failed(self, error: Exception):
+        self.on_city_selection()
+        messagebox.showerror("Error", f"Failed to compare cities: {str(error)}")
+        self.clear_comparison_chart()
 
     def setup_forecast_display(self):
         """Initialize the 5-day forecast display with empty StringVars"""
@@ -872,80 +1301,53 @@ class WeatherDashboard:
         """
         Draw a bar chart showing 5-day temperature trends in the chart tab.
 
+        The figure and canvas are created once and updated in place on later calls.
+
         Args:
             data: List of tuples containing (date_string, temperature)
         """
         try:
             # Store the current chart data for unit conversion
             self.current_chart_data = data
-            
-            # Clear existing chart
-            for widget in self.chart_container.winfo_children():
-                widget.destroy()
+            if "chart" not in self._built_tabs:
+                # Drawn when the tab is first opened
+                return
 
             if not data:
                 # Show empty chart message
-                empty_label = ttk.Label(self.chart_container, text="No temperature data available", 
-                                       font=("Arial", 14))
-                empty_label.pack(expand=True)
+                self._show_chart_message("No temperature data available", font=("Arial", 14))
                 return
 
-            # Create matplotlib figure
-            fig = Figure(figsize=(8, 5), dpi=80)
-            ax = fig.add_subplot(111)
-
             # Unpack data and convert temperatures
             dates, temps_c = zip(*data)
-            temps = [self.convert_temperature_value(temp_c) for temp_c in temps_c]
-
-            # Create bar chart
-            bars = ax.bar(dates, temps, color='lightblue', edgecolor='darkblue', alpha=0.8, width=0.6)
-
-            # Get unit symbol for labels
             unit = self.unit_var.get()
-            unit_symbol = "°C" if "Celsius" in unit else "°F" if "Fahrenheit" in unit else "K"
-
-            # Customize chart
-            ax.set_title("5-Day Temperature Trend", fontsize=16, fontweight='bold', pad=20)
-            ax.set_ylabel(f"Temperature ({unit_symbol})", fontsize=14)
-            ax.tick_params(axis='x', rotation=0, labelsize=12)
-            ax.tick_params(axis='y', labelsize=12)
-            ax.grid(True, alpha=0.3, axis='y')
-
-            # Add temperature labels on bars
-            for bar, temp_c in zip(bars, temps_c):
-                height = bar.get_height()
-                temp_str = self.convert_temperature(temp_c)
-                ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                       temp_str, ha='center', va='bottom', fontsize=11, fontweight='bold')
-
-            # Set y-axis limits for better visibility
-            if temps:
-                min_temp = min(temps)
-                max_temp = max(temps)
-                temp_range = max_temp - min_temp
-                padding = max(temp_range * 0.2, 3)
-                ax.set_ylim(min_temp - padding, max_temp + padding)
-
-            # Adjust layout
-            fig.tight_layout(pad=2.0)
-
-            # Create canvas and add to chart container
-            self.chart_canvas = FigureCanvasTkAgg(fig, master=self.chart_container)
-            self.chart_canvas.draw()
-            self.chart_canvas.get_tk_widget().pack(fill='both', expand=True)
+            temps = units.convert(temps_c, unit).tolist()
+            labels = units.format_values(temps, unit)
+            unit_symbol = units.unit_symbol(unit)
+
+            self._hide_chart_message()
+            if self.temperature_chart is None:
+                self.temperature_chart = TemperatureChart(self.chart_container)
+            self.temperature_chart.update(list(dates), temps, labels, unit_symbol)
 
         except Exception as e:
             # Handle chart drawing errors
-            for widget in self.chart_container.winfo_children():
-                widget.destroy()
-            error_label = ttk.Label(self.chart_container, 
-                                   text=f"Chart Error: {str(e)}", 
-                                   font=("Arial", 12),
-                                   foreground="red")
-            error_label.pack(expand=True)
+            self._show_chart_message(f"Chart Error: {str(e)}", font=("Arial", 12), foreground="red")
             print(f"Error drawing temperature chart: {e}")
 
+    def _show_chart_message(self, text: str, **options):
+        """Hide the temperature chart and show a message in its place"""
+        if self.temperature_chart is not None:
+            self.temperature_chart.hide()
+        self._hide_chart_message()
+        self.chart_message_label = ttk.Label(self.chart_container, text=text, **options)
+        self.chart_message_label.pack(expand=True)
+
+    def _hide_chart_message(self):
+        if self.chart_message_label is not None:
+            self.chart_message_label.destroy()
+            self.chart_message_label = None
+
     def draw_comparison_chart(self, dates: List[str], temps1: List[float], temps2: List[float], label1: str, label2: str):
         """
         Draw a side-by-side bar chart comparing temperatures between two cities.
@@ -957,111 +1359,81 @@ class WeatherDashboard:
             label1: Name of city 1
             label2: Name of city 2
         """
+        if not temps1 or not temps2:
+            self.draw_multi_comparison_chart(dates, {})
+            return
+        self.draw_multi_comparison_chart(dates, {label1: temps1, label2: temps2})
+
+    def draw_multi_comparison_chart(self, dates: List[str], temps_by_city: Dict[str, List[float]]):
+        """
+        Draw one grouped bar chart comparing temperatures for any number of cities.
+
+        The figure and canvas are created once; bars are reused while the number of
+        dates and cities stays the same and rebuilt on the same axes otherwise.
+
+        Args:
+            dates: List of date strings
+            temps_by_city: Temperatures in Celsius per city name, aligned with dates
+        """
         try:
             # Store the current comparison data for unit conversion
-            self.current_comparison_data = (dates, temps1, temps2, label1, label2)
-            
-            # Clear existing chart
-            for widget in self.comparison_chart_frame.winfo_children():
-                widget.destroy()
+            self.current_comparison_data = (dates, temps_by_city)
+            if "comparison" not in self._built_tabs:
+                return
 
-            if not dates or not temps1 or not temps2:
+            if not dates or not temps_by_city:
                 # Show empty chart message
-                empty_label = ttk.Label(self.comparison_chart_frame, 
-                                       text="No comparison data available", 
-                                       font=("Arial", 14))
-                empty_label.grid(row=0, column=0, sticky="nsew")
+                self._show_comparison_message("No comparison data available", font=("Arial", 14))
                 return
 
-            # Create matplotlib figure
-            fig = Figure(figsize=(10, 6), dpi=80)
-            ax = fig.add_subplot(111)
-
-            # Convert temperatures to selected unit
-            converted_temps1 = [self.convert_temperature_value(temp) for temp in temps1]
-            converted_temps2 = [self.convert_temperature_value(temp) for temp in temps2]
-
-            # Set up bar positions
-            x = np.arange(len(dates))
-            width = 0.35
+            unit = self.unit_var.get()
+            converted = units.convert_series(temps_by_city, unit)
+            value_labels = {label: units.format_values(values, unit) for label, values in converted.items()}
+            unit_symbol = units.unit_symbol(unit)
 
-            # Create side-by-side bars
-            bars1 = ax.bar(x - width/2, converted_temps1, width, label=label1, color='lightblue', alpha=0.8, edgecolor='darkblue')
-            bars2 = ax.bar(x + width/2, converted_temps2, width, label=label2, color='lightcoral', alpha=0.8, edgecolor='darkred')
+            self._hide_comparison_message()
+            if self.comparison_chart is None:
+                self.comparison_chart = ComparisonChart(self.comparison_chart_frame)
+            self.comparison_chart.update(list(dates), converted, value_labels, unit_symbol)
 
-            # Get unit symbol for labels
-            unit = self.unit_var.get()
-            unit_symbol = "°C" if "Celsius" in unit else "°F" if "Fahrenheit" in unit else "K"
-
-            # Customize chart
-            ax.set_title(f"5-Day Temperature Comparison: {label1} vs {label2}", fontsize=16, fontweight='bold', pad=20)
-            ax.set_ylabel(f"Temperature ({unit_symbol})", fontsize=14)
-            ax.set_xlabel("Date", fontsize=14)
-            ax.set_xticks(x)
-            ax.set_xticklabels(dates, rotation=45, ha='right')
-            ax.legend(fontsize=12)
-            ax.grid(True, alpha=0.3, axis='y')
-
-            # Add temperature labels on bars using original Celsius values
-            for bars, temps_c in [(bars1, temps1), (bars2, temps2)]:
-                for bar, temp_c in zip(bars, temps_c):
-                    height = bar.get_height()
-                    temp_str = self.convert_temperature(temp_c)
-                    ax.text(bar.get_x() + bar.get_width()/2., height + 0.5,
-                           temp_str, ha='center', va='bottom', fontsize=10, fontweight='bold')
-
-            # Set y-axis limits for better visibility
-            all_temps = converted_temps1 + converted_temps2
-            if all_temps:
-                min_temp = min(all_temps)
-                max_temp = max(all_temps)
-                temp_range = max_temp - min_temp
-                padding = max(temp_range * 0.15, 3)
-                ax.set_ylim(min_temp - padding, max_temp + padding)
-
-            # Adjust layout to prevent clipping
-            fig.tight_layout()
-
-            # Create canvas and add to comparison frame
-            self.comparison_canvas = FigureCanvasTkAgg(fig, master=self.comparison_chart_frame)
-            self.comparison_canvas.draw()
-            self.comparison_canvas.get_tk_widget().grid(row=0, column=0, sticky="nsew")
-
-            print(f"Comparison chart drawn successfully for {label1} vs {label2}")  # Debug info
+            print(f"Comparison chart drawn successfully for {', '.join(temps_by_city)}")  # Debug info
 
         except Exception as e:
             # Handle chart drawing errors
-            for widget in self.comparison_chart_frame.winfo_children():
-                widget.destroy()
-            error_label = ttk.Label(self.comparison_chart_frame, 
-                                   text=f"Chart Error: {str(e)}", 
-                                   font=("Arial", 12),
-                                   foreground="red")
-            error_label.grid(row=0, column=0, sticky="nsew")
+            self._show_comparison_message(f"Chart Error: {str(e)}", font=("Arial", 12), foreground="red")
             print(f"Error drawing comparison chart: {e}")
 
+    def _show_comparison_message(self, text: str, **options):
+        """Hide the comparison chart and show a message in its place"""
+        if self.comparison_chart is not None:
+            self.comparison_chart.hide()
+        self._hide_comparison_message()
+        self.comparison_message_label = ttk.Label(self.comparison_chart_frame, text=text, **options)
+        self.comparison_message_label.grid(row=0, column=0, sticky="nsew")
+
+    def _hide_comparison_message(self):
+        if self.comparison_message_label is not None:
+            self.comparison_message_label.destroy()
+            self.comparison_message_label = None
+
     def clear_temperature_chart(self):
         """Clear the temperature chart display"""
+        self.current_chart_data = None
         try:
-            for widget in self.chart_container.winfo_children():
-                widget.destroy()
-            self.chart_canvas = None
+            self._hide_chart_message()
+            if self.temperature_chart is not None:
+                self.temperature_chart.hide()
         except Exception as e:
             print(f"Error clearing chart: {e}")
 
     def clear_comparison_chart(self):
         """Clear the comparison chart display"""
+        self.current_comparison_data = None
+        if "comparison" not in self._built_tabs:
+            return
         try:
-            for widget in self.comparison_chart_frame.winfo_children():
-                widget.destroy()
-            self.comparison_canvas = None
-            
             # Show placeholder again
-            placeholder_label = ttk.Label(self.comparison_chart_frame, 
-                                         text="Select two cities from the dropdowns above and click 'Compare' to see\ntheir 5-day temperature comparison chart.",
-                                         font=("Arial", 14),
-                                         justify='center')
-            placeholder_label.grid(row=0, column=0, sticky="nsew")
+            self._show_comparison_message(self.COMPARISON_PLACEHOLDER, font=("Arial", 14), justify='center')
         except Exception as e:
             print(f"Error clearing comparison chart: {e}")
 
@@ -1147,7 +1519,14 @@ class WeatherDashboard:
         self.apply_theme(next_theme)
         self.settings_manager.save_theme(next_theme)
 
-    def get_weather(self):
+    def get_weather(self, revalidate: bool = False):
+        """
+        Fetch weather, forecast and chart data for the city in the search box.
+
+        Args:
+            revalidate: Last-known data for this city is already on screen; if the
+                refresh fails it stays there (marked stale) with no error dialog
+        """
         city = self.city_entry.get().strip()
         if not city:
             messagebox.showwarning("Warning", "Please enter a city name")
@@ -1160,39 +1539,142 @@ class WeatherDashboard:
             greeting = get_personalized_greeting(name)
             self.greeting_label.config(text=greeting)
 
-        try:
-            weather_data = self.weather_service.get_weather(city)
-            if weather_data:
-                self.display_weather(weather_data)
-                # Save to CSV
-                save_weather_to_csv(weather_data)
-                # Refresh history display
-                self.refresh_history()
-                # Save city to settings
-                self.settings_manager.save_last_city(city)
-                self.current_city = city
-
-                # Get and display 5-day forecast
-                try:
-                    forecast_data = self.weather_service.get_5_day_forecast(city)
-                    self.update_forecast_display(forecast_data)
-                except Exception as forecast_error:
-                    print(f"Forecast error: {forecast_error}")
-                    self.display_forecast_error(str(forecast_error))
+        # Current weather, forecast cards and chart data are fetched concurrently
+        # on worker threads; results come back through root.after. Each search
+        # gets a generation number so late results from an older search are dropped.
+        self._search_generation += 1
+        generation = self._search_generation
+        if revalidate:
+            self._revalidation_generation = generation
+        self.get_weather_btn.config(state="disabled")
+
+        self.task_runner.submit(
+            self.weather_service.get_weather_entry, city,
+            on_success=lambda entry: self._on_weather_loaded(generation, city, *entry),
+            on_error=lambda e: self._on_weather_failed(generation, e))
+        self.task_runner.submit(
+            self.weather_service.get_5_day_forecast, city,
+            on_success=lambda data: self._on_forecast_loaded(generation, data),
+            on_error=lambda e: self._on_forecast_failed(generation, e))
+        self.task_runner.submit(
+            self.weather_service.get_5_day_temperatures, city,
+            on_success=lambda data: self._on_chart_loaded(generation, data),
+            on_error=lambda e: self._on_chart_failed(generation, e))
+
+    def toggle_pin_city(self):
+        """Pin the city in the search box (or the shown city), or unpin it if already pinned"""
+        city = self.city_entry.get().strip() or self.current_city
+        if not city:
+            messagebox.showwarning("Warning", "Please enter a city name")
+            return
+        if self.settings_manager.is_pinned(city):
+            self.settings_manager.unpin_city(city)
+        else:
+            self.settings_manager.pin_city(city)
+            # Fetch the new city in the background now rather than at the next cycle
+            self.refresh_scheduler.refresh_now()
 
-                # Get and display 5-day temperature chart
-                try:
-                    temp_data = self.weather_service.get_5_day_temperatures(city)
-                    self.draw_temperature_chart(temp_data)
-                except Exception as chart_error:
-                    print(f"Temperature chart error: {chart_error}")
-                    self.clear_temperature_chart()
-            else:
-                messagebox.showerror("Error", f"Weather data not found for {city}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to get weather data: {str(e)}")
-            self.clear_forecast_display()
-            self.clear_temperature_chart()
+    def on_watched_city_selected(self, event=None):
+        """Switch to a watched city, painting cached data straight away"""
+        city = self.watched_city_var.get().strip()
+        if not city:
+            return
+        self.city_entry.delete(0, tk.END)
+        self.city_entry.insert(0, city)
+        shown = self.show_last_known_weather(city)
+        # Served from the cache when the background refresh kept it fresh
+        self.get_weather(revalidate=shown)
+
+    def _update_watch_list(self):
+        """Refresh the scheduler's watch list and the pinned-city controls from settings"""
+        pinned = self.settings_manager.get_pinned_cities()
+        self.refresh_scheduler.set_watch_list([self.settings_manager.get_last_city()] + pinned)
+        self.watched_city_dropdown.config(values=pinned)
+
+        city = self.city_entry.get().strip() or self.current_city
+        pinned_now = bool(city) and self.settings_manager.is_pinned(city)
+        self.pin_btn.config(text="Unpin City 📌" if pinned_now else "Pin City 📌")
+
+    def _on_city_refreshed(self, city: str, endpoints: List[str]):
+        """Repaint the shown city when the background refresh brought new data for it"""
+        if not self.current_city or city.lower() != self.current_city.lower():
+            return
+        if str(self.get_weather_btn['state']) != "normal":
+            # A search is in flight; its own results will be shown
+            return
+        self.show_last_known_weather(city)
+
+    def _is_current_search(self, generation: int) -> bool:
+        """Whether results for this search should still be shown"""
+        return generation == self._search_generation and generation != self._failed_generation
+
+    def _on_weather_loaded(self, generation: int, city: str, weather_data: dict, fetched_at: datetime):
+        """Show current weather once the background fetch finishes"""
+        if generation != self._search_generation:
+            return
+        self.get_weather_btn.config(state="normal")
+
+        if not weather_data:
+            messagebox.showerror("Error", f"Weather data not found for {city}")
+            return
+
+        self.display_weather(weather_data)
+        # Cached data keeps the time it was downloaded, not the time it was shown
+        self._set_data_status(fetched_at)
+        # Save to search history and show just the new row
+        saved_row = self.history_store.append(weather_data)
+        self.add_history_entry(saved_row)
+        # Save city to settings
+        self.settings_manager.save_last_city(city)
+        self.current_city = city
+
+    def _is_revalidation(self, generation: int) -> bool:
+        return generation == self._revalidation_generation
+
+    def _on_weather_failed(self, generation: int, error: Exception):
+        if generation != self._search_generation:
+            return
+        self.get_weather_btn.config(state="normal")
+        if self._is_revalidation(generation):
+            # Keep the last-known data on screen and just mark it stale
+            print(f"Weather refresh failed: {error}")
+            self._set_data_status(self._shown_fetched_at, refresh_failed=True)
+            return
+        self._failed_generation = generation
+        messagebox.showerror("Error", f"Failed to get weather data: {str(error)}")
+        self.clear_forecast_display()
+        self.clear_temperature_chart()
+
+    def _on_forecast_loaded(self, generation: int, forecast_data: List[Dict]):
+        if self._is_current_search(generation):
+            self.update_forecast_display(forecast_data)
+
+    def _on_forecast_failed(self, generation: int, error: Exception):
+        if self._is_current_search(generation):
+            print(f"Forecast error: {error}")
+            if not self._is_revalidation(generation):
+                self.display_forecast_error(str(error))
+
+    def _on_chart_loaded(self, generation: int, temp_data: List[Tuple[str, float]]):
+        if self._is_current_search(generation):
+            self.draw_temperature_chart(temp_data)
+
+    def _on_chart_failed(self, generation: int, error: Exception):
+        if self._is_current_search(generation):
+            print(f"Temperature chart error: {error}")
+            if not self._is_revalidation(generation):
+                self.clear_temperature_chart()
+
+    def on_close(self):
+        """Stop background work and close the window"""
+        self.refresh_scheduler.stop()
+        for unsubscribe in self._settings_subscriptions:
+            unsubscribe()
+        self.task_runner.shutdown()
+        self.weather_service.close()
+        self.history_store.close()
+        self.settings_manager.flush()
+        self.root.destroy()
 
     def display_weather(self, weather_data):
         """Display weather data in the GUI"""
@@ -1200,9 +1682,8 @@ class WeatherDashboard:
         self.current_weather_data = weather_data
         
         self.city_label.config(text=f"{weather_data['city']}, {weather_data['country']}")
-        self.temp_label.config(text=f"🌡️ Temperature: {self.convert_temperature(weather_data['temperature'])}")
         self.desc_label.config(text=f"🌦️ Condition: {weather_data['description'].title()}")
-        self.feels_like_label.config(text=f"🤗 Feels like: {self.convert_temperature(weather_data['feels_like'])}")
+        self.show_weather_temperatures(weather_data)
         self.humidity_label.config(text=f"💧 Humidity: {weather_data['humidity']}%")
         self.pressure_label.config(text=f"🔽 Pressure: {weather_data['pressure']} hPa")
 
@@ -1210,11 +1691,17 @@ class WeatherDashboard:
         phrase = get_weather_phrase(weather_data['temperature'], weather_data['description'])
         self.phrase_label.config(text=phrase, font=get_emoji_font(11))
 
+    def show_weather_temperatures(self, weather_data):
+        """Show the temperature and feels-like values in the selected unit"""
+        self.temp_label.config(text=f"🌡️ Temperature: {self.convert_temperature(weather_data['temperature'])}")
+        self.feels_like_label.config(text=f"🤗 Feels like: {self.convert_temperature(weather_data['feels_like'])}")
+
     def update_forecast_display(self, forecast_data: List[Dict]):
         """Update the forecast display with new data"""
         try:
             # Store the current forecast data for unit conversion
             self.current_forecast_data = forecast_data
+            self.forecast_error = None
             
             for i, day_data in enumerate(forecast_data[:5]):  # Ensure max 5 days
                 if i < len(self.forecast_vars):
@@ -1236,6 +1723,8 @@ class WeatherDashboard:
 
     def clear_forecast_display(self):
         """Clear the forecast display"""
+        self.current_forecast_data = None
+        self.forecast_error = None
         for forecast_var in self.forecast_vars:
             forecast_var['date'].set("")
             forecast_var['temp'].set("")
@@ -1244,6 +1733,7 @@ class WeatherDashboard:
     def display_forecast_error(self, error_message: str):
         """Display error message in forecast frame"""
         self.clear_forecast_display()
+        self.forecast_error = error_message
         # Show error in the first forecast slot
         if self.forecast_vars:
             self.forecast_vars[0]['date'].set("Forecast")
@@ -1253,7 +1743,7 @@ class WeatherDashboard:
     def show_history(self):
         """Show weather history in a new window"""
         try:
-            history_data = read_last_n_entries(10)  # Get last 10 entries
+            history_data = self.history_store.last_n(10)  # Get last 10 entries
             if not history_data:
                 messagebox.showinfo("History", "No weather history available")
                 return
@@ -1287,8 +1777,8 @@ class WeatherDashboard:
                     f"{entry['city']}, {entry['country']}",
                     f"{float(entry['temperature']):.1f}°C",
                     entry['description'].title(),
-                    f"{int(entry['humidity'])}%",
-                    f"{int(entry['pressure'])} hPa"
+                    f"{int(float(entry['humidity']))}%",
+                    f"{int(float(entry['pressure']))} hPa"
                 ))
 
         except Exception as e:
@@ -1297,7 +1787,8 @@ class WeatherDashboard:
     def display_stats(self):
         """Display weather statistics in a new window"""
         try:
-            stats = calculate_stats_from_csv()
+            stats = self.history_store.stats()
+            recent_stats = self.history_store.stats(days=30)
             if not stats:
                 messagebox.showinfo("Statistics", "No weather data available for statistics")
                 return
@@ -1305,7 +1796,7 @@ class WeatherDashboard:
             # Create stats window
             stats_window = tk.Toplevel(self.root)
             stats_window.title("Weather Statistics 📈")
-            stats_window.geometry("500x400")
+            stats_window.geometry("500x450")
 
             # Main frame
             main_frame = ttk.Frame(stats_window, padding="20")
@@ -1326,6 +1817,8 @@ class WeatherDashboard:
                       font=("Arial", 12)).pack(anchor="w", pady=2)
             ttk.Label(stats_frame, text=f"Lowest Temperature: {stats['min_temp']:.1f}°C",
                       font=("Arial", 12)).pack(anchor="w", pady=2)
+            ttk.Label(stats_frame, text=f"Temperature Spread (std. dev.): {stats['temp_stddev']:.1f}°C",
+                      font=("Arial", 12)).pack(anchor="w", pady=2)
 
             # Cities frame
             cities_frame = ttk.LabelFrame(main_frame, text="Most Searched Cities", padding="15")
@@ -1345,6 +1838,11 @@ class WeatherDashboard:
                       font=("Arial", 12)).pack(anchor="w", pady=2)
             ttk.Label(general_frame, text=f"Average Pressure: {stats['avg_pressure']:.1f} hPa",
                       font=("Arial", 12)).pack(anchor="w", pady=2)
+            if recent_stats:
+                ttk.Label(general_frame,
+                          text=f"Last 30 Days: {recent_stats['total_searches']} searches, "
+                               f"avg {recent_stats['avg_temp']:.1f}°C",
+                          font=("Arial", 12)).pack(anchor="w", pady=2)
 
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load statistics: {str(e)}")
@@ -1355,6 +1853,7 @@ def main():
     root = tk.Tk()
     app = WeatherDashboard(root)
     root.mainloop()
+    close_session()
 
 
 if __name__ == "__main__":
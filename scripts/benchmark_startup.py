@@ -0,0 +1,138 @@
+"""
+Startup benchmark for VibeCast.
+
+Reports two things, each measured in a fresh interpreter:
+- the `python -X importtime` breakdown of `import main`, slowest modules first
+- wall-clock time from process start until the first window has been drawn
+
+It also lists which heavy libraries (matplotlib, pandas, numpy, seaborn) were
+already imported when the first window appeared; they are meant to load only
+when a chart or data tab needs them.
+
+Usage:
+    python scripts/benchmark_startup.py [--runs 5] [--top 25] [--max-seconds 2.0] [--strict]
+
+Exits with status 1 when the median time to first window exceeds --max-seconds,
+or with --strict when a heavy library was loaded before the first window.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEAVY_MODULES = ("matplotlib", "pandas", "numpy", "seaborn")
+
+# Runs in the child process: build the dashboard, draw it once, report and exit
+# before any scheduled network refresh fires.
+FIRST_WINDOW_SCRIPT = """
+import sys, time
+import tkinter as tk
+import main
+root = tk.Tk()
+app = main.WeatherDashboard(root)
+root.update()
+ready = time.perf_counter()
+loaded = [name for name in {heavy!r} if name in sys.modules]
+print("READY", ready, ",".join(loaded), flush=True)
+app.on_close()
+"""
+
+
+def import_time_breakdown(top: int) -> Tuple[List[Tuple[int, int, str]], int]:
+    """
+    Run `python -X importtime -c "import main"` and parse its report.
+
+    Args:
+        top: Number of modules to return
+
+    Returns:
+        Tuple of ([(self_us, cumulative_us, module), ...] slowest first, total_us)
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import main"],
+                            cwd=PROJECT_ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise Exception(f"'import main' failed:\n{result.stderr[-2000:]}")
+
+    rows = []
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+        # Top-level imports are the ones without indentation; their cumulative times add up
+        if not module.startswith("  ", 1):
+            total += int(cumulative_us)
+
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return rows[:top], total
+
+
+def time_to_first_window() -> Tuple[float, List[str]]:
+    """
+    Start the app in a fresh interpreter and time it until the first window is drawn.
+
+    Returns:
+        Tuple of (seconds, heavy modules already imported at that point)
+    """
+    script = FIRST_WINDOW_SCRIPT.format(heavy=HEAVY_MODULES)
+    started = time.perf_counter()
+    process = subprocess.Popen([sys.executable, "-c", script], cwd=PROJECT_ROOT,
+                               stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    elapsed = None
+    loaded: List[str] = []
+    for line in process.stdout:
+        if line.startswith("READY"):
+            elapsed = time.perf_counter() - started
+            parts = line.split()
+            loaded = parts[2].split(",") if len(parts) > 2 else []
+            break
+    _, stderr = process.communicate()
+    if elapsed is None:
+        raise Exception(f"The dashboard did not open:\n{stderr[-2000:]}")
+    return elapsed, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure VibeCast startup time")
+    parser.add_argument("--runs", type=int, default=5, help="Launches to time (default 5)")
+    parser.add_argument("--top", type=int, default=25, help="Modules to list from -X importtime")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Fail when the median time to first window is above this")
+    parser.add_argument("--strict", action="store_true",
+                        help="Fail when matplotlib/pandas/numpy/seaborn load before the first window")
+    args = parser.parse_args()
+
+    rows, total_us = import_time_breakdown(args.top)
+    print(f"import main: {total_us / 1000:.1f} ms total (python -X importtime)")
+    print(f"{'self ms':>9} {'cumul ms':>9}  module")
+    for self_us, cumulative_us, module in rows:
+        print(f"{self_us / 1000:9.1f} {cumulative_us / 1000:9.1f}  {module}")
+
+    timings = []
+    loaded: List[str] = []
+    for _ in range(max(1, args.runs)):
+        elapsed, loaded = time_to_first_window()
+        timings.append(elapsed)
+    median = statistics.median(timings)
+    print(f"\nTime to first window over {len(timings)} run(s): "
+          f"median {median:.3f}s, min {min(timings):.3f}s, max {max(timings):.3f}s")
+    print(f"Heavy modules loaded before first window: {', '.join(loaded) or 'none'}")
+
+    failed = False
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"FAIL: median {median:.3f}s exceeds {args.max_seconds:.3f}s")
+        failed = True
+    if args.strict and loaded:
+        print(f"FAIL: {', '.join(loaded)} imported during startup")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,64 +1,213 @@
 """
 Caching service for weather API responses.
 """
-from typing import Optional, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
+from services.disk_cache import DiskCache
+
 
 class WeatherCache:
     """
-    Simple in-memory cache for weather data.
-    Future implementation could use Redis or file-based caching.
+    Bounded in-memory LRU cache for weather data with per-endpoint TTLs.
+
+    Entries are keyed by (endpoint, city) so current weather and forecast
+    payloads for the same city can expire independently. When the cache is
+    full the least recently used entry is evicted.
+
+    An optional DiskCache can be attached as a second tier: writes go through
+    to disk, and memory misses are answered from disk while still fresh.
     """
     
-    def __init__(self, ttl_minutes: int = 10):
+    def __init__(self, ttl_minutes: int = 10, max_entries: int = 128,
+                 endpoint_ttls: Optional[Dict[str, int]] = None,
+                 persistent: Optional[DiskCache] = None, units: str = "metric"):
         """
-        Initialize cache with time-to-live setting.
+        Initialize cache with time-to-live and size settings.
         
         Args:
-            ttl_minutes: Cache time-to-live in minutes
+            ttl_minutes: Default cache time-to-live in minutes
+            max_entries: Maximum number of entries kept before evicting
+            endpoint_ttls: Optional per-endpoint TTLs in minutes, e.g. {"forecast": 30}
+            persistent: Optional on-disk tier that survives restarts
+            units: Unit system of the cached responses (part of the disk key)
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[Tuple[str, str], Dict[str, Any]]" = OrderedDict()
         self._ttl = timedelta(minutes=ttl_minutes)
+        self._endpoint_ttls = {
+            endpoint: timedelta(minutes=minutes)
+            for endpoint, minutes in (endpoint_ttls or {}).items()
+        }
+        self._max_entries = max(1, max_entries)
+        self._persistent = persistent
+        self._units = units
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @staticmethod
+    def _key(city: str, endpoint: str) -> Tuple[str, str]:
+        return endpoint, city.lower().strip()
+
+    def ttl_for(self, endpoint: str) -> timedelta:
+        """Return the time-to-live used for an endpoint."""
+        return self._endpoint_ttls.get(endpoint, self._ttl)
     
-    def get(self, city: str) -> Optional[Dict[str, Any]]:
+    def get(self, city: str, endpoint: str = "weather") -> Optional[Dict[str, Any]]:
         """
         Get cached weather data for a city.
         
         Args:
             city: City name
+            endpoint: API endpoint the data came from ("weather", "forecast", ...)
             
         Returns:
             Cached weather data or None if not found/expired
         """
-        city_key = city.lower().strip()
-        
-        if city_key not in self._cache:
-            return None
-        
-        cache_entry = self._cache[city_key]
-        
-        # Check if cache entry is expired
-        if datetime.now() - cache_entry['timestamp'] > self._ttl:
-            del self._cache[city_key]
-            return None
-        
-        return cache_entry['data']
+        entry = self.get_entry(city, endpoint)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, city: str, endpoint: str = "weather") -> Optional[Tuple[Any, datetime]]:
+        """
+        Get cached data for a city together with the time it was downloaded.
+
+        Args:
+            city: City name
+            endpoint: API endpoint the data came from
+
+        Returns:
+            Tuple of (data, fetched_at) or None if not found/expired
+        """
+        key = self._key(city, endpoint)
+        ttl = self.ttl_for(endpoint)
+
+        with self._lock:
+            cache_entry = self._cache.get(key)
+            if cache_entry is not None:
+                # Check if cache entry is expired
+                if datetime.now() - cache_entry['timestamp'] <= ttl:
+                    self._cache.move_to_end(key)
+                    self._hits += 1
+                    return cache_entry['data'], cache_entry['timestamp']
+                del self._cache[key]
+                self._expirations += 1
+
+        # Fall back to the disk tier and promote fresh entries into memory
+        if self._persistent is not None:
+            stored = self._persistent.get(endpoint, city, self._units)
+            if stored is not None and datetime.now() - stored[1] <= ttl:
+                data, stored_at = stored
+                with self._lock:
+                    self._store_locked(key, data, stored_at)
+                    self._disk_hits += 1
+                return data, stored_at
+
+        with self._lock:
+            self._misses += 1
+        return None
+
+    def get_stale(self, city: str, endpoint: str = "weather") -> Optional[Tuple[Any, datetime]]:
+        """
+        Get the last known data for a city even if its TTL has expired.
+
+        Used to paint something immediately (e.g. on startup) while fresh
+        data is fetched.
+
+        Args:
+            city: City name
+            endpoint: API endpoint the data came from
+
+        Returns:
+            Tuple of (data, fetched_at) or None if nothing was ever cached
+        """
+        key = self._key(city, endpoint)
+        with self._lock:
+            cache_entry = self._cache.get(key)
+            if cache_entry is not None:
+                return cache_entry['data'], cache_entry['timestamp']
+
+        if self._persistent is not None:
+            return self._persistent.get(endpoint, city, self._units)
+        return None
     
-    def set(self, city: str, weather_data: Dict[str, Any]) -> None:
+    def set(self, city: str, weather_data: Any, endpoint: str = "weather") -> datetime:
         """
         Cache weather data for a city.
         
         Args:
             city: City name
             weather_data: Weather data to cache
+            endpoint: API endpoint the data came from
+
+        Returns:
+            The time stored with the entry
         """
-        city_key = city.lower().strip()
-        self._cache[city_key] = {
-            'data': weather_data,
-            'timestamp': datetime.now()
+        key = self._key(city, endpoint)
+        now = datetime.now()
+
+        with self._lock:
+            self._store_locked(key, weather_data, now)
+
+        if self._persistent is not None:
+            self._persistent.set(endpoint, city, weather_data, self._units, stored_at=now)
+        return now
+
+    def _store_locked(self, key: Tuple[str, str], data: Any, timestamp: datetime) -> None:
+        """Insert an entry and evict least recently used ones; caller holds the lock."""
+        self._cache[key] = {
+            'data': data,
+            'timestamp': timestamp
         }
+        self._cache.move_to_end(key)
+
+        while len(self._cache) > self._max_entries:
+            self._cache.popitem(last=False)
+            self._evictions += 1
+
+    def invalidate(self, city: str, endpoint: Optional[str] = None) -> None:
+        """
+        Drop cached data for a city.
+
+        Args:
+            city: City name
+            endpoint: Only drop this endpoint's entry; all endpoints if None
+        """
+        city_key = city.lower().strip()
+        with self._lock:
+            keys = [k for k in self._cache
+                    if k[1] == city_key and (endpoint is None or k[0] == endpoint)]
+            for key in keys:
+                del self._cache[key]
+
+        if self._persistent is not None:
+            self._persistent.delete(endpoint, city, self._units)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit/miss/eviction counters and the current size."""
+        with self._lock:
+            return {
+                'size': len(self._cache),
+                'max_entries': self._max_entries,
+                'hits': self._hits,
+                'disk_hits': self._disk_hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'expirations': self._expirations,
+            }
     
     def clear(self) -> None:
-        """Clear all cached data."""
-        self._cache.clear()
+        """Clear all cached data, including the disk tier."""
+        with self._lock:
+            self._cache.clear()
+        if self._persistent is not None:
+            self._persistent.clear()
+
+    def close(self) -> None:
+        """Close the disk tier; the in-memory tier keeps working."""
+        if self._persistent is not None:
+            self._persistent.close()
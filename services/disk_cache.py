@@ -0,0 +1,127 @@
+"""
+SQLite-backed persistent tier for the weather response cache.
+"""
+import json
+import sqlite3
+import threading
+from datetime import datetime, timedelta
+from typing import Optional, Any, Tuple
+
+
+class DiskCache:
+    """
+    Stores API responses on disk keyed by (endpoint, city, units).
+
+    Entries keep the time they were stored so callers can decide whether
+    they are fresh enough to use, or only good for a last-known preview.
+    """
+
+    def __init__(self, path: str, max_age_hours: int = 72):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file
+            max_age_hours: Entries older than this are deleted on open
+        """
+        self._path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            " endpoint TEXT NOT NULL,"
+            " city TEXT NOT NULL,"
+            " units TEXT NOT NULL,"
+            " stored_at TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " PRIMARY KEY (endpoint, city, units))"
+        )
+        cutoff = datetime.now() - timedelta(hours=max_age_hours)
+        self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (cutoff.isoformat(),))
+        self._conn.commit()
+
+    def get(self, endpoint: str, city: str, units: str = "metric") -> Optional[Tuple[Any, datetime]]:
+        """
+        Read a stored response regardless of its age.
+
+        Args:
+            endpoint: API endpoint name ("weather", "forecast", ...)
+            city: City name
+            units: Unit system the response was requested in
+
+        Returns:
+            Tuple of (data, stored_at) or None if nothing is stored or the
+            database cannot be read (locked, corrupt or closed)
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT payload, stored_at FROM responses WHERE endpoint = ? AND city = ? AND units = ?",
+                    (endpoint, city.lower().strip(), units)
+                ).fetchone()
+        except sqlite3.Error as e:
+            print(f"Error reading disk cache: {e}")
+            return None
+        if row is None:
+            return None
+
+        try:
+            return json.loads(row[0]), datetime.fromisoformat(row[1])
+        except (ValueError, TypeError):
+            return None
+
+    def set(self, endpoint: str, city: str, data: Any, units: str = "metric",
+            stored_at: Optional[datetime] = None) -> None:
+        """
+        Store a response, replacing any previous one for the same key.
+
+        Args:
+            endpoint: API endpoint name
+            city: City name
+            data: JSON-serialisable response data
+            units: Unit system the response was requested in
+            stored_at: Time the data was fetched (defaults to now)
+        """
+        stored_at = stored_at or datetime.now()
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (endpoint, city, units, stored_at, payload)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (endpoint, city.lower().strip(), units, stored_at.isoformat(), json.dumps(data))
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error writing disk cache: {e}")
+
+    def delete(self, endpoint: Optional[str], city: str, units: str = "metric") -> None:
+        """Remove stored responses for a city (all endpoints if endpoint is None)."""
+        try:
+            with self._lock:
+                if endpoint is None:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE city = ? AND units = ?",
+                        (city.lower().strip(), units)
+                    )
+                else:
+                    self._conn.execute(
+                        "DELETE FROM responses WHERE endpoint = ? AND city = ? AND units = ?",
+                        (endpoint, city.lower().strip(), units)
+                    )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error deleting from disk cache: {e}")
+
+    def clear(self) -> None:
+        """Remove all stored responses."""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error clearing disk cache: {e}")
+
+    def close(self) -> None:
+        """Close the database connection; later calls behave as cache misses."""
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,109 @@
+"""
+Shared HTTP session for OpenWeatherMap requests.
+
+All API clients go through one pooled requests.Session so TCP/TLS connections
+are kept alive and reused instead of being re-opened on every call.
+"""
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config.constants import (
+    HTTP_POOL_CONNECTIONS,
+    HTTP_POOL_MAXSIZE,
+    HTTP_MAX_RETRIES,
+    HTTP_BACKOFF_FACTOR,
+    HTTP_RETRY_STATUSES,
+)
+
+_session: Optional[requests.Session] = None
+_session_lock = threading.Lock()
+_settings = {
+    "pool_connections": HTTP_POOL_CONNECTIONS,
+    "pool_maxsize": HTTP_POOL_MAXSIZE,
+    "max_retries": HTTP_MAX_RETRIES,
+    "backoff_factor": HTTP_BACKOFF_FACTOR,
+    "retry_statuses": HTTP_RETRY_STATUSES,
+}
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a pooled, retrying adapter mounted for http and https."""
+    retry = Retry(
+        total=_settings["max_retries"],
+        backoff_factor=_settings["backoff_factor"],
+        status_forcelist=_settings["retry_statuses"],
+        allowed_methods=frozenset(["GET"]),
+        # Hand the last response back so callers can still inspect status codes
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=_settings["pool_connections"],
+        pool_maxsize=_settings["pool_maxsize"],
+        max_retries=retry,
+    )
+
+    session = requests.Session()
+    session.headers.update({"Connection": "keep-alive"})
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def get_session() -> requests.Session:
+    """
+    Return the process-wide HTTP session, creating it on first use.
+
+    Returns:
+        Shared requests.Session with connection pooling and retry/backoff
+    """
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = _build_session()
+    return _session
+
+
+def configure_session(pool_connections: Optional[int] = None,
+                      pool_maxsize: Optional[int] = None,
+                      max_retries: Optional[int] = None,
+                      backoff_factor: Optional[float] = None,
+                      retry_statuses: Optional[tuple] = None) -> None:
+    """
+    Change pool and retry settings. The current session is closed and a new one
+    is built with the updated settings on the next get_session() call.
+
+    Args:
+        pool_connections: Number of host pools to keep
+        pool_maxsize: Maximum connections kept alive per host
+        max_retries: Total retries for failed GET requests
+        backoff_factor: Exponential backoff factor between retries (seconds)
+        retry_statuses: HTTP status codes that trigger a retry
+    """
+    updates = {
+        "pool_connections": pool_connections,
+        "pool_maxsize": pool_maxsize,
+        "max_retries": max_retries,
+        "backoff_factor": backoff_factor,
+        "retry_statuses": retry_statuses,
+    }
+    with _session_lock:
+        _settings.update({key: value for key, value in updates.items() if value is not None})
+        _close_locked()
+
+
+def close_session() -> None:
+    """Close the shared session and release its pooled connections."""
+    with _session_lock:
+        _close_locked()
+
+
+def _close_locked() -> None:
+    global _session
+    if _session is not None:
+        _session.close()
+        _session = None
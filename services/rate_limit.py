@@ -0,0 +1,115 @@
+"""
+Token-bucket rate limiting shared by every OpenWeatherMap request.
+"""
+import threading
+import time
+from typing import Callable, Optional
+
+from config.constants import RATE_LIMIT_PER_MINUTE, RATE_LIMIT_BURST
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request cannot get a token from the rate limiter."""
+
+
+class TokenBucket:
+    """
+    Classic token bucket: `rate_per_minute` tokens are added continuously, up
+    to `capacity`, and each request takes one.
+
+    Foreground requests queue for a token; background work uses try_acquire
+    with a reserve so it never spends the last few tokens a user search needs.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[int] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 sleep: Callable[[float], None] = time.sleep):
+        """
+        Args:
+            rate_per_minute: Sustained number of requests allowed per minute
+            capacity: Largest burst allowed (defaults to one minute's worth)
+            clock: Monotonic time source in seconds
+            sleep: Waits the given number of seconds (paired with clock)
+        """
+        self._rate = rate_per_minute / 60.0
+        self._capacity = float(capacity if capacity is not None else rate_per_minute)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill_locked(self) -> None:
+        now = self._clock()
+        self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def available(self) -> float:
+        """Number of tokens currently in the bucket (negative while requests are queued)"""
+        with self._lock:
+            self._refill_locked()
+            return self._tokens
+
+    def try_acquire(self, tokens: int = 1, reserve: int = 0) -> bool:
+        """
+        Take tokens without waiting.
+
+        Args:
+            tokens: Tokens needed
+            reserve: Tokens that must remain in the bucket afterwards
+
+        Returns:
+            bool: True if the tokens were taken
+        """
+        with self._lock:
+            self._refill_locked()
+            if self._tokens - tokens < reserve:
+                return False
+            self._tokens -= tokens
+            return True
+
+    def acquire(self, tokens: int = 1, timeout: Optional[float] = None) -> bool:
+        """
+        Take tokens, waiting for the bucket to refill if needed.
+
+        Waiting requests are served in arrival order: each one books its tokens
+        straight away, letting the bucket go negative, and then sleeps until the
+        refill reaches its place in the queue. The wait therefore grows with the
+        number of requests queued ahead, and a batch drains at the sustained rate.
+
+        Args:
+            tokens: Tokens needed
+            timeout: Longest wait in seconds; None waits as long as it takes
+
+        Returns:
+            bool: False if the tokens would not be available within the timeout
+        """
+        with self._lock:
+            self._refill_locked()
+            shortfall = tokens - self._tokens
+            if shortfall <= 0:
+                wait = 0.0
+            elif self._rate <= 0:
+                return False
+            else:
+                wait = shortfall / self._rate
+            if timeout is not None and wait > timeout:
+                return False
+            self._tokens -= tokens
+
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+
+_limiter: Optional[TokenBucket] = None
+_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> TokenBucket:
+    """Return the process-wide OpenWeatherMap request budget"""
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = TokenBucket(RATE_LIMIT_PER_MINUTE, capacity=RATE_LIMIT_BURST)
+        return _limiter
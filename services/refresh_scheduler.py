@@ -0,0 +1,141 @@
+"""
+Background auto-refresh of watched cities.
+"""
+import random
+from typing import Callable, Dict, List, Optional
+
+from services.rate_limit import RateLimitExceeded
+
+
+class RefreshScheduler:
+    """
+    Keeps a watch list of cities fresh in the weather cache.
+
+    Timing runs on Tk's event loop (root.after) and each refresh cycle runs on
+    the dashboard's TkTaskRunner, so results come back on the main thread.
+    Each cycle visits the watch list in order. `refresh_city` is expected to
+    skip endpoints whose cache entries are still within their TTL and to
+    raise RateLimitExceeded when the shared request budget is used up, which
+    ends the cycle early. Delays between cycles are randomised by +/- jitter
+    so several dashboards do not refresh in lockstep.
+    """
+
+    def __init__(self, root, runner, refresh_city: Callable[[str], List[str]],
+                 interval_seconds: float, jitter_seconds: float = 0.0,
+                 on_refreshed: Optional[Callable[[str, List[str]], None]] = None):
+        """
+        Args:
+            root: Tk root window used for timing
+            runner: TkTaskRunner the refresh cycles run on
+            refresh_city: Refreshes one city; returns the endpoints it downloaded
+            interval_seconds: Time between refresh cycles
+            jitter_seconds: Largest random change to each interval
+            on_refreshed: Called on the main thread with (city, endpoints) after new data arrives
+        """
+        self._root = root
+        self._runner = runner
+        self._refresh_city = refresh_city
+        self._interval_seconds = interval_seconds
+        self._jitter_seconds = jitter_seconds
+        self._on_refreshed = on_refreshed
+        self._watch_list: List[str] = []
+        self._after_id = None
+        self._running = False
+        self._cycle_pending = False
+
+    @property
+    def interval_seconds(self) -> float:
+        return self._interval_seconds
+
+    def set_interval(self, interval_seconds: float) -> None:
+        """Change the refresh interval; takes effect from the next scheduled cycle"""
+        self._interval_seconds = max(1.0, interval_seconds)
+        if self._running and not self._cycle_pending:
+            self._schedule(self._next_delay())
+
+    def set_watch_list(self, cities: List[str]) -> None:
+        """Replace the watched cities, dropping blanks and case-insensitive duplicates"""
+        seen = set()
+        watch_list = []
+        for city in cities:
+            city = (city or "").strip()
+            if city and city.lower() not in seen:
+                seen.add(city.lower())
+                watch_list.append(city)
+        self._watch_list = watch_list
+
+    def watch_list(self) -> List[str]:
+        return list(self._watch_list)
+
+    def start(self, initial_delay_seconds: Optional[float] = None) -> None:
+        """Start refreshing; the first cycle runs after `initial_delay_seconds` (default: one interval)"""
+        self._running = True
+        delay = self._next_delay() if initial_delay_seconds is None else initial_delay_seconds
+        self._schedule(delay)
+
+    def stop(self) -> None:
+        """Stop scheduling cycles; a cycle already running finishes but reports nothing"""
+        self._running = False
+        self._cancel()
+
+    def refresh_now(self) -> None:
+        """Run a cycle as soon as possible instead of waiting for the timer"""
+        if self._running and not self._cycle_pending:
+            self._schedule(0)
+
+    def _next_delay(self) -> float:
+        jitter = random.uniform(-self._jitter_seconds, self._jitter_seconds) if self._jitter_seconds else 0.0
+        return max(1.0, self._interval_seconds + jitter)
+
+    def _schedule(self, delay_seconds: float) -> None:
+        self._cancel()
+        self._after_id = self._root.after(int(delay_seconds * 1000), self._tick)
+
+    def _cancel(self) -> None:
+        if self._after_id is not None:
+            self._root.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _tick(self) -> None:
+        self._after_id = None
+        if not self._running:
+            return
+        if not self._watch_list:
+            self._schedule(self._next_delay())
+            return
+
+        self._cycle_pending = True
+        self._runner.submit(self._refresh_all, list(self._watch_list),
+                            on_success=self._on_cycle_done,
+                            on_error=self._on_cycle_failed)
+
+    def _refresh_all(self, cities: List[str]) -> Dict[str, List[str]]:
+        """Worker thread: refresh each watched city whose cached data has expired"""
+        refreshed = {}
+        for city in cities:
+            try:
+                endpoints = self._refresh_city(city)
+            except RateLimitExceeded:
+                # The rest of the list waits for the next cycle
+                break
+            except Exception as e:
+                print(f"Auto-refresh failed for {city}: {e}")
+                continue
+            if endpoints:
+                refreshed[city] = endpoints
+        return refreshed
+
+    def _on_cycle_done(self, refreshed: Dict[str, List[str]]) -> None:
+        self._cycle_pending = False
+        if not self._running:
+            return
+        if self._on_refreshed is not None:
+            for city, endpoints in refreshed.items():
+                self._on_refreshed(city, endpoints)
+        self._schedule(self._next_delay())
+
+    def _on_cycle_failed(self, error: Exception) -> None:
+        self._cycle_pending = False
+        print(f"Auto-refresh cycle failed: {error}")
+        if self._running:
+            self._schedule(self._next_delay())
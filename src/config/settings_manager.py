@@ -3,109 +3,94 @@ Settings Manager
 
 Handles application settings persistence using JSON configuration file.
 Supports theme preferences, last searched city, and other user preferences.
+
+Values live in the process-wide SettingsService, so this manager shares one
+snapshot and one settings.json with the main dashboard. The light/dark theme
+is stored as 'appearance_theme' because 'theme' holds the dashboard's colour
+scheme.
 """
-import json
 import os
 from typing import Optional, Dict, Any
 
+from config.settings_service import SettingsService, get_settings_service
+
+DEFAULT_SETTINGS: Dict[str, Any] = {
+    'theme': 'light',
+    'last_city': '',
+    'window_geometry': '800x600',
+    'auto_load_last_city': True
+}
+
+# Keys of this manager -> keys in the shared settings service
+SERVICE_KEYS: Dict[str, str] = {
+    'theme': 'appearance_theme',
+    'last_city': 'last_city',
+    'window_geometry': 'window_geometry',
+    'auto_load_last_city': 'auto_load_last_city'
+}
+
 
 class SettingsManager:
     """Manages application settings with JSON file persistence."""
     
-    def __init__(self):
-        """Initialize settings manager and load configuration."""
-        self._config_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'data')
-        self._config_path = os.path.join(self._config_dir, 'settings.json')
-        self._config: Dict[str, Any] = {}
+    def __init__(self, service: Optional[SettingsService] = None):
+        """Initialize settings manager on top of the shared settings service."""
+        self._service = service or get_settings_service()
         
-        # Ensure config directory exists
-        os.makedirs(self._config_dir, exist_ok=True)
-        
-        # Load existing configuration or create default
-        self._load_config()
-    
-    def _load_config(self) -> None:
-        """Load configuration from JSON file or create default config."""
-        try:
-            if os.path.exists(self._config_path):
-                with open(self._config_path, 'r', encoding='utf-8') as f:
-                    self._config = json.load(f)
-            else:
-                # Create default configuration
-                self._config = {
-                    'theme': 'light',
-                    'last_city': '',
-                    'window_geometry': '800x600',
-                    'auto_load_last_city': True
-                }
-                self._save_config()
-        except (json.JSONDecodeError, IOError) as e:
-            print(f"Warning: Could not load settings file. Using defaults. Error: {e}")
-            self._config = {
-                'theme': 'light',
-                'last_city': '',
-                'window_geometry': '800x600',
-                'auto_load_last_city': True
-            }
+        # Settings used to be kept in data/settings.json; carry them over once
+        legacy_path = os.path.join(os.path.dirname(__file__), '..', '..', 'data', 'settings.json')
+        self._service.import_legacy(legacy_path, key_map=SERVICE_KEYS)
     
-    def _save_config(self) -> None:
-        """Save current configuration to JSON file."""
-        try:
-            with open(self._config_path, 'w', encoding='utf-8') as f:
-                json.dump(self._config, f, indent=2, ensure_ascii=False)
-        except IOError as e:
-            print(f"Warning: Could not save settings file. Error: {e}")
+    def flush(self) -> None:
+        """Write any pending settings changes now."""
+        self._service.flush()
     
     def get_theme(self) -> str:
         """Return the saved theme, defaulting to 'light' if unset."""
-        return self._config.get('theme', 'light')
+        theme = self._service.get_str('appearance_theme', 'light')
+        return theme if theme in ['light', 'dark'] else 'light'
     
     def save_theme(self, theme: str) -> None:
-        """Save the selected theme and write back to settings.json."""
+        """Save the selected theme."""
         if theme in ['light', 'dark']:
-            self._config['theme'] = theme
-            self._save_config()
+            self._service.set('appearance_theme', theme)
         else:
             raise ValueError(f"Invalid theme '{theme}'. Must be 'light' or 'dark'.")
     
     def get_last_city(self) -> Optional[str]:
         """Return the last searched city, or None if not set."""
-        last_city = self._config.get('last_city', '')
+        last_city = self._service.get_str('last_city')
         return last_city if last_city else None
     
     def save_last_city(self, city: str) -> None:
         """Save the last searched city."""
-        self._config['last_city'] = city.strip()
-        self._save_config()
+        self._service.set('last_city', city.strip())
     
     def get_window_geometry(self) -> str:
         """Return the saved window geometry."""
-        return self._config.get('window_geometry', '800x600')
+        return self._service.get_str('window_geometry', '800x600')
     
     def save_window_geometry(self, geometry: str) -> None:
         """Save the window geometry."""
-        self._config['window_geometry'] = geometry
-        self._save_config()
+        self._service.set('window_geometry', geometry)
     
     def get_auto_load_last_city(self) -> bool:
         """Return whether to automatically load the last searched city."""
-        return self._config.get('auto_load_last_city', True)
+        return self._service.get_bool('auto_load_last_city', True)
     
     def save_auto_load_last_city(self, auto_load: bool) -> None:
         """Save the auto-load last city preference."""
-        self._config['auto_load_last_city'] = auto_load
-        self._save_config()
+        self._service.set('auto_load_last_city', auto_load)
     
     def get_all_settings(self) -> Dict[str, Any]:
         """Return a copy of all current settings."""
-        return self._config.copy()
+        return {
+            'theme': self.get_theme(),
+            'last_city': self._service.get_str('last_city'),
+            'window_geometry': self.get_window_geometry(),
+            'auto_load_last_city': self.get_auto_load_last_city()
+        }
     
     def reset_to_defaults(self) -> None:
         """Reset all settings to default values."""
-        self._config = {
-            'theme': 'light',
-            'last_city': '',
-            'window_geometry': '800x600',
-            'auto_load_last_city': True
-        }
-        self._save_config()
+        self._service.update({SERVICE_KEYS[key]: value for key, value in DEFAULT_SETTINGS.items()})
@@ -1,16 +1,127 @@
 """
 Utility functions for loading/saving CSV/JSON data.
 """
-import pandas as pd
 import json
+import os
+import sqlite3
+from contextlib import closing
+from urllib.request import pathname2url
 
-def load_team_data(csv_path):
+from features.tracker import FIELDNAMES
+from utils.lazy import lazy_import
+
+# pandas is imported on first use so importing this module stays cheap
+pd = lazy_import("pandas")
+
+# File extensions handled by the columnar export/import helpers
+PARQUET_EXTENSIONS = (".parquet", ".pq")
+ARROW_EXTENSIONS = (".feather", ".arrow", ".ipc")
+
+# Declared dtypes for the team dataset (both spellings used in team files).
+# Repeated labels become categoricals and measures are stored as float32.
+TEAM_DATA_DTYPES = {
+    "city": "category", "City": "category",
+    "country": "category", "Country": "category",
+    "description": "category", "Description": "category",
+    "weather_description": "category", "weather_main": "category",
+    "temperature": "float32", "Temperature": "float32",
+    "temp": "float32", "temp_f": "float32",
+    "feels_like": "float32",
+    "humidity": "float32", "Humidity": "float32", "humidity_pct": "float32",
+    "pressure": "float32", "Pressure": "float32",
+    "wind_speed": "float32", "Wind Speed": "float32",
+}
+
+def _team_read_options(csv_path, usecols=None, dtype=None):
+    """
+    Build read_csv keyword arguments, keeping only dtypes for columns that will be read.
+
+    Category (and other non-numeric) dtypes are declared up front. Numeric measure
+    columns are returned separately and coerced after reading: a declared float
+    dtype only fails when read_csv reaches the bad row, which for a chunked read
+    is after earlier chunks have already been handed out.
+
+    Returns:
+        Tuple of (read_csv options, {measure column: dtype})
+    """
+    dtype = TEAM_DATA_DTYPES if dtype is None else dtype
+    header = pd.read_csv(csv_path, nrows=0).columns
+    columns = [col for col in header if usecols is None or col in usecols]
+    declared = {col: dtype[col] for col in columns if col in dtype}
+    numeric = {col: kind for col, kind in declared.items()
+               if pd.api.types.is_numeric_dtype(pd.api.types.pandas_dtype(kind))}
+    options = {"dtype": {col: kind for col, kind in declared.items() if col not in numeric}}
+    if usecols is not None:
+        options["usecols"] = columns
+    return options, numeric
+
+def _read_team_csv(csv_path, options, numeric):
+    """read_csv with declared dtypes; measure columns are coerced (bad values become NaN)."""
+    return _coerce_numeric(pd.read_csv(csv_path, **options), numeric)
+
+def _coerce_numeric(frame, columns):
+    for col, kind in columns.items():
+        if col in frame:
+            values = pd.to_numeric(frame[col], errors="coerce")
+            # Integer dtypes cannot hold the NaN left by a bad value
+            frame[col] = values.astype(kind) if pd.api.types.is_float_dtype(kind) else values
+    return frame
+
+def load_team_data(csv_path, usecols=None, dtype=None):
+    """
+    Load the team dataset with declared dtypes.
+
+    Args:
+        csv_path: Team CSV file
+        usecols: Only read these columns (others are never parsed)
+        dtype: Column dtypes (defaults to TEAM_DATA_DTYPES)
+    """
     try:
-        return pd.read_csv(csv_path)
+        options, numeric = _team_read_options(csv_path, usecols, dtype)
+        return _read_team_csv(csv_path, options, numeric)
     except Exception as e:
         print(f"Error loading team data: {e}")
         return pd.DataFrame()
 
+def iter_team_data(csv_path, chunksize=50000, usecols=None, dtype=None):
+    """
+    Yield the team dataset in DataFrame chunks of `chunksize` rows.
+
+    Read errors are raised to the caller rather than ending the stream early,
+    so aggregates are never silently built from part of the file.
+    """
+    options, numeric = _team_read_options(csv_path, usecols, dtype)
+    with pd.read_csv(csv_path, chunksize=chunksize, **options) as reader:
+        for chunk in reader:
+            yield _coerce_numeric(chunk, numeric)
+
+def aggregate_team_data(csv_path, on_chunk, initial=None, chunksize=50000, usecols=None, dtype=None):
+    """
+    Stream the team dataset through an aggregation hook without holding it all in memory.
+
+    Args:
+        on_chunk: Called as on_chunk(state, chunk) for each chunk; returns the new state
+        initial: Starting state
+    """
+    state = initial
+    # closing() releases the file even when on_chunk raises part-way through
+    with closing(iter_team_data(csv_path, chunksize, usecols, dtype)) as chunks:
+        for chunk in chunks:
+            state = on_chunk(state, chunk)
+    return state
+
+def mean_by_city(csv_path, value_column="Temperature", city_column="City", chunksize=50000):
+    """Average of one column per city, computed chunk by chunk."""
+    def add_chunk(totals, chunk):
+        grouped = chunk.groupby(city_column, observed=True)[value_column].agg(["sum", "count"])
+        return grouped if totals is None else totals.add(grouped, fill_value=0)
+
+    totals = aggregate_team_data(csv_path, add_chunk, chunksize=chunksize,
+                                 usecols=[city_column, value_column])
+    if totals is None:
+        return pd.Series(dtype="float32")
+    return (totals["sum"] / totals["count"]).rename(value_column)
+
 def export_to_csv(data, filename):
     try:
         data.to_csv(filename, index=False)
@@ -26,3 +137,95 @@ def export_to_json(data, filename):
     except Exception as e:
         print(f"Error exporting to JSON: {e}")
         return False
+
+def export_to_parquet(data, filename, compression="zstd"):
+    """Write a DataFrame as Parquet (needs pyarrow). compression: zstd, snappy, gzip or None."""
+    try:
+        data.to_parquet(filename, index=False, compression=compression)
+        return True
+    except Exception as e:
+        print(f"Error exporting to Parquet: {e}")
+        return False
+
+def export_to_arrow(data, filename, compression="lz4"):
+    """Write a DataFrame as an Arrow IPC (Feather v2) file. compression: lz4, zstd or None."""
+    try:
+        data.reset_index(drop=True).to_feather(filename, compression=compression)
+        return True
+    except Exception as e:
+        print(f"Error exporting to Arrow: {e}")
+        return False
+
+def export_columnar(data, filename, compression=None):
+    """Export to Parquet or Arrow IPC depending on the file extension."""
+    extension = os.path.splitext(filename)[1].lower()
+    if extension in ARROW_EXTENSIONS:
+        return export_to_arrow(data, filename, **({"compression": compression} if compression else {}))
+    return export_to_parquet(data, filename, **({"compression": compression} if compression else {}))
+
+def load_columnar(filename, columns=None):
+    """
+    Load a Parquet or Arrow IPC file, reading only the requested columns.
+
+    Columnar formats store each column separately, so e.g.
+    columns=["timestamp", "temperature"] never touches the other columns.
+    """
+    try:
+        extension = os.path.splitext(filename)[1].lower()
+        if extension in ARROW_EXTENSIONS:
+            return pd.read_feather(filename, columns=columns)
+        return pd.read_parquet(filename, columns=columns)
+    except Exception as e:
+        print(f"Error loading columnar data: {e}")
+        return pd.DataFrame()
+
+def load_history_data(path="weather_history.sqlite3", columns=None):
+    """
+    Load the weather search history from its SQLite database or CSV log.
+
+    Args:
+        path: History database (.sqlite3/.db) or CSV file
+        columns: Only load these columns; each must be one of FIELDNAMES
+    """
+    try:
+        if columns is not None:
+            unknown = [col for col in columns if col not in FIELDNAMES]
+            if unknown:
+                raise ValueError(f"Unknown history columns: {', '.join(unknown)}")
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"History file not found: {path}")
+        if path.endswith((".sqlite3", ".db")):
+            # Column names are checked against FIELDNAMES above, so they are safe to inline
+            selected = ", ".join(columns) if columns else "*"
+            uri = "file:" + pathname2url(os.path.abspath(path)) + "?mode=ro"
+            with closing(sqlite3.connect(uri, uri=True)) as conn:
+                frame = pd.read_sql_query(f"SELECT {selected} FROM history ORDER BY timestamp", conn)
+            return frame.drop(columns=["id"], errors="ignore")
+        return pd.read_csv(path, usecols=columns)
+    except Exception as e:
+        print(f"Error loading history data: {e}")
+        return pd.DataFrame()
+
+def export_history_columnar(filename, history_path="weather_history.sqlite3", compression=None):
+    """Archive the weather search history as Parquet/Arrow."""
+    data = load_history_data(history_path)
+    if data.empty:
+        return False
+    data["timestamp"] = pd.to_datetime(data["timestamp"], errors="coerce")
+    return export_columnar(data, filename, compression)
+
+def export_journal_columnar(filename, journal_path="journal.csv", compression=None):
+    """Archive the weather journal as Parquet/Arrow."""
+    try:
+        data = pd.read_csv(journal_path)
+    except Exception as e:
+        print(f"Error loading journal: {e}")
+        return False
+    return export_columnar(data, filename, compression)
+
+def export_team_data_columnar(filename, csv_path, compression=None):
+    """Convert the team dataset to Parquet/Arrow."""
+    data = load_team_data(csv_path)
+    if data.empty:
+        return False
+    return export_columnar(data, filename, compression)
@@ -1,9 +1,11 @@
 """
 Feature: Temperature Graph using matplotlib/seaborn.
 """
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+from utils.lazy import lazy_import
+
+plt = lazy_import("matplotlib.pyplot")
+sns = lazy_import("seaborn")
+pd = lazy_import("pandas")
 
 def plot_temperature_graph(weather_data, city):
     # weather_data: list of dicts with 'temperature' and 'date'
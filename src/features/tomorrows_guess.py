@@ -1,9 +1,12 @@
 """
 Simple weather prediction feature.
 """
-import numpy as np
 from typing import List, Optional
 
+from utils.lazy import lazy_import
+
+np = lazy_import("numpy")
+
 def predict_tomorrow_temperature(current_temp: float, history: List[float]) -> float:
     """
     Predict tomorrow's temperature based on current temperature and historical data.
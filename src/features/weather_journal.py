@@ -1,26 +1,55 @@
 """
 Feature: Weather Journal logic.
 """
-import pandas as pd
+import csv
+import os
 from datetime import datetime
 
+from utils.lazy import lazy_import
+
+pd = lazy_import("pandas")
+
 class WeatherJournal:
+    COLUMNS = ["date", "city", "temperature", "notes"]
+
     def __init__(self, filename="journal.csv"):
         self.filename = filename
-        try:
-            self.df = pd.read_csv(filename)
-        except Exception:
-            self.df = pd.DataFrame(columns=["date", "city", "temperature", "notes"])
+        # Loaded on first get_entries(); new rows wait in _pending until then
+        self._df = None
+        self._pending = []
 
     def add_entry(self, city, temperature, notes):
+        """Append one entry to the journal file without rewriting it."""
         entry = {
             "date": datetime.now().strftime("%Y-%m-%d %H:%M"),
             "city": city,
             "temperature": temperature,
             "notes": notes
         }
-        self.df = pd.concat([self.df, pd.DataFrame([entry])], ignore_index=True)
-        self.df.to_csv(self.filename, index=False)
+        write_header = not os.path.exists(self.filename) or os.path.getsize(self.filename) == 0
+        with open(self.filename, "a", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=self.COLUMNS)
+            if write_header:
+                writer.writeheader()
+            writer.writerow(entry)
+
+        if self._df is not None:
+            self._pending.append(entry)
+        return entry
 
     def get_entries(self):
-        return self.df
+        """Return all entries as a DataFrame, folding in buffered rows once."""
+        if self._df is None:
+            try:
+                self._df = pd.read_csv(self.filename)
+            except Exception:
+                self._df = pd.DataFrame(columns=self.COLUMNS)
+        elif self._pending:
+            self._df = pd.concat([self._df, pd.DataFrame(self._pending, columns=self.COLUMNS)],
+                                 ignore_index=True)
+            self._pending = []
+        return self._df
+
+    @property
+    def df(self):
+        return self.get_entries()
@@ -4,28 +4,46 @@ Handles OpenWeatherMap API requests and error handling.
 import requests
 import os
 
+from config.constants import CACHE_MAX_ENTRIES, CACHE_TTL_MINUTES, RATE_LIMIT_WAIT_SECONDS
+from services.cache import WeatherCache
+from services.http_session import get_session
+from services.rate_limit import get_rate_limiter
+
 class WeatherAPIHandler:
-    def __init__(self, api_key):
+    def __init__(self, api_key, cache=None):
         self.api_key = api_key
         self.base_url = "https://api.openweathermap.org/data/2.5/weather"
+        self.cache = cache or WeatherCache(
+            ttl_minutes=CACHE_TTL_MINUTES["weather"],
+            max_entries=CACHE_MAX_ENTRIES,
+        )
 
     def fetch_weather(self, city):
+        cached = self.cache.get(city, "weather")
+        if cached is not None:
+            return cached
         params = {
             "q": city,
             "appid": self.api_key,
             "units": "metric"
         }
+        # Shares the request budget with the dashboard and its background refresh
+        if not get_rate_limiter().acquire(timeout=RATE_LIMIT_WAIT_SECONDS):
+            return {"error": "Too many requests. Please try again in a moment."}
         try:
-            response = requests.get(self.base_url, params=params, timeout=10)
+            response = get_session().get(self.base_url, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
-            return {
+            result = {
                 "temperature": data["main"]["temp"],
                 "humidity": data["main"]["humidity"],
                 "wind_speed": data["wind"]["speed"],
                 "description": data["weather"][0]["description"],
                 "city": data["name"]
             }
+            # Errors are never cached so the next call retries the network
+            self.cache.set(city, result, "weather")
+            return result
         except requests.exceptions.HTTPError:
             return {"error": "Invalid city name or API error."}
         except requests.exceptions.RequestException:
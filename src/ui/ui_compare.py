@@ -2,16 +2,19 @@
 Compare Cities page: team feature, data visualization.
 """
 import customtkinter as ctk
-import pandas as pd
 from src.data_utils import load_team_data
-import matplotlib.pyplot as plt
-import seaborn as sns
+from utils.lazy import lazy_import
+
+# The plotting stack loads when the first chart is shown
+plt = lazy_import("matplotlib.pyplot")
+sns = lazy_import("seaborn")
 
 class CompareCitiesPage(ctk.CTkFrame):
     def __init__(self, master, team_data_path, **kwargs):
         super().__init__(master, **kwargs)
         self.team_data_path = team_data_path
-        self.data = load_team_data(team_data_path)
+        # Only the plotted columns are read from the team file
+        self.data = load_team_data(team_data_path, usecols=["City", "Temperature"])
         self.compare_btn = ctk.CTkButton(self, text="Visualize Team Cities", command=self.visualize)
         self.compare_btn.pack(pady=10)
         self.result_label = ctk.CTkLabel(self, text="Team city data will appear here.")
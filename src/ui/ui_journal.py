@@ -4,10 +4,17 @@ Weather Journal page: add/view journal entries.
 import customtkinter as ctk
 from src.features.weather_journal import WeatherJournal
 
+# Number of journal entries rendered at once
+PAGE_SIZE = 100
+
 class JournalPage(ctk.CTkFrame):
     def __init__(self, master, **kwargs):
         super().__init__(master, **kwargs)
         self.journal = WeatherJournal()
+        # Page 0 shows the newest entries; higher pages go back in time
+        self.page = 0
+        self.total_entries = 0
+        self.shown_entries = 0
         self.city_entry = ctk.CTkEntry(self, placeholder_text="City")
         self.city_entry.pack(pady=5)
         self.temp_entry = ctk.CTkEntry(self, placeholder_text="Temperature")
@@ -18,19 +25,70 @@ class JournalPage(ctk.CTkFrame):
         self.add_btn.pack(pady=5)
         self.entries_label = ctk.CTkLabel(self, text="Journal Entries:")
         self.entries_label.pack(pady=5)
+        nav_frame = ctk.CTkFrame(self, fg_color="transparent")
+        nav_frame.pack(pady=5)
+        self.older_btn = ctk.CTkButton(nav_frame, text="◀ Older", width=80, command=self.show_older)
+        self.older_btn.pack(side="left", padx=5)
+        self.page_label = ctk.CTkLabel(nav_frame, text="")
+        self.page_label.pack(side="left", padx=5)
+        self.newer_btn = ctk.CTkButton(nav_frame, text="Newer ▶", width=80, command=self.show_newer)
+        self.newer_btn.pack(side="left", padx=5)
         self.entries_box = ctk.CTkTextbox(self)
         self.entries_box.pack(pady=5, fill="both", expand=True)
         self.refresh_entries()
 
+    @staticmethod
+    def _format_entry(entry):
+        return f"{entry['date']} | {entry['city']} | {entry['temperature']}°C | {entry['notes']}\n"
+
     def add_entry(self):
         city = self.city_entry.get()
         temp = self.temp_entry.get()
         notes = self.notes_entry.get()
-        self.journal.add_entry(city, temp, notes)
+        entry = self.journal.add_entry(city, temp, notes)
+        self.total_entries += 1
+
+        if self.page != 0 or self.shown_entries >= 2 * PAGE_SIZE:
+            # Jump back to (or re-window) the newest page
+            self.page = 0
+            self.refresh_entries()
+            return
+
+        # Newest page is showing: just append the one new line
+        self.entries_box.insert("end", self._format_entry(entry))
+        self.entries_box.see("end")
+        self.shown_entries += 1
+        self._update_navigation(self.total_entries - self.shown_entries, self.total_entries)
+
+    def show_older(self):
+        self.page += 1
+        self.refresh_entries()
+
+    def show_newer(self):
+        self.page = max(0, self.page - 1)
         self.refresh_entries()
 
     def refresh_entries(self):
+        """Render only the current page of entries in a single insert."""
         entries = self.journal.get_entries()
+        self.total_entries = len(entries)
+        end = max(0, self.total_entries - self.page * PAGE_SIZE)
+        start = max(0, end - PAGE_SIZE)
+        window = entries.iloc[start:end].fillna("").astype(str)
+
+        # Vectorized formatting of the visible rows
+        lines = (window["date"] + " | " + window["city"] + " | " + window["temperature"]
+                 + "°C | " + window["notes"] + "\n")
+
         self.entries_box.delete("1.0", "end")
-        for _, row in entries.iterrows():
-            self.entries_box.insert("end", f"{row['date']} | {row['city']} | {row['temperature']}°C | {row['notes']}\n")
+        self.entries_box.insert("end", "".join(lines.tolist()))
+        self.shown_entries = end - start
+        self._update_navigation(start, end)
+
+    def _update_navigation(self, start, end):
+        if self.total_entries:
+            self.page_label.configure(text=f"Entries {start + 1}-{end} of {self.total_entries}")
+        else:
+            self.page_label.configure(text="No entries yet")
+        self.older_btn.configure(state="normal" if start > 0 else "disabled")
+        self.newer_btn.configure(state="normal" if self.page > 0 else "disabled")
@@ -0,0 +1,45 @@
+"""
+Tests for features.charts.ComparisonChart.
+"""
+import unittest
+
+from utils.lazy import missing_modules
+
+from features.charts import ComparisonChart
+
+MISSING = missing_modules("matplotlib")
+
+
+class ComparisonTitleTests(unittest.TestCase):
+    def test_two_cities_are_named(self):
+        self.assertEqual(ComparisonChart.title_for(["Paris", "Lyon"]),
+                         "5-Day Temperature Comparison: Paris vs Lyon")
+
+    def test_city_count_is_singular_for_one(self):
+        self.assertEqual(ComparisonChart.title_for(["Paris"]), "5-Day Temperature Comparison: 1 City")
+        self.assertEqual(ComparisonChart.title_for(["A", "B", "C"]), "5-Day Temperature Comparison: 3 Cities")
+
+
+@unittest.skipIf(MISSING, f"{MISSING} is not installed")
+class ComparisonColourTests(unittest.TestCase):
+    def _colours_after_builds(self, names, builds):
+        from matplotlib.colors import to_hex
+        from matplotlib.figure import Figure
+
+        chart = ComparisonChart(master=None)
+        chart.figure = Figure()
+        chart.ax = chart.figure.add_subplot(111)
+        for _ in range(builds):
+            chart._build_artists(["Mon", "Tue"], names)
+        return [to_hex(bars.patches[0].get_facecolor(), keep_alpha=False) for bars in chart.bar_groups]
+
+    def test_colours_follow_city_position(self):
+        names = ["A", "B", "C"]
+        expected = ComparisonChart.SERIES_PALETTE[:3]
+        self.assertEqual(self._colours_after_builds(names, 1), expected)
+        # Rebuilding must not advance the axes colour cycle
+        self.assertEqual(self._colours_after_builds(names, 3), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
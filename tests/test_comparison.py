@@ -0,0 +1,47 @@
+"""
+Tests for the team-data comparisons in features.comparison.
+"""
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from features.comparison import compare_cities, compare_cities_batch
+from features.team_data import TeamDataStore
+
+
+class CompareCitiesBatchTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        rows = ["city,temperature,humidity,timestamp"]
+        for index in range(30):
+            rows.append(f"City{index},{index % 20},50,2024-01-01 10:00:00")
+        rows.append("City3,19,55,2024-01-02 10:00:00")
+        with os.fdopen(handle, "w", encoding="utf-8") as f:
+            f.write("\n".join(rows) + "\n")
+        patcher = mock.patch("features.comparison.get_team_store",
+                             return_value=TeamDataStore(self.path))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_every_requested_city_is_keyed_as_given(self):
+        cities = [f"City{index}" for index in range(30)] + ["Atlantis"]
+        result = compare_cities_batch(cities)
+        self.assertEqual(list(result), cities)
+        self.assertEqual(result["City7"]["temperature"], 7)
+        self.assertEqual(result["Atlantis"], {})
+
+    def test_latest_row_wins(self):
+        self.assertEqual(compare_cities_batch(["city3"])["city3"]["humidity"], 55)
+
+    def test_two_city_wrapper(self):
+        result = compare_cities("City1", "City2")
+        self.assertEqual(set(result), {"City1", "City2"})
+        self.assertEqual(result["City2"]["temperature"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Tests for src.data_utils.load_history_data.
+"""
+import gc
+import importlib.util
+import os
+import tempfile
+import unittest
+import warnings
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+
+@unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+class LoadHistoryDataTests(unittest.TestCase):
+    def setUp(self):
+        from features.history_store import SqliteHistoryStore
+
+        self.directory = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.directory, "history.sqlite3")
+        store = SqliteHistoryStore(self.db_path)
+        store.append({"city": "Paris", "country": "FR", "temperature": 12.5, "feels_like": 11.0,
+                      "description": "clear sky", "humidity": 40, "pressure": 1012})
+        store.close()
+
+    def tearDown(self):
+        for name in os.listdir(self.directory):
+            os.remove(os.path.join(self.directory, name))
+        os.rmdir(self.directory)
+
+    def test_loads_selected_columns_and_closes_connection(self):
+        from src.data_utils import load_history_data
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always", ResourceWarning)
+            frame = load_history_data(self.db_path, columns=["city", "temperature"])
+            gc.collect()
+        self.assertEqual(list(frame.columns), ["city", "temperature"])
+        self.assertEqual(frame["city"].tolist(), ["Paris"])
+        self.assertFalse([w for w in caught if issubclass(w.category, ResourceWarning)])
+
+    def test_missing_database_is_not_created(self):
+        from src.data_utils import load_history_data
+
+        missing = os.path.join(self.directory, "missing.sqlite3")
+        self.assertTrue(load_history_data(missing).empty)
+        self.assertFalse(os.path.exists(missing))
+
+    def test_unknown_columns_are_rejected(self):
+        from src.data_utils import load_history_data
+
+        frame = load_history_data(self.db_path, columns=["city", "1; DROP TABLE history"])
+        self.assertTrue(frame.empty)
+        self.assertEqual(len(load_history_data(self.db_path)), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,94 @@
+"""
+Tests for the history tab's incremental loading in main.WeatherDashboard.
+
+The dashboard methods run against fake widgets, so no Tk window is created.
+"""
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+
+from utils.lazy import missing_modules
+
+MISSING = missing_modules("tkinter", "dotenv", "requests", "matplotlib")
+
+
+class FakeTree:
+    def __init__(self):
+        self.rows = []
+
+    def insert(self, parent, index, values):
+        self.rows.append(values)
+
+
+class FakeLabel:
+    def config(self, text):
+        self.text = text
+
+
+class FakeRoot:
+    def __init__(self):
+        self.idle_callbacks = []
+
+    def after_idle(self, callback):
+        self.idle_callbacks.append(callback)
+
+
+class FakeScrollbar:
+    def set(self, first, last):
+        pass
+
+
+@unittest.skipIf(MISSING, f"{MISSING} is not installed")
+class HistoryPagingTests(unittest.TestCase):
+    def setUp(self):
+        from features.history_store import SqliteHistoryStore
+
+        main = importlib.import_module("main")
+        self.page_size = main.HISTORY_PAGE_SIZE
+        self.directory = tempfile.mkdtemp()
+        self.store = SqliteHistoryStore(os.path.join(self.directory, "history.sqlite3"))
+        # One full page plus a short last page of three rows
+        self.store.append_many({"city": f"City{i}", "country": "FR", "temperature": 10, "feels_like": 10,
+                                "description": "clear sky", "humidity": 40, "pressure": 1012}
+                               for i in range(self.page_size + 3))
+
+        self.dashboard = main.WeatherDashboard.__new__(main.WeatherDashboard)
+        self.dashboard.root = FakeRoot()
+        self.dashboard.history_store = self.store
+        self.dashboard.history_tree = FakeTree()
+        self.dashboard.history_count_label = FakeLabel()
+        self.dashboard._history_loaded = 0
+        self.dashboard._history_total = self.store.count()
+        self.dashboard._history_loading = False
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def test_short_last_page_is_counted_exactly(self):
+        self.dashboard.load_more_history()
+        self.dashboard.load_more_history()
+        self.assertEqual(self.dashboard._history_loaded, self.page_size + 3)
+        self.assertEqual(len(self.dashboard.history_tree.rows), self.page_size + 3)
+        self.assertEqual(self.dashboard.history_count_label.text,
+                         f"Showing {self.page_size + 3} of {self.page_size + 3} searches")
+
+    def test_repeated_scroll_callbacks_queue_one_page(self):
+        self.dashboard.load_more_history()
+        for _ in range(5):
+            self.dashboard._on_history_scroll(FakeScrollbar(), "0.9", "1.0")
+        self.assertEqual(len(self.dashboard.root.idle_callbacks), 1)
+
+        self.dashboard.root.idle_callbacks.pop()()
+        self.assertEqual(len(self.dashboard.history_tree.rows), self.page_size + 3)
+        self.assertFalse(self.dashboard._history_loading)
+
+        # Everything is loaded, so further scrolling queues nothing
+        self.dashboard._on_history_scroll(FakeScrollbar(), "0.9", "1.0")
+        self.assertEqual(self.dashboard.root.idle_callbacks, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Tests for the history store backends in features.history_store.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+from features.history_store import CsvHistoryStore, HistoryStore, SqliteHistoryStore, open_history_store
+from features.tracker import FIELDNAMES
+
+
+def _weather(city: str, temperature: float) -> dict:
+    return {"city": city, "country": "FR", "temperature": temperature, "feels_like": temperature,
+            "description": "clear sky", "humidity": 40, "pressure": 1012}
+
+
+class HistoryStoreInterfaceTests(unittest.TestCase):
+    def test_incomplete_backend_cannot_be_created(self):
+        class AppendOnly(HistoryStore):
+            def append_many(self, weather_records):
+                return list(weather_records)
+
+        with self.assertRaises(TypeError):
+            AppendOnly()
+
+
+class RecentHistoryOrderTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _check_newest_first(self, store: HistoryStore):
+        try:
+            for index, city in enumerate(["Paris", "Lyon", "Nice"]):
+                store.append(_weather(city, 10 + index))
+            cities = [entry["city"] for entry in store.recent_history(limit=2)]
+            self.assertEqual(cities, ["Nice, FR", "Lyon, FR"])
+            older = [entry["city"] for entry in store.recent_history(limit=2, offset=2)]
+            self.assertEqual(older, ["Paris, FR"])
+        finally:
+            store.close()
+
+    def test_csv_backend(self):
+        self._check_newest_first(CsvHistoryStore(os.path.join(self.directory, "history.csv")))
+
+    def test_sqlite_backend(self):
+        self._check_newest_first(SqliteHistoryStore(os.path.join(self.directory, "history.sqlite3")))
+
+
+class LegacyCsvImportTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.directory, "weather_history.csv")
+        self.db_path = os.path.join(self.directory, "history.sqlite3")
+        # Enough good rows to be inserted before the reader reaches the bad byte
+        lines = [",".join(FIELDNAMES).encode()]
+        lines += [f"2024-01-01 10:00:{i % 60:02d},Paris,FR,12,11,clear sky,40,1012".encode()
+                  for i in range(2000)]
+        lines.append(b"2024-01-02 10:00:00,S\xe3o Paulo,BR,25,26,clear sky,70,1010")
+        with open(self.csv_path, "wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_non_utf8_csv_falls_back_to_csv_store(self):
+        store = open_history_store("sqlite", self.csv_path, self.db_path)
+        try:
+            self.assertIsInstance(store, CsvHistoryStore)
+        finally:
+            store.close()
+
+    def test_failed_import_is_rolled_back(self):
+        store = SqliteHistoryStore(self.db_path)
+        try:
+            with self.assertRaises(UnicodeDecodeError):
+                store.import_csv(self.csv_path, batch_size=10)
+            self.assertEqual(store.count(), 0)
+        finally:
+            store.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
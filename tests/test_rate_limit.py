@@ -0,0 +1,92 @@
+"""
+Tests for the shared request budget in services.rate_limit.
+"""
+import os
+import threading
+import unittest
+from unittest import mock
+
+from config.constants import RATE_LIMIT_BURST, RATE_LIMIT_PER_MINUTE
+from services.rate_limit import TokenBucket
+from utils.lazy import missing_modules
+
+MISSING = missing_modules("tkinter", "dotenv", "requests", "matplotlib")
+
+
+class FakeClock:
+    """Clock that only moves when somebody sleeps."""
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds: float) -> None:
+        with self._lock:
+            self.now += seconds
+
+
+class TokenBucketTests(unittest.TestCase):
+    def test_waiting_requests_are_served_in_order(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, capacity=2, clock=clock.time, sleep=clock.sleep)
+        self.assertTrue(bucket.acquire(timeout=0))
+        self.assertTrue(bucket.acquire(timeout=0))
+        # Empty bucket at 1 token/second: the next request waits its turn
+        self.assertTrue(bucket.acquire(timeout=5))
+        self.assertAlmostEqual(clock.now, 1.0)
+
+    def test_request_beyond_the_timeout_is_refused_without_spending_a_token(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, capacity=1, clock=clock.time, sleep=clock.sleep)
+        bucket.acquire()
+        self.assertFalse(bucket.acquire(timeout=0.5))
+        self.assertAlmostEqual(bucket.available(), 0.0)
+
+    def test_background_reserve_is_kept(self):
+        clock = FakeClock()
+        bucket = TokenBucket(60, capacity=3, clock=clock.time, sleep=clock.sleep)
+        self.assertTrue(bucket.try_acquire(reserve=2))
+        self.assertFalse(bucket.try_acquire(reserve=2))
+
+
+class FakeResponse:
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        day = 24 * 60 * 60
+        return {"list": [{"dt": 1700000000 + i * day, "main": {"temp": 10.0 + i}} for i in range(5)]}
+
+
+@unittest.skipIf(MISSING, f"{MISSING} is not installed")
+class BatchComparisonRateLimitTests(unittest.TestCase):
+    def test_thirty_city_batch_is_not_rate_limited(self):
+        import main
+        from services.cache import WeatherCache
+
+        clock = FakeClock()
+        bucket = TokenBucket(RATE_LIMIT_PER_MINUTE, capacity=RATE_LIMIT_BURST,
+                             clock=clock.time, sleep=clock.sleep)
+        session = mock.Mock()
+        session.get.return_value = FakeResponse()
+        cities = [f"City{index}" for index in range(30)]
+
+        with mock.patch.dict(os.environ, {"API_KEY": "test"}), \
+                mock.patch.object(main, "get_session", return_value=session):
+            service = main.WeatherService(cache=WeatherCache(), rate_limiter=bucket)
+            dates, temps_by_city, errors = service.get_temperature_comparison_multi(cities)
+
+        self.assertEqual(errors, {})
+        self.assertEqual(list(temps_by_city), cities)
+        self.assertEqual(session.get.call_count, 30)
+        # The 20 requests beyond the burst were spread out at the sustained rate
+        per_request = 60.0 / RATE_LIMIT_PER_MINUTE
+        self.assertGreaterEqual(clock.now, (30 - RATE_LIMIT_BURST) * per_request - 1e-6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,53 @@
+"""
+Tests for the chunked team-data readers in src.data_utils.
+"""
+import importlib.util
+import os
+import tempfile
+import unittest
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+
+@unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+class ChunkedTeamDataTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        rows = ["City,Temperature"]
+        rows += [f"{'Paris' if i % 2 else 'Oslo'},{10 + i % 3}" for i in range(20)]
+        # Bad value in the last chunk only
+        rows += ["Paris,n/a", "Oslo,4"]
+        with os.fdopen(handle, "w") as f:
+            f.write("\n".join(rows) + "\n")
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_late_non_numeric_value_is_coerced_in_every_chunk(self):
+        from src.data_utils import iter_team_data
+
+        chunks = list(iter_team_data(self.path, chunksize=5))
+        self.assertEqual(sum(len(chunk) for chunk in chunks), 22)
+        for chunk in chunks:
+            self.assertEqual(str(chunk["Temperature"].dtype), "float32")
+        self.assertTrue(chunks[-1]["Temperature"].isna().any())
+
+    def test_mean_by_city_covers_the_whole_file(self):
+        from src.data_utils import mean_by_city, load_team_data
+
+        means = mean_by_city(self.path, chunksize=5)
+        expected = load_team_data(self.path).groupby("City", observed=True)["Temperature"].mean()
+        for city in ("Paris", "Oslo"):
+            self.assertAlmostEqual(float(means[city]), float(expected[city]), places=4)
+        # Oslo's late "4" must be included, so its mean is below the 10..12 range
+        self.assertLess(float(means["Oslo"]), 10.9)
+
+    def test_read_errors_are_raised_not_swallowed(self):
+        from src.data_utils import mean_by_city
+
+        with self.assertRaises(Exception):
+            mean_by_city(self.path, value_column="Missing", chunksize=5)
+
+
+if __name__ == "__main__":
+    unittest.main()
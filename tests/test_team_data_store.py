@@ -0,0 +1,45 @@
+"""
+Tests for features.team_data.TeamDataStore reloading.
+"""
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from features.team_data import TeamDataStore
+
+
+class TeamDataReloadTests(unittest.TestCase):
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+        # Enough rows that the reader gets past the first buffer before the bad byte
+        self.good_lines = ["city,temperature,humidity,timestamp"]
+        self.good_lines += [f"City{i},{i % 30 + 1},50,2024-01-01 10:00:00" for i in range(2000)]
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def _write(self, tail: bytes) -> None:
+        with open(self.path, "wb") as f:
+            f.write("\n".join(self.good_lines).encode() + b"\n" + tail)
+
+    def test_failed_read_is_not_kept_and_is_retried(self):
+        self._write(b"S\xe3o Paulo,25,70,2024-01-01 10:00:00\n")
+        mtime = os.path.getmtime(self.path)
+        store = TeamDataStore(self.path)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(store.cities(), [])
+
+        # Same mtime: a committed partial read would never be replaced
+        self._write("São Paulo,25,70,2024-01-01 10:00:00\n".encode("utf-8"))
+        os.utime(self.path, (mtime, mtime))
+        cities = store.cities()
+        self.assertEqual(len(cities), 2001)
+        self.assertIn("São Paulo", cities)
+        self.assertEqual(store.latest("são paulo")["temperature"], 25)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Tests for features.timestamps.
+
+Run from the project root with: python -m unittest discover -s tests -t .
+"""
+import importlib.util
+import unittest
+from datetime import datetime
+from unittest import mock
+
+from features import timestamps
+from features.timestamps import TimestampParser
+
+HAS_PANDAS = importlib.util.find_spec("pandas") is not None
+
+TZ_AWARE_VALUES = [
+    "2024-03-01T12:00:00+02:00",
+    "2024-03-01T09:30:00-05:00",
+    "2024-03-01 08:00:00",
+    "2024-03-01T11:00:00Z",
+]
+
+# Aware values in UTC, naive values unchanged
+EXPECTED_UTC = [
+    datetime(2024, 3, 1, 10, 0),
+    datetime(2024, 3, 1, 14, 30),
+    datetime(2024, 3, 1, 8, 0),
+    datetime(2024, 3, 1, 11, 0),
+]
+
+
+class TimestampParserTests(unittest.TestCase):
+    def test_per_value_path_normalizes_aware_values_to_utc(self):
+        parsed = TimestampParser().parse_many(TZ_AWARE_VALUES)
+        self.assertEqual(parsed, EXPECTED_UTC)
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_bulk_path_matches_per_value_path(self):
+        with mock.patch.object(timestamps, "BULK_PARSE_THRESHOLD", 1):
+            bulk = TimestampParser().parse_many(TZ_AWARE_VALUES)
+        single = [TimestampParser().parse(value) for value in TZ_AWARE_VALUES]
+        self.assertEqual(bulk, single)
+        self.assertEqual(bulk, EXPECTED_UTC)
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_bulk_path_handles_unparseable_and_non_iso_values(self):
+        values = ["2024-03-01T12:00:00+02:00", "not a date", "", "2024-03-01 07:15"]
+        with mock.patch.object(timestamps, "BULK_PARSE_THRESHOLD", 1):
+            parsed = TimestampParser().parse_many(values)
+        self.assertEqual(parsed, [datetime(2024, 3, 1, 10, 0), None, None, datetime(2024, 3, 1, 7, 15)])
+
+    def test_bulk_failure_falls_back_to_per_value_path(self):
+        parser = TimestampParser()
+        with mock.patch.object(timestamps, "BULK_PARSE_THRESHOLD", 1), \
+                mock.patch.object(TimestampParser, "_parse_with_pandas", return_value=None):
+            self.assertEqual(parser.parse_many(TZ_AWARE_VALUES), EXPECTED_UTC)
+
+    @unittest.skipUnless(HAS_PANDAS, "pandas is not installed")
+    def test_missing_dt_accessor_falls_back(self):
+        import pandas as pd
+
+        # Simulate pandas returning an object column without a .dt accessor
+        with mock.patch.object(timestamps, "BULK_PARSE_THRESHOLD", 1), \
+                mock.patch.object(pd, "to_datetime", return_value=pd.Series(TZ_AWARE_VALUES, dtype="object")):
+            parsed = TimestampParser().parse_many(TZ_AWARE_VALUES)
+        self.assertEqual(parsed, EXPECTED_UTC)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,47 @@
+"""
+Tests for the download times kept by services.cache.WeatherCache.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime, timedelta
+
+from services.cache import WeatherCache
+from services.disk_cache import DiskCache
+
+WEATHER = {"city": "Paris", "country": "FR", "temperature": 12.5}
+
+
+class CacheEntryTimeTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.disk = DiskCache(os.path.join(self.directory, "cache.sqlite3"))
+
+    def tearDown(self):
+        self.disk.close()
+        shutil.rmtree(self.directory)
+
+    def test_disk_entry_keeps_its_download_time(self):
+        fetched_at = datetime.now() - timedelta(minutes=5)
+        self.disk.set("weather", "Paris", WEATHER, stored_at=fetched_at)
+        cache = WeatherCache(ttl_minutes=10, persistent=self.disk)
+
+        self.assertEqual(cache.get_entry("paris", "weather"), (WEATHER, fetched_at))
+        # Promoted into memory with the same time
+        self.assertEqual(cache.get_entry("Paris", "weather"), (WEATHER, fetched_at))
+
+    def test_set_returns_the_stored_time(self):
+        cache = WeatherCache(ttl_minutes=10)
+        fetched_at = cache.set("Paris", WEATHER, "weather")
+        self.assertEqual(cache.get_entry("Paris", "weather"), (WEATHER, fetched_at))
+
+    def test_expired_entry_is_a_miss(self):
+        self.disk.set("weather", "Paris", WEATHER, stored_at=datetime.now() - timedelta(minutes=30))
+        cache = WeatherCache(ttl_minutes=10, persistent=self.disk)
+        self.assertIsNone(cache.get_entry("Paris", "weather"))
+        self.assertIsNone(cache.get("Paris", "weather"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Deferred imports for the heavy plotting and data stacks.
+
+matplotlib, seaborn, pandas and numpy together take longer to import than
+the rest of the app to build its first window, so modules bind them with
+lazy_import and the real import happens on first attribute access.
+"""
+import importlib
+import importlib.util
+import threading
+from types import ModuleType
+from typing import Optional
+
+
+class LazyModule(ModuleType):
+    """Module placeholder that imports the real module on first attribute access."""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self.__dict__["_lazy_module"] = None
+        self.__dict__["_lazy_lock"] = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        module = self.__dict__["_lazy_module"]
+        if module is None:
+            with self.__dict__["_lazy_lock"]:
+                module = self.__dict__["_lazy_module"]
+                if module is None:
+                    module = importlib.import_module(self.__name__)
+                    self.__dict__["_lazy_module"] = module
+        return module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__dict__["_lazy_module"] is not None
+
+
+def lazy_import(name: str) -> LazyModule:
+    """
+    Return a placeholder for module `name` without importing it.
+
+    Args:
+        name: Dotted module name, e.g. "matplotlib.pyplot"
+
+    Returns:
+        LazyModule: Behaves like the module once an attribute is accessed
+    """
+    return LazyModule(name)
+
+
+def is_available(name: str) -> bool:
+    """Check that a module can be imported, without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+def missing_modules(*names: str) -> Optional[str]:
+    """Return the first module in `names` that is not installed, or None"""
+    for name in names:
+        if not is_available(name):
+            return name
+    return None
@@ -0,0 +1,110 @@
+"""
+Run blocking work off the Tk main thread and deliver results back to it.
+"""
+import queue
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+
+class TkTaskRunner:
+    """
+    Thread pool whose results are handed back to Tk through root.after.
+
+    Tk widgets may only be touched from the main thread, so worker threads
+    put finished results on a queue and a short root.after poll loop runs
+    the success/error callbacks on the main thread.
+    """
+
+    def __init__(self, root, max_workers: int = 4, poll_ms: int = 50):
+        """
+        Args:
+            root: Tk root window used for scheduling callbacks
+            max_workers: Number of worker threads
+            poll_ms: How often to check for finished tasks while any are pending
+        """
+        self._root = root
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="vibecast")
+        self._results: "queue.Queue" = queue.Queue()
+        self._poll_ms = poll_ms
+        self._pending = 0
+        self._polling = False
+        self._closed = False
+        # Futures not yet finished, so shutdown can cancel the queued ones
+        self._futures = set()
+        self._futures_lock = threading.Lock()
+
+    def submit(self, fn: Callable, *args,
+               on_success: Optional[Callable[[Any], None]] = None,
+               on_error: Optional[Callable[[Exception], None]] = None,
+               **kwargs) -> Optional[Future]:
+        """
+        Run fn(*args, **kwargs) on a worker thread.
+
+        Args:
+            fn: Blocking function to run
+            on_success: Called on the Tk thread with the function's return value
+            on_error: Called on the Tk thread with the raised exception
+
+        Returns:
+            The underlying Future, or None if the runner is shut down
+        """
+        if self._closed:
+            return None
+
+        def done(future: Future) -> None:
+            with self._futures_lock:
+                self._futures.discard(future)
+            self._results.put((future, on_success, on_error))
+
+        future = self._executor.submit(fn, *args, **kwargs)
+        self._pending += 1
+        with self._futures_lock:
+            self._futures.add(future)
+        future.add_done_callback(done)
+        self._schedule_poll()
+        return future
+
+    def _schedule_poll(self) -> None:
+        if not self._polling and not self._closed:
+            self._polling = True
+            self._root.after(self._poll_ms, self._poll)
+
+    def _poll(self) -> None:
+        """Drain finished tasks and run their callbacks on the Tk thread."""
+        self._polling = False
+        if self._closed:
+            return
+
+        while True:
+            try:
+                future, on_success, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            try:
+                error = future.exception()
+                if error is None:
+                    if on_success:
+                        on_success(future.result())
+                elif on_error:
+                    on_error(error)
+                else:
+                    print(f"Background task failed: {error}")
+            except Exception as e:
+                print(f"Error in background task callback: {e}")
+
+        if self._pending > 0:
+            self._schedule_poll()
+
+    def shutdown(self) -> None:
+        """Stop delivering results and let running tasks finish in the background."""
+        self._closed = True
+        # Cancel tasks that have not started yet; executor.shutdown's
+        # cancel_futures argument does the same but needs Python 3.9+
+        with self._futures_lock:
+            pending = list(self._futures)
+        for future in pending:
+            future.cancel()
+        self._executor.shutdown(wait=False)